@@ -1,5 +1,7 @@
 import os
+import time
 import argparse
+import contextlib
 from dotenv import load_dotenv
 from src.infrastructure.logging import StandardLogger
 from src.infrastructure.serialization import JsonTranscriptSerializer
@@ -8,6 +10,8 @@ from src.application.pipeline import AudioProcessingPipeline
 from src.infrastructure.bus import InProcessEventBus
 from src.infrastructure.event_handlers import LoggingEventHandler
 from src.infrastructure.factory import PipelineComponentFactory
+from src.infrastructure.worker_pool import PreforkWorkerPool
+from src.infrastructure.profiling import ResourceStepProfiler
 from src.domain.entities import JobStatus
 from src.domain.value_objects import LanguageTag
 import logging
@@ -17,7 +21,7 @@ def main():
     load_dotenv()
 
     parser = argparse.ArgumentParser(description="Audio Pipeline CLI 🎙️✨")
-    parser.add_argument("input", help="Path to the source audio file")
+    parser.add_argument("input", nargs="+", help="Path to the source audio file(s)")
     parser.add_argument(
         "--output-dir", default="./output", help="Directory for results and temp files"
     )
@@ -60,6 +64,140 @@ def main():
         default=1,
         help="Number of utterances to annotate in a single block",
     )
+    parser.add_argument(
+        "--columnar-words",
+        action="store_true",
+        help="Keep Whisper tokens in a compact array-backed word store (local mode) 🗄️",
+    )
+    parser.add_argument(
+        "--fused-merge",
+        action="store_true",
+        help="Segment sentences and merge Whisper sub-word tokens in one pass (local mode) ✂️🧩",
+    )
+    parser.add_argument(
+        "--audio-cache-dir",
+        help="Directory of normalized WAVs keyed by source content hash; re-runs skip FFmpeg 🗄️",
+    )
+    parser.add_argument(
+        "--in-memory-audio",
+        action="store_true",
+        help="Memory-map the normalized PCM once and feed it to Pyannote directly (local mode) 🗺️",
+    )
+    parser.add_argument(
+        "--vad",
+        action="store_true",
+        help="Trim silence with an energy VAD before transcription & diarization 🔇",
+    )
+    parser.add_argument(
+        "--diarization-window",
+        type=float,
+        help="Diarize in windows of this many seconds and cluster speakers globally; bounds memory on multi-hour files (local mode) 🪟",
+    )
+    parser.add_argument(
+        "--diarization-segmentation-batch",
+        type=int,
+        help="Pyannote segmentation batch size (local mode) 🎛️",
+    )
+    parser.add_argument(
+        "--diarization-embedding-batch",
+        type=int,
+        help="Pyannote speaker-embedding batch size (local mode) 🎛️",
+    )
+    parser.add_argument(
+        "--quantize-diarization",
+        action="store_true",
+        help="Dynamically quantize the speaker-embedding model to int8 on CPU (local mode) 🗜️",
+    )
+    parser.add_argument(
+        "--speaker-index",
+        help="An .npz of enrolled voices (tools/speaker_index.py); known hosts get their names instead of SPEAKER_xx (local mode) 🗂️",
+    )
+    parser.add_argument(
+        "--whisper-threads",
+        type=int,
+        help="Total CPU threads for Whisper, divided among --whisper-workers (default: the CPU budget)",
+    )
+    parser.add_argument(
+        "--whisper-server",
+        action="store_true",
+        help="Keep a supervised whisper.cpp server running so the model loads once (local mode) 🖥️",
+    )
+    parser.add_argument(
+        "--whisper-workers",
+        type=int,
+        default=1,
+        help="Parallel whisper-cli processes over silence-aligned chunks (local mode) 🧩",
+    )
+    parser.add_argument(
+        "--chunk-seconds",
+        type=float,
+        default=300.0,
+        help="Target chunk length when --whisper-workers or --azure-workers > 1",
+    )
+    parser.add_argument(
+        "--cpu-threads",
+        type=int,
+        help="CPU threads this machine may use in total (default: all cores) 🧮",
+    )
+    parser.add_argument(
+        "--parallel-jobs",
+        type=int,
+        default=1,
+        help="Pipeline jobs sharing the machine; each gets an equal slice of --cpu-threads",
+    )
+    parser.add_argument(
+        "--azure-upload-codec",
+        choices=["flac", "opus", "wav"],
+        default="flac",
+        help="Codec the audio is uploaded in (Azure mode): flac is lossless, opus is smallest 🗜️",
+    )
+    parser.add_argument(
+        "--azure-workers",
+        type=int,
+        default=1,
+        help="Concurrent Fast Transcription requests over overlapping chunks (Azure mode) ☁️🧩",
+    )
+    parser.add_argument(
+        "--previous-transcript",
+        help="A transcript.json from an earlier run; only changed utterances are re-translated/re-annotated ♻️",
+    )
+    parser.add_argument(
+        "--prefork-workers",
+        type=int,
+        default=0,
+        help="Load models once, then fork this many workers that share them copy-on-write 🍴",
+    )
+    parser.add_argument(
+        "--worker-max-jobs",
+        type=int,
+        help="Recycle a prefork worker after this many files (bounds leaks/fragmentation) ♻️",
+    )
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument(
+        "--record",
+        metavar="CASSETTE",
+        help="Record every external call (FFmpeg, Whisper, llama.cpp, Pyannote, Azure) into this JSON cassette 📼",
+    )
+    cassette.add_argument(
+        "--replay",
+        metavar="CASSETTE",
+        help="Answer every external call from a recorded cassette - no binaries, models or credentials needed 🔁",
+    )
+    parser.add_argument(
+        "--replay-latency",
+        action="store_true",
+        help="With --replay, wait as long as each recorded call took ⏱️",
+    )
+    parser.add_argument(
+        "--profile-steps",
+        action="store_true",
+        help="Log CPU (incl. subprocesses), peak RSS and a cpu/memory/wait verdict per step 🔬",
+    )
+    parser.add_argument(
+        "--profile-python-memory",
+        action="store_true",
+        help="Also trace each step's peak of Python allocations (implies --profile-steps; slower) 🐍",
+    )
     parser.add_argument(
         "--use-azure",
         action="store_true",
@@ -67,6 +205,12 @@ def main():
     )
 
     args = parser.parse_args()
+    if args.record and args.prefork_workers > 1:
+        parser.error("--record cannot collect calls made in forked workers")
+    if args.replay and args.whisper_server:
+        parser.error(
+            "--replay cannot stand in for the whisper-server process; use whisper-cli"
+        )
 
     # Ensure output directories exist
     os.makedirs(args.output_dir, exist_ok=True)
@@ -83,6 +227,10 @@ def main():
     event_bus = InProcessEventBus()
     LoggingEventHandler(logger=logger, bus=event_bus)
 
+    if args.prefork_workers > 1:
+        # Forked workers run side by side: split the CPU budget between them 🧮
+        args.parallel_jobs = max(args.parallel_jobs, args.prefork_workers)
+
     # 🏗️ Build Components using Factory
     factory = PipelineComponentFactory(args, logger)
     (
@@ -104,20 +252,60 @@ def main():
         event_bus=event_bus,
         logger=logger,
         enrichers=enrichers,
+        vad=factory.build_vad(),
+        profiler=(
+            ResourceStepProfiler(trace_python_memory=args.profile_python_memory)
+            if args.profile_steps or args.profile_python_memory
+            else None
+        ),
     )
 
-    # 3. Execute
-    job = pipeline.execute(
-        source_path=args.input,
-        language=args.language,
-    )
+    def run_job(source_path: str) -> bool:
+        job = pipeline.execute(
+            source_path=source_path,
+            language=args.language,
+        )
+        if job.status == JobStatus.FAILED:
+            logger.error(f"❌ Job failed! {job.error_message}")
+            return False
 
-    if job.status == JobStatus.FAILED:
-        logger.error(f"❌ Job failed! {job.error_message}")
-    else:
-        output_path = os.path.join(args.output_dir, "transcript.json")
+        # One input keeps the classic name; batches get one file per source 📂
+        name = "transcript.json"
+        if len(args.input) > 1:
+            name = (
+                os.path.splitext(os.path.basename(source_path))[0] + ".transcript.json"
+            )
+        output_path = os.path.join(args.output_dir, name)
         result_repo.save(job.result, output_path)
         logger.info(f"💾 Results saved to {output_path}! 💎")
+        return True
+
+    # 3. Execute
+    wall_start, cpu_start = time.perf_counter(), os.times()
+    # 📼 With --record/--replay, every external call goes through the cassette
+    with factory.cassette or contextlib.nullcontext():
+        if args.prefork_workers > 1:
+            components = [audio_processor, transcriber, diarizer, *enrichers]
+            with PreforkWorkerPool(
+                run_job,
+                workers=args.prefork_workers,
+                max_jobs_per_worker=args.worker_max_jobs,
+                # e.g. a worker's own whisper.cpp server goes down with it 🧹
+                on_worker_exit=lambda: [
+                    c.close() for c in components if hasattr(c, "close")
+                ],
+                logger=logger,
+            ) as pool:
+                pool.map(args.input)
+                pool.log_memory()
+        else:
+            for source_path in args.input:
+                run_job(source_path)
+    cpu_end = os.times()
+    factory.cpu_budget.report(
+        wall_seconds=time.perf_counter() - wall_start,
+        cpu_seconds=sum(cpu_end[:4]) - sum(cpu_start[:4]),  # incl. child processes
+    )
 
 
 if __name__ == "__main__":
@@ -1,5 +1,13 @@
 from .segmentation import SentenceSegmentationEnricher
 from .merging import TokenMergerEnricher
+from .fused import MergingSegmentationEnricher
 from .translation import TranslationEnricher
+from .incremental import IncrementalEnricher
 
-__all__ = ["SentenceSegmentationEnricher", "TokenMergerEnricher", "TranslationEnricher"]
+__all__ = [
+    "SentenceSegmentationEnricher",
+    "TokenMergerEnricher",
+    "MergingSegmentationEnricher",
+    "TranslationEnricher",
+    "IncrementalEnricher",
+]
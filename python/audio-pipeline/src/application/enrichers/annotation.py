@@ -1,15 +1,20 @@
-import dataclasses
-from typing import List
-from src.domain.interfaces import IAudioEnricher, ILinguisticAnnotationService, ILogger
+from typing import Iterable, List, Set, Tuple
+from src.domain.interfaces import IContextualEnricher, ILinguisticAnnotationService, ILogger
 from src.infrastructure.logging import NullLogger
 from src.domain.value_objects import Utterance, LanguageTag
+from src.application.enrichers.incremental import window_fingerprint
 
-class LinguisticAnnotationEnricher(IAudioEnricher):
+UNAVAILABLE_NOTE = "[Annotation Service Unavailable ⚠️]"
+
+class LinguisticAnnotationEnricher(IContextualEnricher):
     """
     Orchestrates linguistic annotation for utterances to provide 
     pedagogical feedback to language learners. 🎓💎✨
     """
 
+    output_field = "learner_notes"
+    failure_values = (UNAVAILABLE_NOTE,)
+
     def __init__(
         self,
         annotation_service: ILinguisticAnnotationService,
@@ -26,26 +31,59 @@ class LinguisticAnnotationEnricher(IAudioEnricher):
         self, utterances: List[Utterance], language: LanguageTag
     ) -> List[Utterance]:
         self.logger.info(f"🎓 Annotating {len(utterances)} utterances for learners (context_size={self.context_size})...")
-        
+        return self._annotate_batches(utterances, language, range(0, len(utterances), self.batch_size))
+
+    def enrich_selected(
+        self, utterances: List[Utterance], language: LanguageTag, indices: Set[int]
+    ) -> List[Utterance]:
+        self.logger.info(f"🎓 Re-annotating {len(indices)} changed utterances for learners...")
+        batch_starts = sorted({i - i % self.batch_size for i in indices})
+        return self._annotate_batches(utterances, language, batch_starts)
+
+    def input_fingerprint(
+        self, utterances: List[Utterance], index: int, language: LanguageTag
+    ) -> str:
+        """The exact request of index's batch, and index's place in it. 🧬🏔️"""
+        batch_start = index - index % self.batch_size
+        texts, context = self._batch_payload(utterances, batch_start)
+        return window_fingerprint(
+            [language, "--- BATCH ---"]
+            + texts
+            + ["--- CONTEXT ---"]
+            + context
+            + ["--- POSITION ---", str(index - batch_start)]
+        )
+
+    def _batch_payload(
+        self, utterances: List[Utterance], batch_start: int
+    ) -> Tuple[List[str], List[str]]:
+        """The texts and panoramic context sent for the batch at batch_start. 📦🏔️"""
+        batch_end = batch_start + self.batch_size
+        pre_start = max(0, batch_start - self.context_size)
+        post_end = min(len(utterances), batch_end + self.context_size)
+        pre_context = [u.text for u in utterances[pre_start:batch_start]]
+        post_context = [u.text for u in utterances[batch_end:post_end]]
+        return (
+            [u.text for u in utterances[batch_start:batch_end]],
+            pre_context + ["--- TARGET SEGMENT(S) BELOW ---"] + post_context,
+        )
+
+    def _annotate_batches(
+        self, utterances: List[Utterance], language: LanguageTag, batch_starts: Iterable[int]
+    ) -> List[Utterance]:
         enriched_utterances = list(utterances)
         
-        for i in range(0, len(utterances), self.batch_size):
+        for i in batch_starts:
             batch_slice = utterances[i : i + self.batch_size]
-            batch_texts = [u.text for u in batch_slice]
-            
             # 📜 Panoramic Context Construction 🏔️
-            pre_start = max(0, i - self.context_size)
-            pre_context = [u.text for u in utterances[pre_start:i]]
-            
-            post_end = min(len(utterances), i + self.batch_size + self.context_size)
-            post_context = [u.text for u in utterances[i + self.batch_size : post_end]]
+            batch_texts, context = self._batch_payload(utterances, i)
             
             try:
                 # Call the decoupled annotation service 📡✨
                 annotations = self.annotation_service.annotate(
                     texts=batch_texts,
                     language=language,
-                    context=pre_context + ["--- TARGET SEGMENT(S) BELOW ---"] + post_context
+                    context=context,
                 )
                 
                 # 🛡️ Contract Validation: Ensure we got exactly what we asked for!
@@ -54,8 +92,7 @@ class LinguisticAnnotationEnricher(IAudioEnricher):
 
                 # Map annotations back to utterances with surgical precision 🎯
                 for j, annotation in enumerate(annotations):
-                    enriched_utterances[i + j] = dataclasses.replace(
-                        enriched_utterances[i + j],
+                    enriched_utterances[i + j] = enriched_utterances[i + j].evolve(
                         learner_notes=annotation
                     )
                         
@@ -63,9 +100,8 @@ class LinguisticAnnotationEnricher(IAudioEnricher):
                 self.logger.error(f"❌ Annotation failed for batch starting at {i}: {e}")
                 # 🚩 Resilience Sentinel: Mark the batch as 'Unverified'
                 for j in range(len(batch_slice)):
-                    enriched_utterances[i + j] = dataclasses.replace(
-                        enriched_utterances[i + j],
-                        learner_notes="[Annotation Service Unavailable ⚠️]"
+                    enriched_utterances[i + j] = enriched_utterances[i + j].evolve(
+                        learner_notes=UNAVAILABLE_NOTE
                     )
 
         return enriched_utterances
@@ -0,0 +1,97 @@
+import hashlib
+from typing import Dict, Iterable, List, Optional
+from src.domain.interfaces import IAudioEnricher, IContextualEnricher, ILogger
+from src.infrastructure.logging import NullLogger
+from src.domain.value_objects import Utterance, LanguageTag
+
+
+def window_fingerprint(parts: Iterable[Optional[str]]) -> str:
+    """Digests an ordered list of texts into a compact, collision-safe key. 🧬"""
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update((part or "").encode("utf-8"))
+        digest.update(b"\x1f")  # Unit separator keeps ['ab', 'c'] != ['a', 'bc'] ✂️
+    return digest.hexdigest()
+
+
+class IncrementalEnricher(IAudioEnricher):
+    """
+    Re-runs a contextual enricher only for utterances whose inputs changed
+    since a previously saved transcript. ♻️💎
+    Everything else carries its old result over untouched - no LLM call needed!
+    """
+
+    def __init__(
+        self,
+        inner: IContextualEnricher,
+        previous_utterances: List[Utterance],
+        logger: ILogger = NullLogger(),
+        previous_language: Optional[LanguageTag] = None,
+        previous_output_language: Optional[LanguageTag] = None,
+    ):
+        self.inner = inner
+        self.previous_utterances = previous_utterances
+        # Transcripts saved before the languages were recorded get the benefit of the doubt
+        self.previous_language = previous_language
+        self.previous_output_language = previous_output_language
+        self.logger = logger
+
+    @property
+    def output_language(self) -> Optional[LanguageTag]:
+        return self.inner.output_language
+
+    def enrich(
+        self, utterances: List[Utterance], language: LanguageTag
+    ) -> List[Utterance]:
+        if self._output_language_changed():
+            self.logger.info(
+                f"♻️ {self.inner.__class__.__name__}: previous results are in "
+                f"{self.previous_output_language}, not {self.inner.output_language} - "
+                f"re-processing all {len(utterances)} utterances."
+            )
+            return self.inner.enrich(utterances, language)
+
+        field_name = self.inner.output_field
+        known_results = self._index_previous_results(self.previous_language or language)
+
+        carried = list(utterances)
+        changed = set()
+        for i, u in enumerate(utterances):
+            fingerprint = self.inner.input_fingerprint(utterances, i, language)
+            if fingerprint in known_results:
+                carried[i] = u.evolve(**{field_name: known_results[fingerprint]})
+            else:
+                changed.add(i)
+
+        self.logger.info(
+            f"♻️ {self.inner.__class__.__name__}: reusing {len(utterances) - len(changed)} "
+            f"previous results, re-processing {len(changed)} changed utterances."
+        )
+
+        if not changed:
+            return carried
+        return self.inner.enrich_selected(carried, language, changed)
+
+    def _output_language_changed(self) -> bool:
+        """An English translation is no reuse for a French one, however equal the input. 🌍"""
+        return bool(
+            self.previous_output_language
+            and self.inner.output_language
+            and self.previous_output_language != self.inner.output_language
+        )
+
+    def _index_previous_results(
+        self, language: LanguageTag
+    ) -> Dict[str, Optional[str]]:
+        """Maps each previous input fingerprint to the result it produced. 🗂️"""
+        field_name = self.inner.output_field
+        results = {}
+        for i, u in enumerate(self.previous_utterances):
+            value = getattr(u, field_name)
+            if value in self.inner.failure_values:
+                continue  # Failed last time? Then it deserves another try! 🔄
+            fingerprint = self.inner.input_fingerprint(
+                self.previous_utterances, i, language
+            )
+            results[fingerprint] = value
+        return results
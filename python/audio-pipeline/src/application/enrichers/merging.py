@@ -1,5 +1,4 @@
-import dataclasses
-from typing import List
+from typing import List, Optional, Sequence
 from src.domain.interfaces import IAudioEnricher
 from src.domain.value_objects import (
     Utterance,
@@ -8,6 +7,7 @@ from src.domain.value_objects import (
     TimestampRange,
     ConfidenceScore,
 )
+from src.domain.word_store import WordStore, WordView
 
 
 class TokenMergerEnricher(IAudioEnricher):
@@ -20,35 +20,100 @@ class TokenMergerEnricher(IAudioEnricher):
         self, utterances: List[Utterance], language: LanguageTag
     ) -> List[Utterance]:
         enriched = []
+        merged_store = None
         for u in utterances:
             if not u.words:
                 enriched.append(u)
                 continue
 
-            merged_words = []
-            for token in u.words:
-                if merged_words and not token.text.startswith(" "):
-                    last_w = merged_words[-1]
-                    new_text = last_w.text + token.text.strip()
-                    new_end = token.timestamp.end
-                    new_conf = (float(last_w.confidence) + float(token.confidence)) / 2
-
-                    merged_words[-1] = Word(
-                        text=new_text,
-                        timestamp=TimestampRange(last_w.timestamp.start, new_end),
-                        confidence=ConfidenceScore(new_conf),
-                    )
-                else:
-                    merged_words.append(
-                        Word(
-                            text=token.text.strip(),
-                            timestamp=token.timestamp,
-                            confidence=token.confidence,
-                        )
-                    )
-
-            new_text = " ".join([w.text for w in merged_words])
-            new_u = dataclasses.replace(u, words=merged_words, text=new_text)
-            enriched.append(new_u)
+            if isinstance(u.words, WordView):
+                merged_store = merged_store or WordStore()
+            merged_words = self.merge_tokens(u.words, merged_store)
+            if isinstance(merged_words, WordView):
+                new_text = " ".join(merged_words.texts())
+            else:
+                new_text = " ".join([w.text for w in merged_words])
+            enriched.append(self._with_merged_words(u, merged_words, new_text))
 
         return enriched
+
+    def merge_tokens(
+        self, tokens: Sequence[Word], store: Optional[WordStore] = None
+    ) -> Sequence[Word]:
+        """
+        Merges one row's tokens into words. Columnar tokens merge
+        column-to-column into 'store', no Word churn; Word objects stay objects. 🗄️🏎️
+        """
+        if isinstance(tokens, WordView):
+            return self._merge_columnar(tokens, store)
+        return self._merge_objects(tokens)
+
+    def _with_merged_words(self, u: Utterance, words, text: str) -> Utterance:
+        """
+        Every merged word spans from a token start to a later token end, so it
+        inherits the tokens' containment - no need to re-validate the range. 🧩🏎️
+        """
+        return Utterance.trusted(
+            timestamp=u.timestamp,
+            text=text,
+            speaker_id=u.speaker_id,
+            confidence=u.confidence,
+            words=words,
+            translated_text=u.translated_text,
+            learner_notes=u.learner_notes,
+        )
+
+    def _merge_objects(self, tokens: Sequence[Word]) -> List[Word]:
+        """
+        Glues tokens without a leading space onto the previous word. Each word is
+        built ONCE when it closes - no throwaway Word per merge step! 🧩🏎️
+        """
+        merged = []
+        first, text, end, conf, grown = None, "", None, 0.0, False
+        for token in tokens:
+            if first is not None and not token.text.startswith(" "):
+                text += token.text.strip()
+                end = token.timestamp.end
+                conf = (conf + float(token.confidence)) / 2
+                grown = True
+            else:
+                if first is not None:
+                    merged.append(self._close_word(first, text, end, conf, grown))
+                first, text, grown = token, token.text.strip(), False
+                end, conf = token.timestamp.end, float(token.confidence)
+
+        if first is not None:
+            merged.append(self._close_word(first, text, end, conf, grown))
+        return merged
+
+    def _close_word(
+        self, first: Word, text: str, end, conf: float, grown: bool
+    ) -> Word:
+        if not grown:
+            # A lone token keeps its own range and score untouched 🧼
+            return Word(
+                text=text, timestamp=first.timestamp, confidence=first.confidence
+            )
+        return Word(
+            text=text,
+            timestamp=TimestampRange(first.timestamp.start, end),
+            confidence=ConfidenceScore(conf),
+        )
+
+    def _merge_columnar(self, tokens: WordView, store: WordStore) -> WordView:
+        """Same merge rules as above, reading rows and appending to 'store'. 🧩"""
+        begin = len(store)
+        text, start, end, conf = None, 0, 0, 0.0
+        for t_text, t_start, t_end, t_conf in tokens.rows():
+            if text is not None and not t_text.startswith(" "):
+                text += t_text.strip()
+                end = t_end
+                conf = (conf + t_conf) / 2
+            else:
+                if text is not None:
+                    store.append(text, start, end, conf)
+                text, start, end, conf = t_text.strip(), t_start, t_end, t_conf
+
+        if text is not None:
+            store.append(text, start, end, conf)
+        return store.view(begin, len(store))
@@ -1,6 +1,6 @@
 import re
 import dataclasses
-from typing import List
+from typing import List, Sequence, Tuple
 from src.domain.interfaces import IAudioEnricher, ILogger
 from src.infrastructure.logging import NullLogger
 from src.domain.value_objects import (
@@ -10,6 +10,7 @@ from src.domain.value_objects import (
     Word,
     ConfidenceScore,
 )
+from src.domain.word_store import WordView
 
 
 class SentenceSegmentationEnricher(IAudioEnricher):
@@ -31,57 +32,94 @@ class SentenceSegmentationEnricher(IAudioEnricher):
     ) -> List[Utterance]:
         final_utterances = []
         for u in utterances:
-            # Recursively split long utterances! 🔄✂️
+            # Split long utterances in a single left-to-right pass! ✂️🏎️
             final_utterances.extend(self._split_if_needed(u))
         return final_utterances
 
     def _split_if_needed(self, u: Utterance) -> List[Utterance]:
-        """Simplified recursive splitting logic. 🧼💎"""
+        """
+        Cuts at the FIRST terminal punctuation of whatever is left, for as long as
+        the remainder is still too long. One pass over the words, no recursion! 🧼💎
+        """
         if not u.words:
             return [u]
 
-        # Always ensure tight bounding first 📏🎯
-        u = dataclasses.replace(
-            u,
-            timestamp=TimestampRange(
-                start=u.words[0].timestamp.start, end=u.words[-1].timestamp.end
-            ),
-        )
+        words = u.words
+        spans = self._plan_spans(u)
+
+        if len(spans) == 1:
+            # Always ensure tight bounding 📏🎯
+            return [
+                dataclasses.replace(
+                    u,
+                    timestamp=TimestampRange(
+                        start=words[0].timestamp.start, end=words[-1].timestamp.end
+                    ),
+                )
+            ]
+
+        return [
+            self._create_utterance_from_words(words[start:stop], u.speaker_id)
+            for start, stop in spans
+        ]
 
-        duration = (u.timestamp.end - u.timestamp.start).total_seconds()
+    def _plan_spans(self, u: Utterance) -> List[Tuple[int, int]]:
+        """
+        Decides WHERE to cut without building anything: returns the [start, stop)
+        word ranges of the resulting rows and warns about rows that stay too long. 🗺️✂️
+        """
+        words = u.words
+        count = len(words)
 
         # Base Case 1: Within threshold
-        if duration <= self.max_duration_seconds:
-            return [u]
+        if self._span_seconds(words, 0, count) <= self.max_duration_seconds:
+            return [(0, count)]
 
-        # Find potential split points (indices of terminal punctuation)
-        split_indices = [
-            i
-            for i, w in enumerate(u.words)
-            if self.sentence_end_regex.match(w.text.strip())
-        ]
-
-        # Filter out split points that are at the very end (can't split there!)
-        valid_splits = [idx for idx in split_indices if idx < len(u.words) - 1]
+        split_indices = self._split_indices(words)
 
         # Base Case 2: No terminal punctuation to split at
-        if not valid_splits:
-            self.logger.warning(
-                f"Utterance too long ({duration:.2f}s) but no terminal punctuation found to split at: '{u.text[:50]}...'"
-            )
-            return [u]
-
-        # Logic: Split at the FIRST terminal punctuation mark
-        split_idx = valid_splits[0]
-
-        part1_words = u.words[: split_idx + 1]
-        part2_words = u.words[split_idx + 1 :]
+        if not split_indices:
+            self._warn_unsplittable(u.text, self._span_seconds(words, 0, count))
+            return [(0, count)]
+
+        spans = []
+        start = 0
+        for split_idx in split_indices:
+            spans.append((start, split_idx + 1))
+            start = split_idx + 1
+            if self._span_seconds(words, start, count) <= self.max_duration_seconds:
+                break
+        spans.append((start, count))
+
+        # A head holds exactly one sentence, so it can't be split further 🛑
+        for start, stop in spans:
+            seconds = self._span_seconds(words, start, stop)
+            if seconds > self.max_duration_seconds:
+                text = "".join(w.text for w in words[start:stop]).strip()
+                self._warn_unsplittable(text, seconds)
+
+        return spans
+
+    def _split_indices(self, words: Sequence[Word]) -> List[int]:
+        """Indices of terminal punctuation, excluding the very end (can't split there!)."""
+        texts = (
+            words.texts() if isinstance(words, WordView) else [w.text for w in words]
+        )
+        return [
+            i
+            for i, text in enumerate(texts[:-1])
+            if self.sentence_end_regex.match(text.strip())
+        ]
 
-        part1 = self._create_utterance_from_words(part1_words, u.speaker_id)
-        part2 = self._create_utterance_from_words(part2_words, u.speaker_id)
+    def _span_seconds(self, words: Sequence[Word], start: int, stop: int) -> float:
+        return (
+            words[stop - 1].timestamp.end - words[start].timestamp.start
+        ).total_seconds()
 
-        # Recurse! 🔄
-        return self._split_if_needed(part1) + self._split_if_needed(part2)
+    def _warn_unsplittable(self, text: str, seconds: float):
+        self.logger.warning(
+            f"Utterance too long ({seconds:.2f}s) but no terminal punctuation found to split at: '{text[:50]}...'"
+        )
 
     def _create_utterance_from_words(
         self, words: List[Word], speaker_id: str
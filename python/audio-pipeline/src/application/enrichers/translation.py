@@ -1,16 +1,19 @@
-import dataclasses
-from typing import List
-from src.domain.interfaces import IAudioEnricher, ITranslator, ILogger
+from typing import Iterable, List, Set, Tuple
+from src.domain.interfaces import IContextualEnricher, ITranslator, ILogger
 from src.infrastructure.logging import NullLogger
 from src.domain.value_objects import Utterance, LanguageTag
+from src.application.enrichers.incremental import window_fingerprint
 
 
-class TranslationEnricher(IAudioEnricher):
+class TranslationEnricher(IContextualEnricher):
     """
     Orchestrates translation of utterances using an injected ITranslator implementation.
     Manages sliding window context for improved translation accuracy. 🌍💎⚖️
     """
 
+    output_field = "translated_text"
+    failure_values = (None, "")
+
     def __init__(
         self,
         translator: ITranslator,
@@ -25,22 +28,65 @@ class TranslationEnricher(IAudioEnricher):
         self.context_size = context_size
         self.logger = logger
 
+    @property
+    def output_language(self) -> LanguageTag:
+        return self.target_lang
+
     def enrich(
         self, utterances: List[Utterance], language: LanguageTag
     ) -> List[Utterance]:
         self.logger.info(
             f"🌍 Translating {len(utterances)} utterances to {self.target_lang} (context_size={self.context_size})..."
         )
-        enriched = []
+        return self._translate_batches(
+            utterances, language, range(0, len(utterances), self.batch_size)
+        )
 
-        for i in range(0, len(utterances), self.batch_size):
-            target_batch = utterances[i : i + self.batch_size]
+    def enrich_selected(
+        self, utterances: List[Utterance], language: LanguageTag, indices: Set[int]
+    ) -> List[Utterance]:
+        self.logger.info(
+            f"🌍 Re-translating {len(indices)} changed utterances to {self.target_lang}..."
+        )
+        batch_starts = sorted({i - i % self.batch_size for i in indices})
+        return self._translate_batches(utterances, language, batch_starts)
 
-            context_start = max(0, i - self.context_size)
-            context_batch = utterances[context_start:i]
+    def input_fingerprint(
+        self, utterances: List[Utterance], index: int, language: LanguageTag
+    ) -> str:
+        """The exact request of index's batch, and index's place in it. 🧬"""
+        batch_start = index - index % self.batch_size
+        texts, context_texts = self._batch_payload(utterances, batch_start)
+        return window_fingerprint(
+            [language, self.target_lang, "--- BATCH ---"]
+            + texts
+            + ["--- CONTEXT ---"]
+            + context_texts
+            + ["--- POSITION ---", str(index - batch_start)]
+        )
+
+    def _batch_payload(
+        self, utterances: List[Utterance], batch_start: int
+    ) -> Tuple[List[str], List[str]]:
+        """The texts and context sent for the batch starting at batch_start. 📦"""
+        context_start = max(0, batch_start - self.context_size)
+        texts = [
+            u.text for u in utterances[batch_start : batch_start + self.batch_size]
+        ]
+        context_texts = [u.text for u in utterances[context_start:batch_start]]
+        return texts, context_texts
+
+    def _translate_batches(
+        self,
+        utterances: List[Utterance],
+        language: LanguageTag,
+        batch_starts: Iterable[int],
+    ) -> List[Utterance]:
+        enriched = list(utterances)
 
-            texts = [u.text for u in target_batch]
-            context_texts = [u.text for u in context_batch]
+        for i in batch_starts:
+            target_batch = utterances[i : i + self.batch_size]
+            texts, context_texts = self._batch_payload(utterances, i)
 
             try:
                 translated_texts = self.translator.translate(
@@ -56,12 +102,12 @@ class TranslationEnricher(IAudioEnricher):
                     )
                     translated_texts = [""] * len(target_batch)
 
-                for u, translated in zip(target_batch, translated_texts):
-                    enriched.append(dataclasses.replace(u, translated_text=translated))
+                for j, translated in enumerate(translated_texts):
+                    enriched[i + j] = target_batch[j].evolve(translated_text=translated)
 
             except Exception as e:
                 self.logger.error(f"❌ Translation batch failed: {str(e)}")
-                for u in target_batch:
-                    enriched.append(dataclasses.replace(u, translated_text=""))
+                for j, u in enumerate(target_batch):
+                    enriched[i + j] = u.evolve(translated_text="")
 
         return enriched
@@ -11,10 +11,13 @@ from src.domain.interfaces import (
     ILogger,
     IAlignmentService,
     IEventBus,
+    IVoiceActivityDetector,
+    IStepProfiler,
 )
 from src.infrastructure.logging import NullLogger
 from src.domain.entities import ProcessingJob, JobStatus
 from src.domain.value_objects import LanguageTag, DiarizationOptions, AudioTranscript
+from src.application.services import SpeechTimelineRestorer
 
 
 class AudioProcessingPipeline:
@@ -27,6 +30,8 @@ class AudioProcessingPipeline:
         event_bus: IEventBus,
         logger: ILogger = NullLogger(),
         enrichers: List[IAudioEnricher] = None,
+        vad: Optional[IVoiceActivityDetector] = None,
+        profiler: Optional[IStepProfiler] = None,
     ):
         self.audio_processor = audio_processor
         self.transcriber = transcriber
@@ -35,6 +40,9 @@ class AudioProcessingPipeline:
         self.event_bus = event_bus
         self.logger = logger
         self.enrichers = enrichers or []
+        self.vad = vad
+        self.profiler = profiler
+        self.timeline_restorer = SpeechTimelineRestorer()
 
     def execute(
         self,
@@ -59,6 +67,16 @@ class AudioProcessingPipeline:
                 artifact = self.audio_processor.normalize(source_path)
                 self._flush_events(job)
 
+            offset_map = None
+            if self.vad:
+                with self._timed_step(job, "🔇 Voice Activity Detection"):
+                    artifact, offset_map = self.vad.compact(artifact)
+                    job.record_speech_compacted(
+                        offset_map.original_duration.total_seconds(),
+                        offset_map.speech_duration.total_seconds(),
+                    )
+                    self._flush_events(job)
+
             with self._timed_step(job, f"🎤 Transcription ({language})"):
                 job.mark_transcribing()
                 raw_utterances = (
@@ -78,6 +96,14 @@ class AudioProcessingPipeline:
                 self._flush_events(job)
 
             with self._timed_step(job, "🧩 Alignment"):
+                if offset_map is not None:
+                    # Back onto the original timeline BEFORE speakers are matched 🧵
+                    raw_utterances = self.timeline_restorer.restore(
+                        raw_utterances, offset_map
+                    )
+                    diarized_segments = self.timeline_restorer.restore(
+                        diarized_segments, offset_map
+                    )
                 final_utterances = self.alignment_service.align(
                     raw_utterances, diarized_segments
                 )
@@ -97,7 +123,14 @@ class AudioProcessingPipeline:
                             final_utterances, job.target_language
                         )
 
-            job.complete(AudioTranscript(utterances=final_utterances))
+            # The languages are saved too: incremental re-runs key results on them ♻️
+            job.complete(
+                AudioTranscript(
+                    utterances=final_utterances,
+                    target_language=job.target_language,
+                    translation_language=self._translation_language(),
+                )
+            )
             self._flush_events(job)
 
             total_duration = time.time() - total_start_time
@@ -109,8 +142,18 @@ class AudioProcessingPipeline:
             job.fail(str(e))
             self._flush_events(job)
 
+        if self.profiler:
+            # Failed jobs too: the step that blew up is usually the interesting one 🔬
+            job.record_job_profiled()
+            self._flush_events(job)
+
         return job
 
+    def _translation_language(self) -> Optional[LanguageTag]:
+        return next(
+            (e.output_language for e in self.enrichers if e.output_language), None
+        )
+
     def _flush_events(self, job: ProcessingJob):
         """Dispatches all pending events from the job to the event bus. ⚡️"""
         for event in job.pull_events():
@@ -122,11 +165,14 @@ class AudioProcessingPipeline:
     ) -> Generator[None, None, None]:
         """A context manager to record component duration as a domain event. ⏳✨"""
         start_time = time.time()
+        started = self.profiler.start() if self.profiler else None
         try:
             yield
         finally:
             duration = time.time() - start_time
             job.record_step_duration(step_name, duration)
+            if self.profiler:
+                job.record_step_profile(self.profiler.finish(step_name, started))
             self._flush_events(job)
 
     def _format_duration(self, seconds: float) -> str:
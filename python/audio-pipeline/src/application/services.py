@@ -1,6 +1,13 @@
+from datetime import timedelta
 from typing import List
 from src.domain.interfaces import IAlignmentService
-from src.domain.value_objects import Utterance
+from src.domain.value_objects import (
+    Utterance,
+    Word,
+    TimestampRange,
+    SpeechOffsetMap,
+)
+from src.domain.word_store import WordStore, WordView
 
 
 class MaxOverlapAlignmentService(IAlignmentService):
@@ -24,15 +31,7 @@ class MaxOverlapAlignmentService(IAlignmentService):
                     max_overlap = overlap
                     best_speaker = turn.speaker_id
 
-            aligned_utterances.append(
-                Utterance(
-                    timestamp=text_seg.timestamp,
-                    text=text_seg.text,
-                    speaker_id=best_speaker,
-                    confidence=text_seg.confidence,
-                    words=text_seg.words,
-                )
-            )
+            aligned_utterances.append(text_seg.evolve(speaker_id=best_speaker))
 
         return aligned_utterances
 
@@ -44,3 +43,93 @@ class MaxOverlapAlignmentService(IAlignmentService):
 
     def _overlaps(self, range1, range2) -> bool:
         return range1.start < range2.end and range2.start < range1.end
+
+
+class SpeechTimelineRestorer:
+    """
+    Moves utterances produced on silence-trimmed audio back onto the original
+    timeline - utterance AND word timestamps. 🧵🗺️
+    The mapping is monotonic, so word containment survives - except for
+    zero-length words on a region seam, which are clamped back inside.
+    """
+
+    def restore(
+        self, utterances: List[Utterance], offset_map: SpeechOffsetMap
+    ) -> List[Utterance]:
+        restored = []
+        store = None
+        for u in utterances:
+            bounds = self._restore_range(u.timestamp, offset_map)
+            words = u.words
+            if isinstance(words, WordView):
+                store = store or WordStore()
+                words = self._restore_columnar(words, offset_map, store, bounds)
+            elif words:
+                words = [
+                    Word(
+                        text=w.text,
+                        timestamp=self._restore_word(w.timestamp, offset_map, bounds),
+                        confidence=w.confidence,
+                    )
+                    for w in words
+                ]
+
+            restored.append(
+                Utterance.trusted(
+                    timestamp=bounds,
+                    text=u.text,
+                    speaker_id=u.speaker_id,
+                    confidence=u.confidence,
+                    words=words,
+                    translated_text=u.translated_text,
+                    learner_notes=u.learner_notes,
+                )
+            )
+        return restored
+
+    def _restore_range(
+        self, timestamp: TimestampRange, offset_map: SpeechOffsetMap
+    ) -> TimestampRange:
+        start = offset_map.to_original(timestamp.start)
+        if timestamp.end == timestamp.start:
+            return TimestampRange(start, start)  # Zero-length stays zero-length 📍
+        return TimestampRange(start, offset_map.to_original(timestamp.end, is_end=True))
+
+    def _restore_word(
+        self,
+        timestamp: TimestampRange,
+        offset_map: SpeechOffsetMap,
+        bounds: TimestampRange,
+    ) -> TimestampRange:
+        """
+        A zero-length word on a seam maps to the later region, while an
+        utterance ending there keeps the earlier one: clamp it back inside. 📎
+        """
+        restored = self._restore_range(timestamp, offset_map)
+        start = min(max(restored.start, bounds.start), bounds.end)
+        end = min(max(restored.end, start), bounds.end)
+        return TimestampRange(start, end)
+
+    def _restore_columnar(
+        self,
+        words: WordView,
+        offset_map: SpeechOffsetMap,
+        store: WordStore,
+        bounds: TimestampRange,
+    ) -> WordView:
+        begin = len(store)
+        for text, start_ms, end_ms, conf in words.rows():
+            restored = self._restore_word(
+                TimestampRange(
+                    timedelta(milliseconds=start_ms), timedelta(milliseconds=end_ms)
+                ),
+                offset_map,
+                bounds,
+            )
+            store.append(
+                text,
+                restored.start // timedelta(milliseconds=1),
+                restored.end // timedelta(milliseconds=1),
+                conf,
+            )
+        return store.view(begin, len(store))
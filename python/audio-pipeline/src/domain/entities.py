@@ -1,8 +1,13 @@
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from uuid import UUID, uuid4
-from typing import List, Optional
-from src.domain.value_objects import Utterance, LanguageTag, AudioTranscript
+from typing import Any, List, Optional
+from src.domain.value_objects import (
+    Utterance,
+    LanguageTag,
+    AudioTranscript,
+    StepProfile,
+)
 from src.domain.events import (
     DomainEvent,
     AudioIngested,
@@ -12,6 +17,9 @@ from src.domain.events import (
     JobFailed,
     EnrichmentStarted,
     PipelineStepTimed,
+    PipelineStepProfiled,
+    JobProfiled,
+    SpeechCompacted,
 )
 
 
@@ -31,6 +39,9 @@ class AudioArtifact:
     file_path: str = ""
     format: str = ""
     sample_rate: int = 16000
+    # Optional decoded int16 mono samples (e.g. a memory-mapped buffer) so
+    # in-process consumers can skip reading and decoding the file again 🗺️
+    pcm: Optional[Any] = field(default=None, compare=False, repr=False)
 
 
 @dataclass
@@ -41,12 +52,24 @@ class ProcessingJob:
     status: JobStatus = JobStatus.CREATED
     result: Optional[AudioTranscript] = None
     error_message: Optional[str] = None
+    step_profiles: List[StepProfile] = field(
+        default_factory=list, compare=False, repr=False
+    )
     _events: List[DomainEvent] = field(default_factory=list, compare=False, repr=False)
 
     def mark_ingested(self):
         self.status = JobStatus.INGESTED
         self.record_event(AudioIngested(job_id=self.id, source_path=self.source_path))
 
+    def record_speech_compacted(self, original_seconds: float, speech_seconds: float):
+        self.record_event(
+            SpeechCompacted(
+                job_id=self.id,
+                original_seconds=original_seconds,
+                speech_seconds=speech_seconds,
+            )
+        )
+
     def mark_transcribing(self):
         self.status = JobStatus.TRANSCRIBING
 
@@ -74,6 +97,13 @@ class ProcessingJob:
             )
         )
 
+    def record_step_profile(self, profile: StepProfile):
+        self.step_profiles.append(profile)
+        self.record_event(PipelineStepProfiled(job_id=self.id, profile=profile))
+
+    def record_job_profiled(self):
+        self.record_event(JobProfiled(job_id=self.id, steps=tuple(self.step_profiles)))
+
     def complete(self, transcript: AudioTranscript):
         self.result = transcript
         self.status = JobStatus.COMPLETED
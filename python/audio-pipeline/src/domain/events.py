@@ -1,10 +1,10 @@
-import inspect
 import os
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from uuid import UUID
-from typing import Optional
-from src.domain.value_objects import LanguageTag
+from typing import Optional, Tuple
+from src.domain.value_objects import LanguageTag, StepProfile
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -16,17 +16,20 @@ class DomainEvent:
     def __post_init__(self):
         # Reach back in the stack to find the first frame that isn't
         # in events.py OR entities.py to find the real application origin! 🕵️‍♀️🔬✨
-        stack = inspect.stack()
+        # Walking raw frames (not inspect.stack()) skips reading source lines
+        # for every frame, which used to dominate the cost of an event. 🏎️
 
         # We ignore frames from these files to find the 'True Caller'
         ignored_files = ["events.py", "entities.py", "contextlib.py", "abc.py"]
 
-        for frame_info in stack:
-            filename = os.path.basename(frame_info.filename)
+        frame = sys._getframe(1)
+        while frame is not None:
+            filename = os.path.basename(frame.f_code.co_filename)
             if filename not in ignored_files and not filename.startswith("<"):
                 object.__setattr__(self, "origin_file", filename)
-                object.__setattr__(self, "origin_line", frame_info.lineno)
+                object.__setattr__(self, "origin_line", frame.f_lineno)
                 break
+            frame = frame.f_back
         else:
             object.__setattr__(self, "origin_file", "unknown")
             object.__setattr__(self, "origin_line", 0)
@@ -45,6 +48,15 @@ class SpeechTranscribed(DomainEvent):
     language: LanguageTag
 
 
+@dataclass(frozen=True, kw_only=True)
+class SpeechCompacted(DomainEvent):
+    """Silence was trimmed before ASR and diarization. 🔇✂️"""
+
+    job_id: UUID
+    original_seconds: float
+    speech_seconds: float
+
+
 @dataclass(frozen=True, kw_only=True)
 class SpeakersIdentified(DomainEvent):
     job_id: UUID
@@ -66,6 +78,22 @@ class PipelineStepTimed(DomainEvent):
     duration_seconds: float
 
 
+@dataclass(frozen=True, kw_only=True)
+class PipelineStepProfiled(DomainEvent):
+    """Where a component's time went: CPU, subprocesses, memory or waiting. 🔬"""
+
+    job_id: UUID
+    profile: StepProfile
+
+
+@dataclass(frozen=True, kw_only=True)
+class JobProfiled(DomainEvent):
+    """Every profiled step of a job, published once it completed or failed. 📊"""
+
+    job_id: UUID
+    steps: Tuple[StepProfile, ...]
+
+
 @dataclass(frozen=True, kw_only=True)
 class JobCompleted(DomainEvent):
     job_id: UUID
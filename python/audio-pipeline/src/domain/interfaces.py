@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List, Callable, Type, TypeVar, Any, Optional
+from typing import List, Callable, Type, TypeVar, Any, Optional, Set, Tuple
 from src.domain.value_objects import (
     Utterance,
     LanguageTag,
     DiarizationOptions,
     AudioTranscript,
+    SpeechOffsetMap,
+    StepProfile,
 )
 from src.domain.entities import AudioArtifact
 from src.domain.events import DomainEvent
@@ -29,6 +31,10 @@ class IResultRepository(ABC):
     def save(self, transcript: AudioTranscript, output_path: str):
         pass
 
+    @abstractmethod
+    def load(self, input_path: str, trusted: bool = False) -> AudioTranscript:
+        pass
+
 
 class ITranscriptSerializer(ABC):
     """Contract for converting AudioTranscripts into transportable formats. 💎✨"""
@@ -37,6 +43,14 @@ class ITranscriptSerializer(ABC):
     def serialize(self, transcript: AudioTranscript) -> str:
         pass
 
+    @abstractmethod
+    def deserialize(self, content: str, trusted: bool = False) -> AudioTranscript:
+        """
+        Rebuilds an AudioTranscript from serialized content. 📥
+        'trusted' skips per-word validation for files we produced ourselves.
+        """
+        pass
+
 
 class ITranscriber(ABC):
     @abstractmethod
@@ -63,6 +77,10 @@ class IAlignmentService(ABC):
 
 
 class IAudioEnricher(ABC):
+    # Language the enricher writes its results in, when that is not the
+    # transcript's own (a translator's target); None for everyone else 🌍
+    output_language: Optional[LanguageTag] = None
+
     @abstractmethod
     def enrich(
         self, utterances: List[Utterance], language: LanguageTag
@@ -70,12 +88,84 @@ class IAudioEnricher(ABC):
         pass
 
 
+class IContextualEnricher(IAudioEnricher):
+    """
+    An enricher whose result for an utterance depends only on its inputs:
+    the utterance text plus a window of neighbouring texts. ♻️🪟
+    That makes previous results safely reusable when the inputs are unchanged!
+    """
+
+    # Name of the Utterance field this enricher fills in (e.g. 'translated_text').
+    output_field: str
+    # Values in that field which mean 'no usable result' and must be redone.
+    failure_values: Tuple[Optional[str], ...] = ()
+
+    @abstractmethod
+    def input_fingerprint(
+        self, utterances: List[Utterance], index: int, language: LanguageTag
+    ) -> str:
+        """
+        Returns a stable digest of everything that influences utterances[index]:
+        the exact request its batch is sent with, not just its neighbours. 🧬
+        """
+        pass
+
+    @abstractmethod
+    def enrich_selected(
+        self, utterances: List[Utterance], language: LanguageTag, indices: Set[int]
+    ) -> List[Utterance]:
+        """Enriches only the given positions, passing every other utterance through. 🎯"""
+        pass
+
+
 class IAudioProcessor(ABC):
     @abstractmethod
     def normalize(self, source_path: str) -> AudioArtifact:
         pass
 
 
+class IVoiceActivityDetector(ABC):
+    """Contract for trimming non-speech out of a normalized artifact. 🔇✂️"""
+
+    @abstractmethod
+    def compact(self, audio: AudioArtifact) -> Tuple[AudioArtifact, SpeechOffsetMap]:
+        """Returns a speech-only artifact plus the map back to original time."""
+        pass
+
+
+class IStepProfiler(ABC):
+    """Contract for measuring what a pipeline step cost the process. 🔬"""
+
+    @abstractmethod
+    def start(self) -> Any:
+        """Takes the 'before' sample; hand it back to finish()."""
+        pass
+
+    @abstractmethod
+    def finish(self, step_name: str, started: Any) -> StepProfile:
+        pass
+
+
+class ISpeakerIndex(ABC):
+    """Contract for naming diarized speakers from a store of known voices. 🗂️🎙️"""
+
+    @abstractmethod
+    def identify(self, embeddings: Any) -> List[Optional[str]]:
+        """
+        Returns the known speaker name for each embedding row, or None when no
+        enrolled voice is close enough. Each name is used at most once per call.
+        """
+        pass
+
+    @abstractmethod
+    def enroll(self, name: str, embedding: Any):
+        pass
+
+    @abstractmethod
+    def save(self):
+        pass
+
+
 class ITranslator(ABC):
     @abstractmethod
     def translate(
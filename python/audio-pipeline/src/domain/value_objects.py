@@ -1,10 +1,30 @@
+import os
+import bisect
+import dataclasses
 from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import NewType, List, Optional
+from typing import NewType, List, Optional, Sequence, Tuple
 
 LanguageTag = NewType("LanguageTag", str)
 ConfidenceScore = NewType("ConfidenceScore", float)
 
+# 🛡️ Strict mode re-validates even 'trusted' constructions (meant for tests).
+_strict_validation = (
+    os.environ.get("AUDIO_PIPELINE_STRICT_VALIDATION", "false").lower() == "true"
+)
+
+
+def set_strict_validation(enabled: bool) -> bool:
+    """Toggles strict validation and returns the previous setting. 🛡️⚖️"""
+    global _strict_validation
+    previous = _strict_validation
+    _strict_validation = enabled
+    return previous
+
+
+def is_strict_validation() -> bool:
+    return _strict_validation
+
 
 @dataclass(frozen=True)
 class TimestampRange:
@@ -30,6 +50,92 @@ class DiarizationOptions:
     max_speakers: Optional[int] = None
 
 
+@dataclass(frozen=True)
+class SpeechOffsetMap:
+    """
+    Maps times in a speech-only (silence-trimmed) recording back to the original
+    timeline. Kept region i starts at compacted_starts[i] in the trimmed audio
+    and at original_starts[i] in the source. ✂️🗺️
+    """
+
+    compacted_starts: Tuple[timedelta, ...]
+    original_starts: Tuple[timedelta, ...]
+    original_duration: timedelta
+    speech_duration: timedelta
+
+    def __post_init__(self):
+        if len(self.compacted_starts) != len(self.original_starts):
+            raise ValueError("Offset map needs one original start per region!")
+        if not self.compacted_starts:
+            raise ValueError("Offset map needs at least one region!")
+
+    @classmethod
+    def identity(cls, duration: timedelta) -> "SpeechOffsetMap":
+        """Nothing was trimmed - every time maps onto itself. 🪞"""
+        return cls((timedelta(0),), (timedelta(0),), duration, duration)
+
+    @property
+    def skipped_fraction(self) -> float:
+        if not self.original_duration:
+            return 0.0
+        return 1.0 - self.speech_duration / self.original_duration
+
+    def to_original(self, t: timedelta, is_end: bool = False) -> timedelta:
+        """
+        A time exactly on a region seam belongs to the region that ENDS there
+        when it is an end time, so words never stretch across a removed gap. 🧵
+        """
+        find = bisect.bisect_left if is_end else bisect.bisect_right
+        i = max(0, find(self.compacted_starts, t) - 1)
+        return self.original_starts[i] + (t - self.compacted_starts[i])
+
+
+@dataclass(frozen=True)
+class StepProfile:
+    """
+    What one pipeline step cost the process: wall time, CPU time of this
+    process and of the subprocesses it waited for (whisper-cli, FFmpeg...),
+    how far it raised the peak RSS, and optionally the Python allocation peak. 🔬
+    """
+
+    step_name: str
+    wall_seconds: float
+    cpu_seconds: float
+    child_cpu_seconds: float
+    peak_rss_bytes: int
+    rss_growth_bytes: int
+    python_peak_bytes: Optional[int] = None
+
+    # A step that keeps half a core busy is doing work, not waiting 🧮
+    CPU_BOUND_UTILIZATION = 0.5
+    # ...and one that raises the high-water mark this much sizes the machine 🐘
+    MEMORY_BOUND_GROWTH_BYTES = 512 * 1024 * 1024
+
+    @property
+    def total_cpu_seconds(self) -> float:
+        return self.cpu_seconds + self.child_cpu_seconds
+
+    @property
+    def cpu_utilization(self) -> float:
+        """CPU seconds per wall second; above 1.0 means several cores. 📈"""
+        if self.wall_seconds <= 0:
+            return 0.0
+        return self.total_cpu_seconds / self.wall_seconds
+
+    @property
+    def bound(self) -> str:
+        """
+        'memory' if the step grew the peak footprint past the threshold (it
+        decides how many jobs fit side by side), else 'cpu' if it kept the
+        CPU busy, else 'wait' (network, disk, a server process we don't own). ⚖️
+        """
+        if self.rss_growth_bytes >= self.MEMORY_BOUND_GROWTH_BYTES:
+            return "memory"
+        if self.cpu_utilization >= self.CPU_BOUND_UTILIZATION:
+            return "cpu"
+        return "wait"
+
+
 @dataclass(frozen=True)
 class Utterance:
     timestamp: TimestampRange
@@ -41,6 +147,19 @@ class Utterance:
     learner_notes: Optional[str] = None
 
     def __post_init__(self):
+        self._validate_words()
+
+    def _validate_words(self):
+        # Columnar word views can prove containment from their extremes alone 🗄️🏎️
+        time_bounds = getattr(self.words, "time_bounds", None)
+        if time_bounds is not None and len(self.words) > 0:
+            bounds = time_bounds()
+            if (
+                bounds.start >= self.timestamp.start
+                and bounds.end <= self.timestamp.end
+            ):
+                return
+
         for word in self.words:
             if (
                 word.timestamp.start < self.timestamp.start
@@ -51,6 +170,55 @@ class Utterance:
                     f"falls outside utterance range ({self.timestamp.start}-{self.timestamp.end})!"
                 )
 
+    @classmethod
+    def trusted(
+        cls,
+        timestamp: TimestampRange,
+        text: str,
+        speaker_id: str,
+        confidence: ConfidenceScore,
+        words: Sequence[Word] = (),
+        translated_text: Optional[str] = None,
+        learner_notes: Optional[str] = None,
+    ) -> "Utterance":
+        """
+        Builds an Utterance WITHOUT re-checking its words against its range. 🏎️💨
+        Only for data that already passed validation (e.g. our own saved transcripts)!
+        Strict mode validates anyway, so tests catch any misuse. 🛡️
+        """
+        utterance = object.__new__(cls)
+        object.__setattr__(utterance, "timestamp", timestamp)
+        object.__setattr__(utterance, "text", text)
+        object.__setattr__(utterance, "speaker_id", speaker_id)
+        object.__setattr__(utterance, "confidence", confidence)
+        object.__setattr__(utterance, "words", words if words else [])
+        object.__setattr__(utterance, "translated_text", translated_text)
+        object.__setattr__(utterance, "learner_notes", learner_notes)
+        if _strict_validation:
+            utterance._validate_words()
+        return utterance
+
+    def evolve(self, **changes) -> "Utterance":
+        """
+        The enrichers' 'dataclasses.replace'. ♻️
+        Touching only non-temporal fields (text, speaker, translation, notes...)
+        keeps the already-validated words and skips the O(words) check.
+        """
+        if "timestamp" in changes or "words" in changes:
+            return dataclasses.replace(self, **changes)
+
+        values = {
+            "timestamp": self.timestamp,
+            "text": self.text,
+            "speaker_id": self.speaker_id,
+            "confidence": self.confidence,
+            "words": self.words,
+            "translated_text": self.translated_text,
+            "learner_notes": self.learner_notes,
+        }
+        values.update(changes)
+        return Utterance.trusted(**values)
+
 
 @dataclass(frozen=True)
 class AudioTranscript:
@@ -58,6 +226,8 @@ class AudioTranscript:
 
     utterances: List[Utterance] = field(default_factory=list)
     target_language: Optional[LanguageTag] = None
+    # What translated_text is in - reused translations must match it 🌍
+    translation_language: Optional[LanguageTag] = None
 
     @property
     def speaker_ids(self) -> List[str]:
@@ -0,0 +1,164 @@
+from array import array
+from collections.abc import Sequence
+from datetime import timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Tuple
+from src.domain.value_objects import Word, TimestampRange, ConfidenceScore
+
+WordRow = Tuple[str, int, int, float]
+
+
+@lru_cache(maxsize=65536)
+def float32_value(stored: float) -> float:
+    """
+    The shortest decimal that a float32 column value stands for: 0.87 is
+    stored as 0.8700000047683716 and read back as 0.87, so columnar words
+    serialize like Word objects. Whisper confidences repeat a lot, hence
+    the cache. 🎯
+    """
+    for digits in range(6, 10):
+        candidate = float(f"{stored:.{digits}g}")
+        if array("f", (candidate,))[0] == stored:
+            return candidate
+    return stored
+
+
+class WordStore:
+    """
+    Columnar, array-backed storage for all the words of a transcript. 🗄️🏎️
+    Timings live in contiguous int64 millisecond arrays, confidences in float32
+    and texts are interned once and referenced by id - instead of one Word,
+    one TimestampRange and two timedeltas per Whisper token.
+    """
+
+    __slots__ = ("start_ms", "end_ms", "confidence", "text_ids", "_texts", "_text_ids")
+
+    def __init__(self):
+        self.start_ms = array("q")
+        self.end_ms = array("q")
+        self.confidence = array("f")
+        self.text_ids = array("I")
+        self._texts: List[str] = []
+        self._text_ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.start_ms)
+
+    def append(self, text: str, start_ms: int, end_ms: int, confidence: float) -> int:
+        """Stores one word and returns its position. 📥"""
+        if start_ms > end_ms:
+            raise ValueError("Start time cannot be after end time!")
+
+        text_id = self._text_ids.get(text)
+        if text_id is None:
+            text_id = len(self._texts)
+            self._texts.append(text)
+            self._text_ids[text] = text_id
+
+        self.start_ms.append(start_ms)
+        self.end_ms.append(end_ms)
+        self.confidence.append(confidence)
+        self.text_ids.append(text_id)
+        return len(self.start_ms) - 1
+
+    def extend(self, words: Iterable[Word]) -> "WordView":
+        """Copies Word objects into the store and returns a view over them. 🧩"""
+        begin = len(self)
+        for w in words:
+            self.append(
+                w.text,
+                w.timestamp.start // timedelta(milliseconds=1),
+                w.timestamp.end // timedelta(milliseconds=1),
+                float(w.confidence),
+            )
+        return self.view(begin, len(self))
+
+    def view(self, start: int = 0, stop: int = None) -> "WordView":
+        return WordView(self, start, len(self) if stop is None else stop)
+
+    def text(self, index: int) -> str:
+        return self._texts[self.text_ids[index]]
+
+    def word(self, index: int) -> Word:
+        """Materializes a single Word on demand. 💎"""
+        return Word(
+            text=self._texts[self.text_ids[index]],
+            timestamp=TimestampRange(
+                timedelta(milliseconds=self.start_ms[index]),
+                timedelta(milliseconds=self.end_ms[index]),
+            ),
+            confidence=ConfidenceScore(float32_value(self.confidence[index])),
+        )
+
+
+class WordView(Sequence):
+    """
+    A lightweight window [start, stop) over a WordStore that an Utterance can
+    hold as its 'words'. Slicing stays a view; indexing builds a Word. 🔭
+    """
+
+    __slots__ = ("store", "start", "stop")
+
+    def __init__(self, store: WordStore, start: int, stop: int):
+        self.store = store
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            begin, end, step = index.indices(len(self))
+            if step != 1:
+                return [
+                    self.store.word(self.start + i) for i in range(begin, end, step)
+                ]
+            return WordView(
+                self.store, self.start + begin, self.start + max(begin, end)
+            )
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("WordView index out of range")
+        return self.store.word(self.start + index)
+
+    def __iter__(self) -> Iterator[Word]:
+        word = self.store.word
+        return (word(i) for i in range(self.start, self.stop))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return list(self) == list(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"WordView([{self.start}:{self.stop}] of {len(self.store)} words)"
+
+    def texts(self) -> List[str]:
+        """All word texts without building Word objects. 🔤"""
+        texts, ids = self.store._texts, self.store.text_ids
+        return [texts[ids[i]] for i in range(self.start, self.stop)]
+
+    def rows(self) -> Iterator[WordRow]:
+        """Yields (text, start_ms, end_ms, confidence) straight from the columns. 🏎️"""
+        store = self.store
+        texts, ids = store._texts, store.text_ids
+        confidence = store.confidence
+        for i in range(self.start, self.stop):
+            yield (
+                texts[ids[i]],
+                store.start_ms[i],
+                store.end_ms[i],
+                float32_value(confidence[i]),
+            )
+
+    def time_bounds(self) -> TimestampRange:
+        """Earliest start and latest end of the viewed words, in one C-level pass. 📏"""
+        return TimestampRange(
+            timedelta(milliseconds=min(self.store.start_ms[self.start : self.stop])),
+            timedelta(milliseconds=max(self.store.end_ms[self.start : self.stop])),
+        )
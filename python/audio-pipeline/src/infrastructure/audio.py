@@ -1,28 +1,111 @@
+import hashlib
+import shutil
 import subprocess
 import os
+import wave
 from src.domain.interfaces import IAudioProcessor, ILogger
 from src.infrastructure.logging import NullLogger
 from src.domain.entities import AudioArtifact
 
+TARGET_SAMPLE_RATE = 16000
+TARGET_CHANNELS = 1
+TARGET_SAMPLE_WIDTH = 2  # 16-bit PCM
+
 
 class FFmpegAudioProcessor(IAudioProcessor):
-    def __init__(self, work_dir: str = None, logger: ILogger = NullLogger()):
+    def __init__(
+        self,
+        work_dir: str = None,
+        logger: ILogger = NullLogger(),
+        cache_dir: str = None,
+        map_pcm: bool = False,
+    ):
         self.work_dir = work_dir
         self.logger = logger
+        self.cache_dir = cache_dir
+        self.map_pcm = map_pcm
 
     def normalize(self, source_path: str) -> AudioArtifact:
         """
         Uses ffmpeg to normalize audio to 16kHz, mono, 16-bit PCM WAV.
+        Already-normalized WAVs skip FFmpeg, and with a 'cache_dir' every
+        source is transcoded at most once across runs; either way the artifact
+        is linked into work_dir. 🗄️🏎️
         """
+        if self._is_normalized(source_path):
+            self.logger.info(
+                f"🏎️ '{os.path.basename(source_path)}' is already 16kHz mono PCM. Skipping FFmpeg!"
+            )
+            return self._artifact(self._stage(source_path, source_path))
+
+        if self.cache_dir:
+            return self._normalize_cached(source_path)
+
+        output_path = self._output_path(source_path)
+        if os.path.lexists(output_path):
+            # An earlier run may have staged a hard link here: FFmpeg's -y would
+            # truncate the inode it shares with a cache entry or the user's file 🔗
+            os.remove(output_path)
+        self._run_ffmpeg(source_path, output_path)
+        return self._artifact(output_path)
+
+    def _output_path(self, source_path: str) -> str:
+        """Where the normalized WAV lives - and so every file derived from it. 📂"""
         filename = os.path.basename(source_path).rsplit(".", 1)[0] + "_normalized.wav"
-        output_path = os.path.join(
-            self.work_dir or os.path.dirname(source_path), filename
+        work_dir = self.work_dir or os.path.dirname(source_path)
+        if work_dir:
+            os.makedirs(work_dir, exist_ok=True)
+        return os.path.join(work_dir, filename)
+
+    def _stage(self, wav_path: str, source_path: str) -> str:
+        """
+        Hard-links a reused WAV (the source itself or a cache entry) to the
+        path FFmpeg would have written. Whisper's JSON, VAD's _speech.wav and
+        chunk dirs are named after the artifact, so they stay in work_dir
+        instead of landing next to the user's file or in the shared cache. 🔗
+        Falls back to a copy across file systems.
+        """
+        staged_path = self._output_path(source_path)
+        if os.path.exists(staged_path) and os.path.samefile(wav_path, staged_path):
+            return staged_path
+
+        partial_path = f"{staged_path[:-4]}.{os.getpid()}.partial.wav"
+        try:
+            try:
+                os.link(wav_path, partial_path)
+            except OSError:
+                shutil.copyfile(wav_path, partial_path)
+            os.replace(partial_path, staged_path)
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+        return staged_path
+
+    def _normalize_cached(self, source_path: str) -> AudioArtifact:
+        """Content-addressed cache: same bytes in, same WAV out - transcoded once. 🗄️🔑"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        cached_path = os.path.join(
+            self.cache_dir, f"{self._content_hash(source_path)}.wav"
         )
 
-        # Ensure work_dir exists
-        if self.work_dir:
-            os.makedirs(self.work_dir, exist_ok=True)
+        if os.path.exists(cached_path):
+            self.logger.info(f"🗄️ Normalized audio cache hit: {cached_path}")
+            return self._artifact(self._stage(cached_path, source_path))
+
+        # Write next to the final name, then rename atomically so a crash or a
+        # parallel job can never leave a half-written WAV in the cache! ⚛️🛡️
+        partial_path = f"{cached_path[:-4]}.{os.getpid()}.partial.wav"
+        try:
+            self._run_ffmpeg(source_path, partial_path)
+            os.replace(partial_path, cached_path)
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
 
+        self.logger.info(f"🗄️ Normalized audio cached: {cached_path}")
+        return self._artifact(self._stage(cached_path, source_path))
+
+    def _run_ffmpeg(self, source_path: str, output_path: str):
         command = [
             "ffmpeg",
             "-y",
@@ -31,9 +114,9 @@ class FFmpegAudioProcessor(IAudioProcessor):
             "-i",
             source_path,
             "-ar",
-            "16000",
+            str(TARGET_SAMPLE_RATE),
             "-ac",
-            "1",
+            str(TARGET_CHANNELS),
             "-c:a",
             "pcm_s16le",
             output_path,
@@ -48,4 +131,34 @@ class FFmpegAudioProcessor(IAudioProcessor):
         except FileNotFoundError:
             raise RuntimeError(f"FFmpeg binary not found! Please install ffmpeg. 🚫🔨")
 
-        return AudioArtifact(file_path=output_path, format="wav", sample_rate=16000)
+    def _is_normalized(self, path: str) -> bool:
+        """Reads only the WAV header - no decoding, no FFmpeg. 🔍"""
+        try:
+            with wave.open(path, "rb") as wav:
+                return (
+                    wav.getnchannels() == TARGET_CHANNELS
+                    and wav.getframerate() == TARGET_SAMPLE_RATE
+                    and wav.getsampwidth() == TARGET_SAMPLE_WIDTH
+                    and wav.getcomptype() == "NONE"
+                )
+        except (wave.Error, EOFError, OSError):
+            return False  # Not a (readable) WAV - FFmpeg will sort it out 🔨
+
+    def _content_hash(self, path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _artifact(self, path: str) -> AudioArtifact:
+        artifact = AudioArtifact(
+            file_path=path, format="wav", sample_rate=TARGET_SAMPLE_RATE
+        )
+        if self.map_pcm:
+            from src.infrastructure.pcm import map_pcm16  # numpy only when needed 💤
+
+            # Decode once: downstream stages read the mapped samples, not the file 🗺️💾
+            artifact.pcm = map_pcm16(path)
+            self.logger.debug(f"🗺️ Memory-mapped {len(artifact.pcm)} PCM samples.")
+        return artifact
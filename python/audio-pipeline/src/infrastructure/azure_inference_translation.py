@@ -1,4 +1,6 @@
 import json
+import os
+import threading
 import time
 from typing import Any, Dict, List, Optional
 import httpx
@@ -6,6 +8,7 @@ import httpx
 from src.domain.interfaces import ILogger, ITranslator
 from src.domain.value_objects import LanguageTag
 from src.infrastructure.logging import NullLogger
+from src.infrastructure.retry import retry_after_seconds
 from src.infrastructure.azure_inference_translation_mapper import AzureInferenceTranslationMapper
 
 class AzureInferenceTranslator(ITranslator):
@@ -19,18 +22,26 @@ class AzureInferenceTranslator(ITranslator):
         endpoint: str,
         api_key: str,
         logger: ILogger = NullLogger(),
-        mapper: Optional[AzureInferenceTranslationMapper] = None
+        mapper: Optional[AzureInferenceTranslationMapper] = None,
+        max_retries: int = 3,
+        retry_base_delay: float = 65.0,
     ):
         self.endpoint = endpoint
         self.api_key = api_key
         self.logger = logger
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self._client: Optional[httpx.Client] = None
+        self._client_pid: Optional[int] = None
+        self._client_lock = threading.Lock()
         self.mapper = mapper or AzureInferenceTranslationMapper()
         self.model_name = self.mapper.extract_model_name(endpoint)
 
     def translate(
         self,
         texts: List[str],
-        target_lang: LanguageTag,
+        source_lang: Optional[LanguageTag] = None,
+        target_lang: Optional[LanguageTag] = None,
         context: Optional[List[str]] = None,
     ) -> List[str]:
         if not texts:
@@ -50,18 +61,18 @@ class AzureInferenceTranslator(ITranslator):
         payload: Dict[str, Any],
         headers: Dict[str, Any],
     ) -> List[str]:
-        max_retries = 3
-        base_delay = 65.0
+        max_retries = self.max_retries
+        base_delay = self.retry_base_delay
 
         for attempt in range(max_retries):
             try:
-                with httpx.Client(timeout=120.0) as client:
-                    response = client.post(self.endpoint, headers=headers, json=payload)
-                    if response.status_code == 429:
-                        time.sleep(base_delay * (2**attempt))
-                        continue
-                    response.raise_for_status()
-                    return self.mapper.parse_response(num_texts, response.json())
+                response = self._http().post(self.endpoint, headers=headers, json=payload)
+                if response.status_code == 429:
+                    # The service knows best when quota frees up again 🚦
+                    time.sleep(retry_after_seconds(response, base_delay * (2**attempt)))
+                    continue
+                response.raise_for_status()
+                return self.mapper.parse_response(num_texts, response.json())
             except Exception as e:
                 if attempt == max_retries - 1:
                     self.logger.error(f"Translation failed: {e}")
@@ -69,3 +80,20 @@ class AzureInferenceTranslator(ITranslator):
                 time.sleep(base_delay * (2**attempt))
 
         return [""] * num_texts
+
+    def _http(self) -> httpx.Client:
+        """
+        One pooled client per process: TLS setup and connections are reused
+        across requests instead of paid per utterance. A forked worker gets
+        its own, never the parent's sockets. 🔌
+        """
+        with self._client_lock:
+            if self._client is None or self._client_pid != os.getpid():
+                self._client = httpx.Client(timeout=120.0)
+                self._client_pid = os.getpid()
+            return self._client
+
+    def close(self):
+        if self._client is not None and self._client_pid == os.getpid():
+            self._client.close()
+        self._client = None
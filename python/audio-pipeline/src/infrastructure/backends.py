@@ -0,0 +1,34 @@
+import importlib
+from typing import Dict
+
+# 🗂️ Backend registry: name -> "module:Class". Nothing here is imported until a
+# stack actually selects it, so an Azure run never pays for torch/pyannote and a
+# local run never pays for the cloud clients. 💤🏎️
+BACKENDS: Dict[str, str] = {
+    "whisper-cli": "src.infrastructure.transcription:WhisperTranscriber",
+    "whisper-chunked": "src.infrastructure.transcription:ChunkedWhisperTranscriber",
+    "whisper-server": "src.infrastructure.transcription:WhisperServerTranscriber",
+    "azure-fast": "src.infrastructure.transcription:AzureFastTranscriber",
+    "azure-chunked": "src.infrastructure.transcription:ChunkedAzureTranscriber",
+    "pyannote": "src.infrastructure.diarization:PyannoteDiarizer",
+    "null-diarizer": "src.infrastructure.diarization:NullDiarizer",
+    "numpy-speaker-index": "src.infrastructure.speaker_index:NumpySpeakerIndex",
+    "energy-vad": "src.infrastructure.vad:EnergyVoiceActivityDetector",
+    "llama-cpp": "src.infrastructure.llama_cpp_translation:LlamaCppTranslator",
+    "azure-inference-translator": "src.infrastructure.azure_inference_translation:AzureInferenceTranslator",
+    "azure-inference-annotation": "src.infrastructure.azure_inference_annotation:AzureInferenceAnnotationService",
+    "cassette": "src.infrastructure.cassette:Cassette",
+    "cassette-diarizer": "src.infrastructure.cassette:CassetteDiarizer",
+}
+
+
+def load_backend(name: str) -> type:
+    """Imports and returns the adapter class registered under 'name'. 🔌"""
+    try:
+        target = BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"❌ Unknown backend '{name}'! Known: {', '.join(sorted(BACKENDS))}"
+        ) from None
+    module_name, class_name = target.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
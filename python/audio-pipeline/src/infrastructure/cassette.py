@@ -0,0 +1,374 @@
+import base64
+import hashlib
+import json
+import os
+import subprocess
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from src.domain.entities import AudioArtifact
+from src.domain.interfaces import IDiarizer, ILogger
+from src.domain.value_objects import (
+    ConfidenceScore,
+    DiarizationOptions,
+    TimestampRange,
+    Utterance,
+)
+from src.infrastructure.logging import NullLogger
+
+MODES = ("record", "replay")
+
+
+def _b64(data: Optional[bytes]) -> Optional[str]:
+    return None if data is None else base64.b64encode(data).decode("ascii")
+
+
+def _unb64(data: Optional[str]) -> Optional[bytes]:
+    return None if data is None else base64.b64decode(data)
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _body_digest(request: httpx.Request, body: bytes) -> str:
+    """
+    The body hash with the multipart boundary swapped for a fixed token: httpx
+    draws a random one per request, so uploads would never match on replay. 🔑
+    """
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("multipart/"):
+        boundary = content_type.partition("boundary=")[2].split(";")[0].strip('"')
+        if boundary:
+            body = body.replace(boundary.encode("latin-1"), b"cassette-boundary")
+    return _sha256(body)
+
+
+def _normalize_command(args) -> List[str]:
+    """
+    A command as a run-independent key: paths shrink to their file names, so
+    temp directories and output dirs don't break matching on replay. 🔑
+    """
+    if isinstance(args, (str, bytes)):
+        args = [args]
+    return [os.path.basename(str(a)) if os.sep in str(a) else str(a) for a in args]
+
+
+class Cassette:
+    """
+    Record/replay of every external call the pipeline makes. 📼🔁
+    While active, subprocess.run (FFmpeg, whisper-cli, llama-cli) and every
+    httpx request (Azure, whisper-server) go through the cassette:
+    - 'record' runs the real call and stores its result, the files it wrote
+      and its latency in a JSON cassette on exit.
+    - 'replay' answers from the cassette without running anything, optionally
+      sleeping for the recorded latency so timings stay realistic.
+    Replay looks for an exact match first (normalized command, or method + URL
+    path + body hash with the multipart boundary normalized) and falls back to
+    the next unused recording of the same program/path, so random temp names
+    don't matter - and concurrent uploads each get their own response back.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "replay",
+        replay_latency: bool = False,
+        logger: ILogger = NullLogger(),
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode '{mode}'! Use one of {MODES}")
+        self.path = path
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self.logger = logger
+        self.interactions: List[Dict[str, Any]] = []
+        self._used: List[bool] = []
+        self._lock = threading.Lock()
+        self._originals: Dict[str, Any] = {}
+
+        if mode == "replay":
+            with open(path, "r", encoding="utf-8") as f:
+                self.interactions = json.load(f).get("interactions", [])
+            self._used = [False] * len(self.interactions)
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    def __enter__(self):
+        self._originals = {
+            "run": subprocess.run,
+            "handle_request": httpx.HTTPTransport.handle_request,
+        }
+        cassette = self
+
+        def handle_request(transport, request):
+            return cassette._http(transport, request)
+
+        subprocess.run = self._run
+        httpx.HTTPTransport.handle_request = handle_request
+        self.logger.info(
+            f"📼 Cassette {self.mode}: {self.path}"
+            + (
+                f" ({len(self.interactions)} interactions)"
+                if not self.recording
+                else ""
+            )
+        )
+        return self
+
+    def __exit__(self, *exc):
+        subprocess.run = self._originals["run"]
+        httpx.HTTPTransport.handle_request = self._originals["handle_request"]
+        if self.recording:
+            self.save()
+        else:
+            unused = self._used.count(False)
+            if unused:
+                self.logger.warning(
+                    f"📼 {unused} recorded interaction(s) were never replayed"
+                )
+
+    def save(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "interactions": self.interactions}, f, indent=1)
+        os.replace(tmp_path, self.path)
+        self.logger.info(
+            f"📼 Recorded {len(self.interactions)} interaction(s) to {self.path}"
+        )
+
+    # --- Generic store ---
+
+    def record(self, interaction: Dict[str, Any]):
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def take(self, kind: str, key: Any, program: Any) -> Dict[str, Any]:
+        """The recording for 'key', else the next unused one for 'program'. 🎯"""
+        with self._lock:
+            for field, wanted in (("key", key), ("program", program)):
+                for i, interaction in enumerate(self.interactions):
+                    if (
+                        not self._used[i]
+                        and interaction["kind"] == kind
+                        and interaction[field] == wanted
+                    ):
+                        self._used[i] = True
+                        return interaction
+        raise RuntimeError(f"📼 No recorded {kind} call for {key} in {self.path}! 🚫")
+
+    def wait(self, interaction: Dict[str, Any]):
+        """Sleeps for the recorded latency when replaying in real time. ⏱️"""
+        if self.replay_latency:
+            time.sleep(interaction.get("elapsed", 0.0))
+
+    # --- subprocess.run ---
+
+    def _run(self, args, *popenargs, **kwargs) -> subprocess.CompletedProcess:
+        check = kwargs.pop("check", False)
+        text = bool(
+            kwargs.get("text")
+            or kwargs.get("universal_newlines")
+            or kwargs.get("encoding")
+        )
+        key = _normalize_command(args)
+        program = key[0] if key else ""
+
+        if self.recording:
+            interaction = self._record_run(args, popenargs, kwargs, key, program)
+        else:
+            interaction = self.take("subprocess", key, program)
+            self.wait(interaction)
+            for output in interaction["outputs"]:
+                path = f"{args[output['arg']]}{output['suffix']}"
+                with open(path, "wb") as f:
+                    f.write(_unb64(output["data"]))
+
+        stdout, stderr = (_unb64(interaction[k]) for k in ("stdout", "stderr"))
+        if text:
+            stdout, stderr = (
+                None if s is None else s.decode("utf-8", errors="replace")
+                for s in (stdout, stderr)
+            )
+        result = subprocess.CompletedProcess(
+            args, interaction["returncode"], stdout, stderr
+        )
+        if check:
+            result.check_returncode()
+        return result
+
+    def _record_run(self, args, popenargs, kwargs, key, program) -> Dict[str, Any]:
+        command = (
+            [str(a) for a in args]
+            if not isinstance(args, (str, bytes))
+            else [str(args)]
+        )
+        before = self._snapshot(command)
+        start = time.perf_counter()
+        result = self._originals["run"](args, *popenargs, **kwargs)
+        elapsed = time.perf_counter() - start
+
+        def as_bytes(stream):
+            return stream.encode("utf-8") if isinstance(stream, str) else stream
+
+        interaction = {
+            "kind": "subprocess",
+            "key": key,
+            "program": program,
+            "returncode": result.returncode,
+            "stdout": _b64(as_bytes(result.stdout)),
+            "stderr": _b64(as_bytes(result.stderr)),
+            "outputs": self._outputs(command, before),
+            "elapsed": elapsed,
+        }
+        self.record(interaction)
+        return interaction
+
+    @staticmethod
+    def _snapshot(command: List[str]) -> Dict[str, int]:
+        """mtimes of every file next to a path argument, to spot what the call writes. 📸"""
+        files = {}
+        for directory in {os.path.dirname(a) or "." for a in command if os.sep in a}:
+            if not os.path.isdir(directory):
+                continue
+            for entry in os.scandir(directory):
+                if entry.is_file():
+                    files[entry.path] = entry.stat().st_mtime_ns
+        return files
+
+    def _outputs(
+        self, command: List[str], before: Dict[str, int]
+    ) -> List[Dict[str, Any]]:
+        """
+        Files the call created or changed, stored relative to the argument that
+        names them (e.g. ffmpeg's output path, whisper-cli's -of prefix + .json). 📂
+        """
+        outputs = []
+        for path, mtime in self._snapshot(command).items():
+            if before.get(path) == mtime:
+                continue
+            # The longest argument that is a prefix of the written file
+            candidates = [
+                (len(a), i)
+                for i, a in enumerate(command)
+                if os.sep in a
+                and os.path.normpath(path).startswith(os.path.normpath(a))
+            ]
+            if not candidates:
+                continue
+            _, index = max(candidates)
+            with open(path, "rb") as f:
+                data = f.read()
+            outputs.append(
+                {
+                    "arg": index,
+                    "suffix": os.path.normpath(path)[
+                        len(os.path.normpath(command[index])) :
+                    ],
+                    "data": _b64(data),
+                }
+            )
+        return outputs
+
+    # --- httpx ---
+
+    def _http(self, transport, request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        # Host and query (region, api-version) stay out of the key 🔑
+        program = [request.method, request.url.path]
+        key = program + [_body_digest(request, body)]
+
+        if self.recording:
+            start = time.perf_counter()
+            response = self._originals["handle_request"](transport, request)
+            try:
+                raw = b"".join(response.stream)  # Still encoded, exactly as sent 📦
+            finally:
+                response.close()
+            interaction = {
+                "kind": "http",
+                "key": key,
+                "program": program,
+                "status": response.status_code,
+                "headers": response.headers.multi_items(),
+                "content": _b64(raw),
+                "elapsed": time.perf_counter() - start,
+            }
+            self.record(interaction)
+        else:
+            interaction = self.take("http", key, program)
+            self.wait(interaction)
+
+        return httpx.Response(
+            interaction["status"],
+            headers=[tuple(h) for h in interaction["headers"]],
+            content=_unb64(interaction["content"]),
+            request=request,
+        )
+
+
+class CassetteDiarizer(IDiarizer):
+    """
+    Diarization through the cassette: records the wrapped diarizer's speaker
+    turns, or replays them without loading any Pyannote weights. 📼🗣️
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        inner: Optional[IDiarizer] = None,
+        logger: ILogger = NullLogger(),
+    ):
+        if cassette.recording and inner is None:
+            raise ValueError("Recording diarization needs a real diarizer to wrap")
+        self.cassette = cassette
+        self.inner = inner
+        self.logger = logger
+
+    def diarize(
+        self, audio: AudioArtifact, options: DiarizationOptions = None
+    ) -> List[Utterance]:
+        key = [os.path.basename(audio.file_path)]
+        if not self.cassette.recording:
+            interaction = self.cassette.take("diarization", key, "diarization")
+            self.cassette.wait(interaction)
+            self.logger.debug(f"📼 Replayed {len(interaction['turns'])} speaker turns")
+            return [
+                Utterance(
+                    timestamp=TimestampRange(
+                        start=timedelta(seconds=start), end=timedelta(seconds=end)
+                    ),
+                    text="",
+                    speaker_id=speaker,
+                    confidence=ConfidenceScore(1.0),
+                )
+                for start, end, speaker in interaction["turns"]
+            ]
+
+        start = time.perf_counter()
+        turns = self.inner.diarize(audio, options)
+        self.cassette.record(
+            {
+                "kind": "diarization",
+                "key": key,
+                "program": "diarization",
+                "turns": [
+                    [
+                        t.timestamp.start.total_seconds(),
+                        t.timestamp.end.total_seconds(),
+                        t.speaker_id,
+                    ]
+                    for t in turns
+                ],
+                "elapsed": time.perf_counter() - start,
+            }
+        )
+        return turns
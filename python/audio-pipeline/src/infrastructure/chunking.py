@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+from typing import List
+import numpy as np
+from src.infrastructure.pcm import frame_mean_square
+
+
+@dataclass(frozen=True)
+class AudioChunk:
+    """
+    A slice of the recording, in samples. [start, stop) is what gets transcribed
+    (cut plus overlap on both sides); [keep_start, keep_stop) is the part this
+    chunk OWNS when stitching, so overlapping segments are kept exactly once. ✂️🧵
+    """
+
+    index: int
+    start: int
+    stop: int
+    keep_start: int
+    keep_stop: int
+    # Only the chunk at the end of the recording owns times past its keep_stop
+    is_last: bool = False
+
+    def owns(self, sample: float) -> bool:
+        # The final chunk also owns anything Whisper places past the last cut 🧷
+        return self.keep_start <= sample and (sample < self.keep_stop or self.is_last)
+
+
+def plan_chunks(
+    samples: np.ndarray,
+    sample_rate: int,
+    chunk_seconds: float,
+    overlap_seconds: float = 2.0,
+    search_seconds: float = 10.0,
+    frame_ms: int = 50,
+) -> List[AudioChunk]:
+    """
+    Cuts roughly every 'chunk_seconds', nudging each cut to the quietest frame
+    within 'search_seconds' so words are never sliced in half. 🔇✂️
+    """
+    total = len(samples)
+    chunk = int(chunk_seconds * sample_rate)
+    if total <= chunk:
+        return [AudioChunk(0, 0, total, 0, total, is_last=True)]
+
+    frame = sample_rate * frame_ms // 1000
+    energy = frame_mean_square(samples, frame)
+    search = int(search_seconds * sample_rate)
+
+    cuts = [0]
+    while total - cuts[-1] > chunk:
+        target = cuts[-1] + chunk
+        # Never search back past half a chunk, nor into the final partial frame 📏
+        first_frame = max(cuts[-1] + chunk // 2, target - search) // frame
+        last_frame = min(target + search, total) // frame
+        if last_frame > first_frame:
+            quietest = first_frame + int(np.argmin(energy[first_frame:last_frame]))
+            cuts.append(quietest * frame + frame // 2)
+        else:
+            cuts.append(target)
+    cuts.append(total)
+
+    overlap = int(overlap_seconds * sample_rate)
+    return [
+        AudioChunk(
+            index=i,
+            start=max(0, cut_start - overlap),
+            stop=min(total, cut_stop + overlap),
+            keep_start=cut_start,
+            keep_stop=cut_stop,
+            is_last=cut_stop == total,
+        )
+        for i, (cut_start, cut_stop) in enumerate(zip(cuts, cuts[1:]))
+    ]
@@ -0,0 +1,80 @@
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional
+from src.domain.interfaces import ILogger
+from src.infrastructure.logging import NullLogger
+
+
+@dataclass(frozen=True)
+class ThreadLease:
+    """Threads granted to one stage: 'processes' workers x 'threads' each. 🧮"""
+
+    stage: str
+    threads: int
+    processes: int = 1
+
+    @property
+    def total(self) -> int:
+        return self.threads * self.processes
+
+
+class CpuBudget:
+    """
+    One place that decides how many CPU threads every stage may use. 🧮⚖️
+    Pipeline stages run one after another, so each stage may use the whole
+    per-job share - but parallel jobs and parallel worker processes divide it,
+    instead of every component guessing from os.cpu_count() on its own.
+    """
+
+    def __init__(
+        self,
+        total_threads: Optional[int] = None,
+        concurrent_jobs: int = 1,
+        logger: ILogger = NullLogger(),
+    ):
+        self.total_threads = total_threads or os.cpu_count() or 1
+        self.concurrent_jobs = max(1, concurrent_jobs)
+        self.logger = logger
+        self.leases: Dict[str, ThreadLease] = {}
+
+    @property
+    def per_job(self) -> int:
+        return max(1, self.total_threads // self.concurrent_jobs)
+
+    def lease(
+        self, stage: str, processes: int = 1, requested: Optional[int] = None
+    ) -> ThreadLease:
+        """
+        Grants threads per process for 'stage'. An explicit 'requested' total
+        (e.g. a CLI flag) wins, but oversubscription is called out. ⚠️
+        """
+        processes = max(1, processes)
+        total = requested or self.per_job
+        if total > self.per_job:
+            self.logger.warning(
+                f"⚠️ {stage} asks for {total} threads but each job's share is "
+                f"{self.per_job}; cores will be oversubscribed."
+            )
+        lease = ThreadLease(stage, max(1, total // processes), processes)
+        self.leases[stage] = lease
+        return lease
+
+    def utilization(self, wall_seconds: float, cpu_seconds: float) -> float:
+        """CPU seconds burned vs. what this job's share could have burned. 📈"""
+        if wall_seconds <= 0:
+            return 0.0
+        return cpu_seconds / (wall_seconds * self.per_job)
+
+    def report(self, wall_seconds: float, cpu_seconds: float):
+        self.logger.info(
+            f"🧮 CPU budget: {self.total_threads} threads / {self.concurrent_jobs} "
+            f"job(s) = {self.per_job} per job."
+        )
+        for lease in self.leases.values():
+            self.logger.info(
+                f"🧮   {lease.stage}: {lease.processes} process(es) x {lease.threads} threads"
+            )
+        self.logger.info(
+            f"📈 CPU utilization: {self.utilization(wall_seconds, cpu_seconds):.0%} of "
+            f"{self.per_job} threads ({cpu_seconds:.1f} CPU-s in {wall_seconds:.1f}s wall)."
+        )
@@ -1,9 +1,8 @@
+import dataclasses
 import os
-import torch
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import timedelta
-from pyannote.audio import Pipeline
-from src.domain.interfaces import IDiarizer, ILogger
+from src.domain.interfaces import IDiarizer, ILogger, ISpeakerIndex
 from src.infrastructure.logging import NullLogger
 from src.domain.entities import AudioArtifact
 from src.domain.value_objects import (
@@ -15,12 +14,43 @@ from src.domain.value_objects import (
 
 
 class PyannoteDiarizer(IDiarizer):
-    def __init__(self, logger: ILogger = NullLogger()):
+    """
+    torch and pyannote are imported inside the methods, so merely importing this
+    module (e.g. for NullDiarizer) costs nothing. 💤🏎️
+    """
+
+    def __init__(
+        self,
+        logger: ILogger = NullLogger(),
+        threads: int = None,
+        window_seconds: Optional[float] = None,
+        cluster_threshold: float = 0.7,
+        speaker_index: Optional[ISpeakerIndex] = None,
+        segmentation_batch_size: Optional[int] = None,
+        embedding_batch_size: Optional[int] = None,
+        inference_mode: bool = True,
+        quantize_embeddings: bool = False,
+    ):
+        import torch
+
         self.logger = logger
         self.pipeline = None
+        self.window_seconds = window_seconds
+        self.cluster_threshold = cluster_threshold
+        self.speaker_index = speaker_index
+        self.segmentation_batch_size = segmentation_batch_size
+        self.embedding_batch_size = embedding_batch_size
+        self.inference_mode = inference_mode
+        self.quantize_embeddings = quantize_embeddings
+        if threads:
+            # Intra-op threads come from the shared CPU budget, not torch's guess 🧮
+            torch.set_num_threads(threads)
         self._initialize_pipeline()
 
     def _initialize_pipeline(self):
+        import torch
+        from pyannote.audio import Pipeline
+
         token = os.environ.get("HF_TOKEN")
         if not token:
             raise ValueError(
@@ -38,12 +68,55 @@ class PyannoteDiarizer(IDiarizer):
                 self.logger.debug(
                     f"Pyannote 4.0 community-1 pipeline loaded on {device}!"
                 )
+                self._tune(device)
             else:
                 raise RuntimeError("Diarizer pipeline failed to load! 😱")
         except Exception as e:
             self.logger.error(f"Failed to load Pyannote pipeline: {str(e)}")
             raise
 
+    def _tune(self, device):
+        """Applies the CPU knobs: batch sizes and int8 embedding weights. 🎛️"""
+        import torch
+
+        for name in ("segmentation_batch_size", "embedding_batch_size"):
+            value = getattr(self, name)
+            if not value:
+                continue
+            if hasattr(self.pipeline, name):
+                setattr(self.pipeline, name, value)
+                self.logger.debug(f"🎛️ Pyannote {name} = {value}")
+            else:
+                self.logger.warning(
+                    f"⚠️ This Pyannote pipeline has no {name}; ignored."
+                )
+
+        if not self.quantize_embeddings:
+            return
+        embedding = getattr(self.pipeline, "_embedding", None)
+        model = getattr(embedding, "model_", None)
+        if device.type != "cpu" or model is None:
+            self.logger.warning(
+                "⚠️ int8 quantization needs the CPU and a torch embedding model; skipped."
+            )
+            return
+        # Dynamic quantization: int8 weights, activations quantized on the fly.
+        # Covers the Linear/LSTM layers; convolutions stay in float32. 🗜️
+        embedding.model_ = torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear, torch.nn.LSTM}, dtype=torch.qint8
+        )
+        self.logger.debug("🗜️ Embedding model dynamically quantized to int8.")
+
+    def _run_pipeline(self, audio_input, **kwargs):
+        """inference_mode skips autograd bookkeeping entirely - pure inference. 🏎️"""
+        if not self.inference_mode:
+            return self.pipeline(audio_input, **kwargs)
+
+        import torch
+
+        with torch.inference_mode():
+            return self.pipeline(audio_input, **kwargs)
+
     def diarize(
         self, audio: AudioArtifact, options: DiarizationOptions = None
     ) -> List[Utterance]:
@@ -65,26 +138,161 @@ class PyannoteDiarizer(IDiarizer):
         }
         kwargs = {k: v for k, v in options_map.items() if v is not None}
 
-        output = self.pipeline(audio.file_path, **kwargs)
-        diarization = output.speaker_diarization
-
-        turns = []
-        for segment, _, speaker in diarization.itertracks(yield_label=True):
-            turns.append(
-                Utterance(
-                    timestamp=TimestampRange(
-                        start=timedelta(seconds=segment.start),
-                        end=timedelta(seconds=segment.end),
-                    ),
-                    text="",
-                    speaker_id=speaker,
-                    confidence=ConfidenceScore(1.0),
-                )
+        if self.window_seconds:
+            turns, embeddings = self._diarize_windowed(audio, kwargs)
+        else:
+            output = self._run_pipeline(self._pipeline_input(audio), **kwargs)
+            diarization = output.speaker_diarization
+            turns = [
+                self._turn(segment.start, segment.end, speaker)
+                for segment, _, speaker in diarization.itertracks(yield_label=True)
+            ]
+            embeddings = dict(
+                zip(diarization.labels(), getattr(output, "speaker_embeddings", []))
             )
 
+        if self.speaker_index is not None:
+            turns = self._name_known_speakers(turns, embeddings)
+
         self.logger.debug(f"Diarization complete! Found {len(turns)} speaker turns.")
         return turns
 
+    def _diarize_windowed(
+        self, audio: AudioArtifact, kwargs: dict
+    ) -> Tuple[List[Utterance], Dict[str, Any]]:
+        """
+        Diarizes fixed-length windows (cut at quiet points) one at a time, then
+        clusters every window's speaker embeddings globally so speaker ids stay
+        consistent. Only one window's waveform and model activations are alive
+        at once, so peak memory follows the window length, not the recording. 🪟🧲
+        """
+        import numpy as np
+        import torch
+        from src.infrastructure.chunking import plan_chunks
+        from src.infrastructure.pcm import map_pcm16, to_float_waveform
+
+        samples = audio.pcm if audio.pcm is not None else map_pcm16(audio.file_path)
+        sample_rate = audio.sample_rate
+        windows = plan_chunks(
+            samples, sample_rate, self.window_seconds, overlap_seconds=0.0
+        )
+        # A single window may hear fewer speakers than the whole recording 🎧
+        max_speakers = kwargs.get("max_speakers") or kwargs.get("num_speakers")
+        window_kwargs = {"max_speakers": max_speakers} if max_speakers else {}
+
+        self.logger.info(
+            f"🪟 Diarizing {len(windows)} windows of ~{self.window_seconds:.0f}s..."
+        )
+        local_turns, keys, embeddings = [], [], []
+        for window in windows:
+            waveform = torch.from_numpy(
+                to_float_waveform(samples[window.start : window.stop])
+            )
+            output = self._run_pipeline(
+                {"waveform": waveform, "sample_rate": sample_rate}, **window_kwargs
+            )
+            diarization = output.speaker_diarization
+            for label, embedding in zip(
+                diarization.labels(), output.speaker_embeddings
+            ):
+                # Speakers with too little speech come back without an embedding 🫥
+                if np.isfinite(embedding).all():
+                    keys.append((window.index, label))
+                    embeddings.append(np.asarray(embedding))
+
+            shift = window.start / sample_rate
+            for segment, _, label in diarization.itertracks(yield_label=True):
+                local_turns.append(
+                    (segment.start + shift, segment.end + shift, (window.index, label))
+                )
+            del output, waveform
+
+        labels = self._cluster(np.array(embeddings), [k[0] for k in keys], kwargs)
+        global_ids = {key: f"SPEAKER_{label:02d}" for key, label in zip(keys, labels)}
+        self.logger.debug(
+            f"🧲 Clustered {len(keys)} window speakers into {len(set(labels))} speakers."
+        )
+        turns = [
+            self._turn(start, end, global_ids.get(key, "Unknown"))
+            for start, end, key in local_turns
+        ]
+        # A global speaker's voiceprint is the mean of its window embeddings 🧲
+        centroids = {
+            f"SPEAKER_{label:02d}": np.mean(
+                [e for e, l in zip(embeddings, labels) if l == label], axis=0
+            )
+            for label in set(labels)
+        }
+        return turns, centroids
+
+    def _name_known_speakers(
+        self, turns: List[Utterance], embeddings: Dict[str, Any]
+    ) -> List[Utterance]:
+        """Replaces anonymous cluster labels with enrolled speaker names. 🗂️🏷️"""
+        import numpy as np
+
+        labels = [label for label, e in embeddings.items() if np.isfinite(e).all()]
+        if not labels:
+            return turns
+        names = self.speaker_index.identify(np.stack([embeddings[l] for l in labels]))
+        renamed = {label: name for label, name in zip(labels, names) if name}
+        self.logger.info(
+            f"🗂️ Recognized {len(renamed)} of {len(labels)} speakers: "
+            f"{', '.join(f'{k} -> {v}' for k, v in renamed.items()) or 'none'}"
+        )
+        return [
+            dataclasses.replace(t, speaker_id=renamed.get(t.speaker_id, t.speaker_id))
+            for t in turns
+        ]
+
+    def _cluster(self, embeddings, groups: List[int], kwargs: dict):
+        from src.infrastructure.speaker_clustering import cluster_embeddings
+
+        labels = cluster_embeddings(
+            embeddings,
+            groups=groups,
+            num_clusters=kwargs.get("num_speakers"),
+            threshold=self.cluster_threshold,
+        )
+        found = len(set(labels))
+        # Respect speaker bounds the threshold alone would overshoot 🎯
+        if kwargs.get("max_speakers") and found > kwargs["max_speakers"]:
+            labels = cluster_embeddings(
+                embeddings, groups=groups, num_clusters=kwargs["max_speakers"]
+            )
+        elif kwargs.get("min_speakers") and found < kwargs["min_speakers"]:
+            labels = cluster_embeddings(
+                embeddings, groups=groups, num_clusters=kwargs["min_speakers"]
+            )
+        return labels
+
+    @staticmethod
+    def _turn(start: float, end: float, speaker: str) -> Utterance:
+        return Utterance(
+            timestamp=TimestampRange(
+                start=timedelta(seconds=start),
+                end=timedelta(seconds=end),
+            ),
+            text="",
+            speaker_id=speaker,
+            confidence=ConfidenceScore(1.0),
+        )
+
+    def _pipeline_input(self, audio: AudioArtifact):
+        """
+        Hands Pyannote the already-mapped samples when we have them, so it
+        doesn't open and decode the WAV a second time. 🗺️🏎️
+        """
+        if audio.pcm is None:
+            return audio.file_path
+
+        import torch
+        from src.infrastructure.pcm import to_float_waveform
+
+        # One float32 copy of the mapped samples; from_numpy wraps it without another
+        waveform = torch.from_numpy(to_float_waveform(audio.pcm))
+        return {"waveform": waveform, "sample_rate": audio.sample_rate}
+
 
 class NullDiarizer(IDiarizer):
     """
@@ -6,9 +6,13 @@ from src.domain.events import (
     JobFailed,
     EnrichmentStarted,
     PipelineStepTimed,
+    PipelineStepProfiled,
+    JobProfiled,
+    SpeechCompacted,
     DomainEvent,
 )
 from src.domain.interfaces import ILogger, IEventBus
+from src.domain.value_objects import StepProfile
 
 
 class LoggingEventHandler:
@@ -24,10 +28,13 @@ class LoggingEventHandler:
 
     def _subscribe_all(self):
         self.bus.subscribe(AudioIngested, self.handle_audio_ingested)
+        self.bus.subscribe(SpeechCompacted, self.handle_speech_compacted)
         self.bus.subscribe(SpeechTranscribed, self.handle_speech_transcribed)
         self.bus.subscribe(SpeakersIdentified, self.handle_speakers_identified)
         self.bus.subscribe(EnrichmentStarted, self.handle_enrichment_started)
         self.bus.subscribe(PipelineStepTimed, self.handle_step_timed)
+        self.bus.subscribe(PipelineStepProfiled, self.handle_step_profiled)
+        self.bus.subscribe(JobProfiled, self.handle_job_profiled)
         self.bus.subscribe(JobCompleted, self.handle_job_completed)
         self.bus.subscribe(JobFailed, self.handle_job_failed)
 
@@ -41,6 +48,16 @@ class LoggingEventHandler:
         tag = self._tag(event)
         self.logger.info(f"{tag} 📦 Ingested source: {event.source_path}")
 
+    def handle_speech_compacted(self, event: SpeechCompacted):
+        tag = self._tag(event)
+        skipped = event.original_seconds - event.speech_seconds
+        fraction = skipped / event.original_seconds if event.original_seconds else 0.0
+        self.logger.info(
+            f"{tag} 🔇 VAD kept {self._format_duration(event.speech_seconds)} of "
+            f"{self._format_duration(event.original_seconds)}: skipped {fraction:.1%} "
+            f"({self._format_duration(skipped)} never reaches ASR or diarization)."
+        )
+
     def handle_speech_transcribed(self, event: SpeechTranscribed):
         tag = self._tag(event)
         self.logger.info(
@@ -63,6 +80,39 @@ class LoggingEventHandler:
         duration_str = self._format_duration(event.duration_seconds)
         self.logger.info(f"{tag} ⏹️ Finished {event.step_name} in {duration_str}")
 
+    def handle_step_profiled(self, event: PipelineStepProfiled):
+        tag = self._tag(event)
+        self.logger.debug(f"{tag} 🔬 {self._describe_profile(event.profile)}")
+
+    def handle_job_profiled(self, event: JobProfiled):
+        """One line per step, slowest first, so the bottleneck tops the list. 📊"""
+        tag = self._tag(event)
+        total_wall = sum(p.wall_seconds for p in event.steps)
+        total_cpu = sum(p.total_cpu_seconds for p in event.steps)
+        self.logger.info(
+            f"{tag} 📊 Profile: {self._format_duration(total_wall)} wall, "
+            f"{total_cpu:.1f} CPU-s over {len(event.steps)} step(s)"
+        )
+        for profile in sorted(event.steps, key=lambda p: -p.wall_seconds):
+            share = profile.wall_seconds / total_wall if total_wall else 0.0
+            self.logger.info(
+                f"{tag} 📊   {share:>4.0%} {self._describe_profile(profile)}"
+            )
+
+    def _describe_profile(self, profile: StepProfile) -> str:
+        line = (
+            f"{profile.step_name}: {profile.bound}-bound, "
+            f"{self._format_duration(profile.wall_seconds)} wall, "
+            f"{profile.total_cpu_seconds:.1f} CPU-s "
+            f"({profile.child_cpu_seconds:.1f} in subprocesses, "
+            f"{profile.cpu_utilization:.0%}), peak RSS "
+            f"{self._format_bytes(profile.peak_rss_bytes)} "
+            f"(+{self._format_bytes(profile.rss_growth_bytes)})"
+        )
+        if profile.python_peak_bytes is not None:
+            line += f", Python peak {self._format_bytes(profile.python_peak_bytes)}"
+        return line
+
     def handle_job_completed(self, event: JobCompleted):
         tag = self._tag(event)
         self.logger.info(
@@ -87,3 +137,10 @@ class LoggingEventHandler:
         if secs > 0:
             return f"{secs}.{ms:03d}s"
         return f"{ms}ms"
+
+    def _format_bytes(self, size: int) -> str:
+        for unit in ("B", "KiB", "MiB"):
+            if size < 1024:
+                return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+            size /= 1024
+        return f"{size:.1f} GiB"
@@ -1,37 +1,77 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import os
 from src.domain.interfaces import (
     ITranscriber,
     IDiarizer,
     IAudioProcessor,
     IAudioEnricher,
+    IVoiceActivityDetector,
     ILogger,
     IAlignmentService,
     ITranslator,
+    ILinguisticAnnotationService,
+    ISpeakerIndex,
 )
-from src.domain.value_objects import LanguageTag
-from src.infrastructure.transcription import WhisperTranscriber, AzureFastTranscriber
+from src.domain.value_objects import AudioTranscript, LanguageTag
 from src.infrastructure.audio import FFmpegAudioProcessor
-from src.infrastructure.diarization import PyannoteDiarizer, NullDiarizer
-from src.infrastructure.llama_cpp_translation import LlamaCppTranslator
-from src.infrastructure.azure_inference_translation import AzureInferenceTranslator
+from src.infrastructure.backends import load_backend
+from src.infrastructure.cpu_budget import CpuBudget
 from src.application.services import MaxOverlapAlignmentService
 from src.application.enrichers.segmentation import SentenceSegmentationEnricher
 from src.application.enrichers.merging import TokenMergerEnricher
+from src.application.enrichers.fused import MergingSegmentationEnricher
 from src.application.enrichers.translation import TranslationEnricher
 from src.application.enrichers.annotation import LinguisticAnnotationEnricher
-from src.infrastructure.azure_inference_annotation import AzureInferenceAnnotationService
+from src.application.enrichers.incremental import IncrementalEnricher
+from src.infrastructure.repositories import FileSystemResultRepository
+from src.infrastructure.serialization import JsonTranscriptSerializer
+
+# 📼 Stand-ins for credentials when replaying a cassette offline: only URL
+# paths and request bodies are matched, so hosts and keys never matter.
+REPLAY_ENVIRONMENT = {
+    "AZURE_SPEECH_KEY": "replay",
+    "AZURE_SPEECH_REGION": "replay",
+    "AZURE_AI_INFERENCE_KEY": "replay",
+    "AZURE_AI_INFERENCE_ENDPOINT": "https://replay.invalid/chat/completions?api-version=replay",
+}
 
 
 class PipelineComponentFactory:
     """
     Composition Root Factory. 🏗️✨
     Encapsulates the construction logic for different pipeline stacks to remain OCP-compliant.
+    Adapters are resolved through the backend registry, so only the selected
+    stack's modules (and their heavy dependencies) are ever imported. 💤
     """
 
     def __init__(self, args, logger: ILogger):
         self.args = args
         self.logger = logger
+        # 🧮 Every stage's thread count comes from ONE shared budget
+        self.cpu_budget = CpuBudget(
+            total_threads=args.cpu_threads,
+            concurrent_jobs=args.parallel_jobs,
+            logger=logger,
+        )
+        # 📼 Optional record/replay of every external call (see cassette.py)
+        self.cassette = None
+        if args.record or args.replay:
+            self.cassette = load_backend("cassette")(
+                args.record or args.replay,
+                mode="record" if args.record else "replay",
+                replay_latency=args.replay_latency,
+                logger=logger,
+            )
+
+    @property
+    def replaying(self) -> bool:
+        return self.cassette is not None and not self.cassette.recording
+
+    def _env(self, name: str) -> Optional[str]:
+        value = os.environ.get(name)
+        if not value and self.replaying:
+            return REPLAY_ENVIRONMENT.get(name)
+        return value
 
     def build_components(
         self,
@@ -42,7 +82,14 @@ class PipelineComponentFactory:
         IAlignmentService,
         List[IAudioEnricher],
     ]:
-        audio_processor = FFmpegAudioProcessor()
+        audio_processor = FFmpegAudioProcessor(
+            # Normalized audio and everything derived from it stays out of
+            # the input and cache directories 📂
+            work_dir=os.path.join(self.args.output_dir, "temp"),
+            logger=self.logger,
+            cache_dir=self.args.audio_cache_dir,
+            map_pcm=self.args.in_memory_audio,
+        )
         alignment_service = MaxOverlapAlignmentService()
 
         if self.args.use_azure:
@@ -50,6 +97,13 @@ class PipelineComponentFactory:
         else:
             return self._build_local_stack(audio_processor, alignment_service)
 
+    def build_vad(self) -> Optional[IVoiceActivityDetector]:
+        """Optional silence-trimming pre-pass, shared by both stacks. 🔇"""
+        if not self.args.vad:
+            return None
+        self.logger.info("🔇 VAD enabled: silence is trimmed before ASR & diarization.")
+        return load_backend("energy-vad")(logger=self.logger)
+
     def _build_local_stack(self, audio_processor, alignment_service) -> Tuple[
         IAudioProcessor,
         ITranscriber,
@@ -59,17 +113,50 @@ class PipelineComponentFactory:
     ]:
         self.logger.info("🏠 Local Mode: Using Whisper & Pyannote.")
 
-        transcriber = WhisperTranscriber(
-            executable_path="/home/user/Documents/GitHub/whisper.cpp/build/bin/whisper-cli",
-            model_path="/home/user/Documents/GitHub/whisper.cpp/models/ggml-large-v3.bin",
-            logger=self.logger,
-        )
-        diarizer = PyannoteDiarizer(logger=self.logger)
+        chunked = self.args.whisper_workers > 1 and not self.args.whisper_server
+        whisper_threads = self.cpu_budget.lease(
+            "whisper",
+            processes=self.args.whisper_workers if chunked else 1,
+            requested=self.args.whisper_threads,
+        ).total
+
+        if self.args.whisper_server:
+            # Persistent server: ggml-large-v3 is loaded once, not per file 🖥️🔥
+            transcriber = load_backend("whisper-server")(
+                executable_path="/home/user/Documents/GitHub/whisper.cpp/build/bin/whisper-server",
+                model_path="/home/user/Documents/GitHub/whisper.cpp/models/ggml-large-v3.bin",
+                logger=self.logger,
+                columnar_words=self.args.columnar_words,
+                threads=whisper_threads,
+            )
+        else:
+            transcriber = load_backend("whisper-cli")(
+                executable_path="/home/user/Documents/GitHub/whisper.cpp/build/bin/whisper-cli",
+                model_path="/home/user/Documents/GitHub/whisper.cpp/models/ggml-large-v3.bin",
+                logger=self.logger,
+                columnar_words=self.args.columnar_words,
+                threads=whisper_threads,
+            )
+        if chunked:
+            # Long recordings: several whisper-cli processes in parallel 🧩🏎️
+            transcriber = load_backend("whisper-chunked")(
+                transcriber,
+                workers=self.args.whisper_workers,
+                chunk_seconds=self.args.chunk_seconds,
+                logger=self.logger,
+            )
+        diarizer = self._build_diarizer()
 
         enrichers = self._build_enrichers()
-        enrichers.insert(
-            1, TokenMergerEnricher()
-        )  # Local needs token merging for Whisper word-level data. 🧩
+        if self.args.fused_merge:
+            # One streaming pass does both jobs! ✂️🧩🏎️
+            enrichers[0] = MergingSegmentationEnricher(
+                max_duration_seconds=self.args.max_duration, logger=self.logger
+            )
+        else:
+            enrichers.insert(
+                1, TokenMergerEnricher()
+            )  # Local needs token merging for Whisper word-level data. 🧩
 
         return audio_processor, transcriber, diarizer, alignment_service, enrichers
 
@@ -82,19 +169,32 @@ class PipelineComponentFactory:
     ]:
         self.logger.info("☁️ Azure Mode: Using Fast Transcription & Null Diarizer!")
 
-        api_key = os.environ.get("AZURE_SPEECH_KEY")
-        region = os.environ.get("AZURE_SPEECH_REGION")
+        api_key = self._env("AZURE_SPEECH_KEY")
+        region = self._env("AZURE_SPEECH_REGION")
+        endpoint = self._env("AZURE_SPEECH_ENDPOINT")
 
-        if not api_key or not region:
+        if not api_key or not (region or endpoint):
             raise ValueError(
                 "❌ Missing AZURE_SPEECH_KEY or AZURE_SPEECH_REGION! "
                 "Cloud credentials are required for the Azure stack. 🛡️⚖️🏛️"
             )
 
-        transcriber = AzureFastTranscriber(
-            api_key=api_key, region=region, logger=self.logger
+        transcriber = load_backend("azure-fast")(
+            api_key=api_key,
+            region=region,
+            logger=self.logger,
+            upload_codec=self.args.azure_upload_codec,
+            endpoint=endpoint,
         )
-        diarizer = NullDiarizer(logger=self.logger)
+        if self.args.azure_workers > 1:
+            # Long recordings: overlapping chunks in flight at once ☁️🧩🏎️
+            transcriber = load_backend("azure-chunked")(
+                transcriber,
+                workers=self.args.azure_workers,
+                chunk_seconds=self.args.chunk_seconds,
+                logger=self.logger,
+            )
+        diarizer = load_backend("null-diarizer")(logger=self.logger)
 
         enrichers = (
             self._build_enrichers()
@@ -102,19 +202,51 @@ class PipelineComponentFactory:
 
         return audio_processor, transcriber, diarizer, alignment_service, enrichers
 
+    def _build_diarizer(self) -> IDiarizer:
+        if self.replaying:
+            # Recorded speaker turns: no Pyannote weights needed 📼
+            return load_backend("cassette-diarizer")(self.cassette, logger=self.logger)
+        diarizer = load_backend("pyannote")(
+            logger=self.logger,
+            threads=self.cpu_budget.lease("pyannote").threads,
+            window_seconds=self.args.diarization_window,
+            speaker_index=self._build_speaker_index(),
+            segmentation_batch_size=self.args.diarization_segmentation_batch,
+            embedding_batch_size=self.args.diarization_embedding_batch,
+            quantize_embeddings=self.args.quantize_diarization,
+        )
+        if self.cassette is not None:
+            diarizer = load_backend("cassette-diarizer")(
+                self.cassette, inner=diarizer, logger=self.logger
+            )
+        return diarizer
+
+    def _build_speaker_index(self) -> Optional[ISpeakerIndex]:
+        """Known voices turn SPEAKER_00 into a host's name across episodes. 🗂️🎙️"""
+        if not self.args.speaker_index:
+            return None
+        self.logger.info(f"🗂️ Naming known speakers from {self.args.speaker_index}")
+        return load_backend("numpy-speaker-index")(
+            self.args.speaker_index, logger=self.logger
+        )
+
     def _build_enrichers(self) -> List[IAudioEnricher]:
         translator = self._build_translator()
+        previous = self._load_previous_transcript()
 
         enrichers: List[IAudioEnricher] = [
             SentenceSegmentationEnricher(
                 max_duration_seconds=self.args.max_duration, logger=self.logger
             ),
-            TranslationEnricher(
-                translator=translator,
-                target_lang=LanguageTag(self.args.target_language),
-                context_size=self.args.translation_context,
-                batch_size=self.args.translation_batch,
-                logger=self.logger,
+            self._incremental(
+                TranslationEnricher(
+                    translator=translator,
+                    target_lang=LanguageTag(self.args.target_language),
+                    context_size=self.args.translation_context,
+                    batch_size=self.args.translation_batch,
+                    logger=self.logger,
+                ),
+                previous,
             ),
         ]
 
@@ -122,22 +254,49 @@ class PipelineComponentFactory:
         if self.args.use_azure:
             annotation_service = self._build_annotation_service()
             enrichers.append(
-                LinguisticAnnotationEnricher(
-                    annotation_service=annotation_service,
-                    batch_size=self.args.annotation_batch,
-                    context_size=self.args.annotation_context,
-                    logger=self.logger,
+                self._incremental(
+                    LinguisticAnnotationEnricher(
+                        annotation_service=annotation_service,
+                        batch_size=self.args.annotation_batch,
+                        context_size=self.args.annotation_context,
+                        logger=self.logger,
+                    ),
+                    previous,
                 )
             )
 
         return enrichers
 
+    def _incremental(
+        self, enricher: IAudioEnricher, previous: Optional[AudioTranscript]
+    ) -> IAudioEnricher:
+        """Wraps LLM enrichers so unchanged utterances reuse previous results. ♻️"""
+        if previous is None:
+            return enricher
+        return IncrementalEnricher(
+            enricher,
+            previous.utterances,
+            logger=self.logger,
+            previous_language=previous.target_language,
+            previous_output_language=previous.translation_language,
+        )
+
+    def _load_previous_transcript(self) -> Optional[AudioTranscript]:
+        """Loads the transcript of an earlier run for diff-aware re-enrichment. 📂♻️"""
+        path = self.args.previous_transcript
+        if not path:
+            return None
+
+        self.logger.info(f"♻️ Incremental mode: reusing results from {path}")
+        repo = FileSystemResultRepository(serializer=JsonTranscriptSerializer())
+        return repo.load(path, trusted=True)
+
     def _build_translator(self) -> ITranslator:
         """Constructs the translation component based on configuration. 🌍💎"""
         if self.args.use_azure:
             self.logger.info("☁️ Building Azure AI Foundry Translator.")
-            key = os.environ.get("AZURE_AI_INFERENCE_KEY")
-            endpoint = os.environ.get("AZURE_AI_INFERENCE_ENDPOINT")
+            key = self._env("AZURE_AI_INFERENCE_KEY")
+            endpoint = self._env("AZURE_AI_INFERENCE_ENDPOINT")
             if not key or not endpoint:
                 raise ValueError(
                     "❌ Missing AZURE_AI_INFERENCE_KEY or AZURE_AI_INFERENCE_ENDPOINT! "
@@ -150,23 +309,24 @@ class PipelineComponentFactory:
                     "Endpoint must be a full functional URL including '/chat/completions' and API version. 🛡️⚖️🏛️"
                 )
 
-            return AzureInferenceTranslator(
+            return load_backend("azure-inference-translator")(
                 api_key=key, endpoint=endpoint, logger=self.logger
             )
 
         # All-Local Mode
         self.logger.info("🏠 Building Local LlamaCpp Translator.")
-        return LlamaCppTranslator(
+        return load_backend("llama-cpp")(
             model_path="models/llama-3.1-8b-instruct-q4_k_m.gguf",
             executable_path="/home/user/Documents/GitHub/llama.cpp/build/bin/llama-cli",
             grammar_path="src/infrastructure/grammars/translation.gbnf",
+            threads=self.cpu_budget.lease("llama.cpp").threads,
             logger=self.logger,
         )
 
-    def _build_annotation_service(self) -> AzureInferenceAnnotationService:
+    def _build_annotation_service(self) -> ILinguisticAnnotationService:
         """Constructs the linguistic annotation service. 👩‍🏫🎓✨"""
-        key = os.environ.get("AZURE_AI_INFERENCE_KEY")
-        endpoint = os.environ.get("AZURE_AI_INFERENCE_ENDPOINT")
-        return AzureInferenceAnnotationService(
+        key = self._env("AZURE_AI_INFERENCE_KEY")
+        endpoint = self._env("AZURE_AI_INFERENCE_ENDPOINT")
+        return load_backend("azure-inference-annotation")(
             api_key=key, endpoint=endpoint, logger=self.logger
         )
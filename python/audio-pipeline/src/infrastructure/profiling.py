@@ -0,0 +1,89 @@
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from src.domain.interfaces import IStepProfiler
+from src.domain.value_objects import StepProfile
+
+try:
+    import resource
+except ImportError:  # Windows: no getrusage, peak RSS stays 0 🪟
+    resource = None
+
+# ru_maxrss is KiB on Linux but bytes on macOS 🍎
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+@dataclass(frozen=True)
+class _Sample:
+    wall: float
+    cpu: float
+    child_cpu: float
+    max_rss: int
+    child_max_rss: int
+
+
+def _max_rss(children: bool = False) -> int:
+    if resource is None:
+        return 0
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    return resource.getrusage(who).ru_maxrss * _MAXRSS_UNIT
+
+
+class ResourceStepProfiler(IStepProfiler):
+    """
+    Samples the process around each pipeline step with perf_counter, os.times()
+    and getrusage. 🔬📈
+    Child CPU only counts subprocesses that exited and were waited for
+    (whisper-cli, FFmpeg, llama-cli): a long-lived whisper-server or a remote
+    API shows up as waiting. The numbers are process-wide, so steps of jobs
+    running concurrently in one process bleed into each other.
+    With trace_python_memory, tracemalloc reports each step's peak of Python
+    allocations - at a noticeable cost for allocation-heavy Python steps.
+    """
+
+    def __init__(self, trace_python_memory: bool = False):
+        self.trace_python_memory = trace_python_memory
+        self._owns_tracing = False
+
+    def start(self) -> _Sample:
+        if self.trace_python_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owns_tracing = True
+            tracemalloc.reset_peak()
+        return self._sample()
+
+    def finish(self, step_name: str, started: _Sample) -> StepProfile:
+        ended = self._sample()
+        python_peak = None
+        if self.trace_python_memory and tracemalloc.is_tracing():
+            _, python_peak = tracemalloc.get_traced_memory()
+            if self._owns_tracing:
+                # Only trace inside steps; the gaps between them stay fast 🏎️
+                tracemalloc.stop()
+                self._owns_tracing = False
+        return StepProfile(
+            step_name=step_name,
+            wall_seconds=ended.wall - started.wall,
+            cpu_seconds=ended.cpu - started.cpu,
+            child_cpu_seconds=ended.child_cpu - started.child_cpu,
+            peak_rss_bytes=max(ended.max_rss, ended.child_max_rss),
+            # ru_maxrss is a high-water mark: growth means THIS step set a new one
+            rss_growth_bytes=max(
+                ended.max_rss - started.max_rss,
+                ended.child_max_rss - started.child_max_rss,
+            ),
+            python_peak_bytes=python_peak,
+        )
+
+    def _sample(self) -> _Sample:
+        times = os.times()
+        return _Sample(
+            wall=time.perf_counter(),
+            cpu=times.user + times.system,
+            child_cpu=times.children_user + times.children_system,
+            max_rss=_max_rss(),
+            child_max_rss=_max_rss(children=True),
+        )
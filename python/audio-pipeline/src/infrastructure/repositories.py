@@ -16,3 +16,9 @@ class FileSystemResultRepository(IResultRepository):
         content = self.serializer.serialize(transcript)
         with open(output_path, "w", encoding="utf-8") as f:
             f.write(content)
+
+    def load(self, input_path: str, trusted: bool = False) -> AudioTranscript:
+        """Loads a previously saved transcript from the specified local path. 📂💎"""
+        with open(input_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        return self.serializer.deserialize(content, trusted=trusted)
@@ -0,0 +1,24 @@
+import time
+from email.utils import parsedate_to_datetime
+
+
+def retry_after_seconds(response, default: float) -> float:
+    """
+    How long a throttled (429/503) response asks us to wait. 🚦
+    Honours Retry-After in seconds or as an HTTP date, and 'retry-after-ms'
+    as sent by Azure OpenAI; anything missing or unparsable means 'default'.
+    """
+    try:
+        headers = response.headers
+        milliseconds = headers.get("retry-after-ms")
+        if milliseconds is not None:
+            return max(0.0, float(milliseconds) / 1000)
+        value = headers.get("retry-after")
+        if value is None:
+            return default
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (AttributeError, TypeError, ValueError):
+        return default
@@ -1,14 +1,66 @@
 import json
+from collections.abc import Sequence
 from datetime import timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Callable, List, Optional
 from src.domain.value_objects import (
     AudioTranscript,
     Utterance,
     Word,
     TimestampRange,
     ConfidenceScore,
+    LanguageTag,
 )
 from src.domain.interfaces import ITranscriptSerializer
+from src.domain.word_store import WordView
+
+
+class LazyWordList(Sequence):
+    """
+    A read-only word list that keeps the raw JSON rows until someone actually
+    reads a word. Most re-enrichment runs never touch word timings! 💤🧩
+    """
+
+    __slots__ = ("_rows", "_words", "_factory")
+
+    def __init__(
+        self, rows: List[Dict[str, Any]], factory: Callable[[Dict[str, Any]], Word]
+    ):
+        self._rows = rows
+        self._words: Optional[List[Word]] = None
+        self._factory = factory
+
+    @property
+    def is_materialized(self) -> bool:
+        return self._words is not None
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Hands back the untouched JSON rows (only valid before materialization)."""
+        return self._rows
+
+    def _materialize(self) -> List[Word]:
+        if self._words is None:
+            self._words = [self._factory(row) for row in self._rows]
+        return self._words
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        return self._materialize()[index]
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return list(self) == list(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        state = "materialized" if self.is_materialized else "lazy"
+        return f"LazyWordList({len(self)} words, {state})"
 
 
 class JsonTranscriptSerializer(ITranscriptSerializer):
@@ -19,11 +71,33 @@ class JsonTranscriptSerializer(ITranscriptSerializer):
     def serialize(self, transcript: AudioTranscript) -> str:
         data = {
             "target_language": transcript.target_language,
+            "translation_language": transcript.translation_language,
             "total_duration": transcript.total_duration.total_seconds(),
             "utterances": [self._utterance_to_dict(u) for u in transcript.utterances],
         }
         return json.dumps(data, indent=2, ensure_ascii=False)
 
+    def deserialize(self, content: str, trusted: bool = False) -> AudioTranscript:
+        """
+        Rebuilds an AudioTranscript from our own JSON format. 📥💎
+        With 'trusted', words stay as raw rows until first access and the
+        O(words) range validation is skipped, so multi-hour files load fast.
+        """
+        data = json.loads(content)
+        build = (
+            self._trusted_utterance_from_dict if trusted else self._utterance_from_dict
+        )
+        target_language = data.get("target_language")
+        translation_language = data.get("translation_language")
+
+        return AudioTranscript(
+            utterances=[build(u) for u in data.get("utterances", [])],
+            target_language=LanguageTag(target_language) if target_language else None,
+            translation_language=(
+                LanguageTag(translation_language) if translation_language else None
+            ),
+        )
+
     def _utterance_to_dict(self, u: Utterance) -> Dict[str, Any]:
         return {
             "start": u.timestamp.start.total_seconds(),
@@ -33,9 +107,25 @@ class JsonTranscriptSerializer(ITranscriptSerializer):
             "translated_text": u.translated_text,
             "learner_notes": u.learner_notes,
             "confidence": float(u.confidence),
-            "words": [self._word_to_dict(w) for w in u.words],
+            "words": self._words_to_dicts(u.words),
         }
 
+    def _words_to_dicts(self, words) -> List[Dict[str, Any]]:
+        # Untouched lazy words round-trip as-is, no Word objects needed! 🏎️💨
+        if isinstance(words, LazyWordList) and not words.is_materialized:
+            return words.to_dicts()
+        if isinstance(words, WordView):
+            return [
+                {
+                    "start": start_ms / 1000,
+                    "end": end_ms / 1000,
+                    "text": text,
+                    "confidence": confidence,
+                }
+                for text, start_ms, end_ms, confidence in words.rows()
+            ]
+        return [self._word_to_dict(w) for w in words]
+
     def _word_to_dict(self, w: Word) -> Dict[str, Any]:
         return {
             "start": w.timestamp.start.total_seconds(),
@@ -43,3 +133,38 @@ class JsonTranscriptSerializer(ITranscriptSerializer):
             "text": w.text,
             "confidence": float(w.confidence),
         }
+
+    def _utterance_from_dict(self, data: Dict[str, Any]) -> Utterance:
+        return Utterance(
+            timestamp=self._range_from_dict(data),
+            text=data.get("text", ""),
+            speaker_id=data.get("speaker", "Unknown"),
+            confidence=ConfidenceScore(data.get("confidence", 1.0)),
+            words=[self._word_from_dict(w) for w in data.get("words", [])],
+            translated_text=data.get("translated_text"),
+            learner_notes=data.get("learner_notes"),
+        )
+
+    def _trusted_utterance_from_dict(self, data: Dict[str, Any]) -> Utterance:
+        return Utterance.trusted(
+            timestamp=self._range_from_dict(data),
+            text=data.get("text", ""),
+            speaker_id=data.get("speaker", "Unknown"),
+            confidence=ConfidenceScore(data.get("confidence", 1.0)),
+            words=LazyWordList(data.get("words", []), self._word_from_dict),
+            translated_text=data.get("translated_text"),
+            learner_notes=data.get("learner_notes"),
+        )
+
+    def _word_from_dict(self, data: Dict[str, Any]) -> Word:
+        return Word(
+            text=data.get("text", ""),
+            timestamp=self._range_from_dict(data),
+            confidence=ConfidenceScore(data.get("confidence", 1.0)),
+        )
+
+    def _range_from_dict(self, data: Dict[str, Any]) -> TimestampRange:
+        return TimestampRange(
+            start=timedelta(seconds=data.get("start", 0.0)),
+            end=timedelta(seconds=data.get("end", 0.0)),
+        )
@@ -0,0 +1,61 @@
+from typing import Optional, Sequence
+import numpy as np
+
+
+def cosine_distances(embeddings: np.ndarray) -> np.ndarray:
+    """Pairwise cosine distances (0 = same direction, 2 = opposite). 📐"""
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    unit = embeddings / np.maximum(norms, 1e-12)
+    return np.clip(1.0 - unit @ unit.T, 0.0, 2.0)
+
+
+def cluster_embeddings(
+    embeddings: np.ndarray,
+    groups: Optional[Sequence[int]] = None,
+    num_clusters: Optional[int] = None,
+    threshold: float = 0.7,
+) -> np.ndarray:
+    """
+    Average-linkage agglomerative clustering of speaker embeddings. 🧲
+    Merges the closest pair of clusters until 'num_clusters' remain or, if no
+    count is given, until the closest pair is farther apart than 'threshold'.
+    Embeddings sharing a 'groups' entry (e.g. two speakers of one diarization
+    window) are never merged - the window already told them apart.
+    Returns labels 0..k-1, numbered by first appearance.
+    """
+    n = len(embeddings)
+    if n == 0:
+        return np.zeros(0, dtype=int)
+
+    dist = cosine_distances(np.asarray(embeddings, dtype=np.float64))
+    if groups is not None:
+        groups = np.asarray(groups)
+        dist[groups[:, None] == groups[None, :]] = np.inf  # cannot-link 🚫🔗
+    np.fill_diagonal(dist, np.inf)
+
+    sizes = np.ones(n)
+    labels = np.arange(n)
+    clusters = n
+    while clusters > 1 and (num_clusters is None or clusters > num_clusters):
+        i, j = np.unravel_index(np.argmin(dist), dist.shape)
+        closest = dist[i, j]
+        if not np.isfinite(closest):
+            break  # Only cannot-link pairs left
+        if num_clusters is None and closest > threshold:
+            break
+
+        # Lance-Williams update: the average distance of the union, in place 🧮
+        merged = (sizes[i] * dist[i] + sizes[j] * dist[j]) / (sizes[i] + sizes[j])
+        dist[i, :] = merged
+        dist[:, i] = merged
+        dist[i, i] = np.inf
+        dist[j, :] = np.inf
+        dist[:, j] = np.inf
+        sizes[i] += sizes[j]
+        labels[labels == j] = i
+        clusters -= 1
+
+    _, first_seen, compact = np.unique(labels, return_index=True, return_inverse=True)
+    rank = np.empty(len(first_seen), dtype=int)
+    rank[np.argsort(first_seen)] = np.arange(len(first_seen))
+    return rank[compact]
@@ -0,0 +1,85 @@
+import os
+from typing import List, Optional
+import numpy as np
+from src.domain.interfaces import ISpeakerIndex, ILogger
+from src.infrastructure.logging import NullLogger
+
+
+class NumpySpeakerIndex(ISpeakerIndex):
+    """
+    Brute-force nearest-neighbour index of enrolled speaker embeddings, kept as
+    one L2-normalized matrix in an .npz file. 🗂️🎙️
+    A job's clusters are matched with ONE matrix product (clusters x enrolled),
+    which stays in the low milliseconds up to tens of thousands of voiceprints;
+    an ANN library can replace it behind ISpeakerIndex when that stops holding.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        threshold: float = 0.5,
+        logger: ILogger = NullLogger(),
+    ):
+        self.path = path
+        self.threshold = threshold  # Max cosine distance for a match 📏
+        self.logger = logger
+        self.names = np.zeros(0, dtype=str)
+        self.vectors = np.zeros((0, 0), dtype=np.float32)
+        if os.path.exists(path):
+            with np.load(path) as data:
+                self.names = data["names"]
+                self.vectors = data["vectors"]
+            self.logger.debug(
+                f"🗂️ Loaded {len(self.names)} voiceprints of "
+                f"{len(set(self.names.tolist()))} speakers from {path}"
+            )
+
+    def identify(self, embeddings) -> List[Optional[str]]:
+        queries = _normalize(np.atleast_2d(np.asarray(embeddings, dtype=np.float32)))
+        result: List[Optional[str]] = [None] * len(queries)
+        if len(self.names) == 0 or len(queries) == 0:
+            return result
+
+        distances = 1.0 - queries @ self.vectors.T  # The one vectorized query 🏎️
+        # Best voiceprint per (cluster, name), then greedy one-to-one by distance
+        candidates = []
+        for name in np.unique(self.names):
+            best = distances[:, self.names == name].min(axis=1)
+            candidates.extend((d, row, name) for row, d in enumerate(best.tolist()))
+
+        used = set()
+        for distance, row, name in sorted(candidates):
+            if distance > self.threshold:
+                break
+            if result[row] is None and name not in used:
+                result[row] = str(name)
+                used.add(name)
+        return result
+
+    def enroll(self, name: str, embedding):
+        vector = _normalize(np.atleast_2d(np.asarray(embedding, dtype=np.float32)))
+        if len(self.names) == 0:
+            self.vectors = vector
+        else:
+            self.vectors = np.concatenate([self.vectors, vector])
+        self.names = np.append(self.names, name)
+
+    def remove(self, name: str) -> int:
+        keep = self.names != name
+        removed = int((~keep).sum())
+        self.names, self.vectors = self.names[keep], self.vectors[keep]
+        return removed
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Write then rename, so readers never see a half-written index ⚛️
+        partial_path = f"{self.path}.{os.getpid()}.partial.npz"
+        np.savez(partial_path, names=self.names, vectors=self.vectors)
+        os.replace(partial_path, self.path)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return (vectors / np.maximum(norms, 1e-12)).astype(np.float32)
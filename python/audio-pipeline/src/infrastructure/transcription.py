@@ -1,11 +1,19 @@
+import atexit
+import dataclasses
 import subprocess
 import json
 import os
+import socket
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import httpx
-from typing import List
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from datetime import timedelta
 from src.domain.interfaces import ITranscriber, ILogger
 from src.infrastructure.logging import NullLogger
+from src.infrastructure.retry import retry_after_seconds
 from src.domain.entities import AudioArtifact
 from src.domain.value_objects import (
     Utterance,
@@ -14,15 +22,27 @@ from src.domain.value_objects import (
     ConfidenceScore,
     Word,
 )
+from src.domain.word_store import WordStore
+
+if TYPE_CHECKING:
+    from src.infrastructure.chunking import AudioChunk  # numpy only when chunking 💤
 
 
 class WhisperTranscriber(ITranscriber):
     def __init__(
-        self, executable_path: str, model_path: str, logger: ILogger = NullLogger()
+        self,
+        executable_path: str,
+        model_path: str,
+        logger: ILogger = NullLogger(),
+        columnar_words: bool = False,
+        threads: int = 8,
     ):
         self.executable_path = executable_path
         self.model_path = model_path
         self.logger = logger
+        # Store tokens in one shared WordStore instead of a Word object each 🗄️
+        self.columnar_words = columnar_words
+        self.threads = threads
 
     def transcribe(
         self, audio: AudioArtifact, language: LanguageTag
@@ -31,20 +51,26 @@ class WhisperTranscriber(ITranscriber):
         Runs whisper-cli and returns segments containing RAW tokens as words. 🎤🧩
         Precision starts here! Merging into words happens later in the pipeline. 🧼⚖️
         """
-        output_base = audio.file_path.rsplit(".", 1)[0]
+        data = self.run_whisper(audio.file_path, language, self.threads)
+        store = WordStore() if self.columnar_words else None
+        return self.parse_segments(data, store)
+
+    def run_whisper(self, wav_path: str, language: LanguageTag, threads: int) -> dict:
+        """Runs ONE whisper-cli process and returns its full JSON output. 🚀"""
+        output_base = wav_path.rsplit(".", 1)[0]
         command = [
             self.executable_path,
             "-m",
             self.model_path,
             "-f",
-            audio.file_path,
+            wav_path,
             "-l",
             str(language),
             "-ojf",
             "-of",
             output_base,
             "-t",
-            "8",
+            str(threads),
             "-sow",
         ]
 
@@ -62,8 +88,15 @@ class WhisperTranscriber(ITranscriber):
         json_path = f"{output_base}.json"
 
         with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+            return json.load(f)
 
+    def parse_segments(
+        self, data: dict, store: Optional[WordStore], offset_ms: int = 0
+    ) -> List[Utterance]:
+        """
+        Maps whisper-cli JSON to Utterances, shifting every time by 'offset_ms'
+        (where a chunk starts in the full recording). 🧭
+        """
         if not data or "transcription" not in data:
             return []
 
@@ -75,7 +108,7 @@ class WhisperTranscriber(ITranscriber):
 
             # Step 1: Collect ALL raw tokens from this segment.
             # We treat tokens as 'Words' for now so the pipeline can process them.
-            words = []
+            tokens = []
             for token in segment.get("tokens", []):
                 t_text = token.get("text", "")
 
@@ -84,29 +117,40 @@ class WhisperTranscriber(ITranscriber):
                     continue
 
                 t_offsets = token.get("offsets", {})
-                t_start = t_offsets.get("from", seg_start)
-                t_end = t_offsets.get("to", seg_end)
+                t_start = t_offsets.get("from", seg_start) + offset_ms
+                t_end = t_offsets.get("to", seg_end) + offset_ms
                 t_conf = token.get("p", 1.0)
 
-                words.append(
+                # KEEP RAW TEXT (including spaces) for later merging logic!
+                tokens.append((t_text, t_start, t_end, t_conf))
+
+            if not tokens:
+                continue
+
+            if store is not None:
+                begin = len(store)
+                for t_text, t_start, t_end, t_conf in tokens:
+                    store.append(t_text, t_start, t_end, t_conf)
+                words = store.view(begin, len(store))
+            else:
+                words = [
                     Word(
-                        text=t_text,  # KEEP RAW TEXT (including spaces) for later merging logic!
+                        text=t_text,
                         timestamp=TimestampRange(
                             start=timedelta(milliseconds=t_start),
                             end=timedelta(milliseconds=t_end),
                         ),
                         confidence=ConfidenceScore(t_conf),
                     )
-                )
-
-            if not words:
-                continue
+                    for t_text, t_start, t_end, t_conf in tokens
+                ]
 
             # Return the segment as an Utterance bounded by its tokens! 📏🎯
             utterances.append(
                 Utterance(
                     timestamp=TimestampRange(
-                        start=words[0].timestamp.start, end=words[-1].timestamp.end
+                        start=timedelta(milliseconds=tokens[0][1]),
+                        end=timedelta(milliseconds=tokens[-1][2]),
                     ),
                     text=segment.get("text", "").strip(),
                     speaker_id="Unknown",
@@ -118,6 +162,305 @@ class WhisperTranscriber(ITranscriber):
         return utterances
 
 
+class ChunkedWhisperTranscriber(ITranscriber):
+    """
+    Splits long recordings at quiet points and runs several whisper-cli
+    processes at once, dividing the thread budget among them. 🧩🏎️
+    Segments are shifted back to recording time, and each overlap region is
+    owned by exactly one chunk so nothing is transcribed twice in the output.
+    """
+
+    def __init__(
+        self,
+        whisper: WhisperTranscriber,
+        workers: int = 2,
+        chunk_seconds: float = 300.0,
+        overlap_seconds: float = 2.0,
+        logger: ILogger = NullLogger(),
+    ):
+        self.whisper = whisper
+        self.workers = workers
+        self.chunk_seconds = chunk_seconds
+        self.overlap_seconds = overlap_seconds
+        self.logger = logger
+
+    def transcribe(
+        self, audio: AudioArtifact, language: LanguageTag
+    ) -> List[Utterance]:
+        # numpy-backed helpers load only when chunking is actually used 💤
+        from src.infrastructure.chunking import plan_chunks
+        from src.infrastructure.pcm import map_pcm16, write_pcm16
+
+        samples = audio.pcm if audio.pcm is not None else map_pcm16(audio.file_path)
+        chunks = plan_chunks(
+            samples, audio.sample_rate, self.chunk_seconds, self.overlap_seconds
+        )
+        if len(chunks) == 1:
+            return self.whisper.transcribe(audio, language)
+
+        threads = max(1, self.whisper.threads // self.workers)
+        self.logger.info(
+            f"🧩 Transcribing {len(chunks)} chunks with {self.workers} Whisper "
+            f"processes x {threads} threads..."
+        )
+
+        with tempfile.TemporaryDirectory(
+            prefix="whisper_chunks_", dir=os.path.dirname(audio.file_path) or None
+        ) as chunk_dir:
+            paths = []
+            for chunk in chunks:
+                path = os.path.join(chunk_dir, f"chunk_{chunk.index:04d}.wav")
+                write_pcm16(
+                    path, [samples[chunk.start : chunk.stop]], audio.sample_rate
+                )
+                paths.append(path)
+
+            # Each worker thread just waits on its own whisper-cli process ⏳
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                outputs = list(
+                    pool.map(
+                        lambda path: self.whisper.run_whisper(path, language, threads),
+                        paths,
+                    )
+                )
+
+        return self._stitch(chunks, outputs, audio.sample_rate)
+
+    def _stitch(
+        self, chunks: List["AudioChunk"], outputs: List[dict], sample_rate: int
+    ) -> List[Utterance]:
+        """Shifts segments to recording time and keeps those the chunk owns. 🧵"""
+        store = WordStore() if self.whisper.columnar_words else None
+        utterances = []
+        for chunk, data in zip(chunks, outputs):
+            offset_ms = chunk.start * 1000 // sample_rate
+            for u in self.whisper.parse_segments(data, store, offset_ms):
+                midpoint = (u.timestamp.start + u.timestamp.end) / 2
+                if chunk.owns(midpoint.total_seconds() * sample_rate):
+                    utterances.append(u)
+        return utterances
+
+
+class WhisperServerTranscriber(WhisperTranscriber):
+    """
+    Talks to a persistent whisper.cpp server instead of spawning whisper-cli
+    per file, so the model is loaded ONCE and reused across jobs. 🖥️🏎️
+    The adapter spawns the server, waits until it is healthy, and restarts it
+    if it dies between requests.
+    """
+
+    def __init__(
+        self,
+        executable_path: str,
+        model_path: str,
+        logger: ILogger = NullLogger(),
+        columnar_words: bool = False,
+        threads: int = 8,
+        host: str = "127.0.0.1",
+        port: Optional[int] = None,
+        startup_timeout: float = 120.0,
+        request_timeout: float = 3600.0,
+    ):
+        super().__init__(
+            executable_path,
+            model_path,
+            logger=logger,
+            columnar_words=columnar_words,
+            threads=threads,
+        )
+        self.host = host
+        self.port = port
+        self.startup_timeout = startup_timeout
+        self.request_timeout = request_timeout
+        self.process: Optional[subprocess.Popen] = None
+        self._server_log = None
+        atexit.register(self.close)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def run_whisper(self, wav_path: str, language: LanguageTag, threads: int) -> dict:
+        """Same contract as whisper-cli, but one HTTP request to the warm server. 🔥"""
+        self._ensure_running()
+        try:
+            return self._post_inference(wav_path, language)
+        except httpx.TransportError as e:
+            # The server vanished mid-flight? Revive it and retry once 🚑
+            self.logger.warning(f"⚠️ Whisper server unreachable ({e}); restarting...")
+            self.close()
+            self._ensure_running()
+            return self._post_inference(wav_path, language)
+
+    def _post_inference(self, wav_path: str, language: LanguageTag) -> dict:
+        with open(wav_path, "rb") as f:
+            files = {"file": (os.path.basename(wav_path), f, "audio/wav")}
+            data = {"language": str(language), "response_format": "verbose_json"}
+            with httpx.Client(timeout=self.request_timeout) as client:
+                response = client.post(
+                    f"{self.base_url}/inference", files=files, data=data
+                )
+
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"Whisper server failed! Status: {response.status_code}, Error: {response.text}"
+            )
+
+        payload = response.json()
+        if "transcription" in payload:
+            return payload  # Already the whisper-cli full-JSON shape 🧩
+        return self._from_verbose_json(payload)
+
+    def _from_verbose_json(self, payload: dict) -> dict:
+        """Maps the server's OpenAI-style 'segments'/'words' onto the whisper-cli shape. 🔁"""
+        transcription = []
+        for segment in payload.get("segments", []):
+            transcription.append(
+                {
+                    "offsets": {
+                        "from": round(segment.get("start", 0) * 1000),
+                        "to": round(segment.get("end", 0) * 1000),
+                    },
+                    "text": segment.get("text", ""),
+                    "tokens": [
+                        {
+                            "text": word.get("word", ""),
+                            "offsets": {
+                                "from": round(word.get("start", 0) * 1000),
+                                "to": round(word.get("end", 0) * 1000),
+                            },
+                            "p": word.get("probability", 1.0),
+                        }
+                        for word in segment.get("words", [])
+                    ],
+                }
+            )
+        return {"transcription": transcription}
+
+    def _ensure_running(self):
+        if self.process is not None and self.process.poll() is None:
+            return
+        if self.process is not None:
+            self.logger.warning(
+                f"⚠️ Whisper server exited with code {self.process.returncode}; restarting..."
+            )
+            self.close()
+        self._start()
+
+    def _start(self):
+        self.port = self.port or self._free_port()
+        command = [
+            self.executable_path,
+            "-m",
+            self.model_path,
+            "--host",
+            self.host,
+            "--port",
+            str(self.port),
+            "-t",
+            str(self.threads),
+        ]
+        self.logger.info(f"🖥️ Starting Whisper server on {self.base_url}...")
+
+        # A file, not a pipe: the chatty server must never block on a full pipe 📝
+        self._server_log = tempfile.TemporaryFile(mode="w+")
+        try:
+            self.process = subprocess.Popen(
+                command, stdout=subprocess.DEVNULL, stderr=self._server_log, text=True
+            )
+        except FileNotFoundError:
+            raise RuntimeError(
+                f"Whisper server binary not found at {self.executable_path}! 🚫🔨"
+            )
+
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                self._server_log.seek(0)
+                stderr = self._server_log.read()[-2000:]
+                self.close()
+                raise RuntimeError(f"Whisper server died during startup! {stderr}")
+            if self._is_healthy():
+                self.logger.info("🖥️ Whisper server is up - model loaded once! 🔥")
+                return
+            time.sleep(0.1)
+
+        self.close()
+        raise RuntimeError(
+            f"Whisper server not healthy after {self.startup_timeout:.0f}s! ⏳"
+        )
+
+    def _is_healthy(self) -> bool:
+        try:
+            response = httpx.get(f"{self.base_url}/health", timeout=1.0)
+            return response.status_code == 200
+        except httpx.TransportError:
+            return False  # Still loading the model 🐢
+
+    def _free_port(self) -> int:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind((self.host, 0))
+            return sock.getsockname()[1]
+
+    def close(self):
+        """Stops the supervised server (also runs at interpreter exit). 🛑"""
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        self.process = None
+        if self._server_log is not None:
+            self._server_log.close()
+            self._server_log = None
+
+
+UNKNOWN_SPEAKER = "Unknown"
+# Exponential backoff between upload attempts stops growing here ⏳
+MAX_RETRY_DELAY_SECONDS = 60.0
+
+# codec -> (extension, content type, FFmpeg encoder args); all are accepted by
+# Fast Transcription. 🗜️
+UPLOAD_CODECS = {
+    "wav": ("wav", "audio/wav", []),
+    "flac": ("flac", "audio/flac", ["-c:a", "flac", "-compression_level", "8"]),
+    "opus": (
+        "ogg",
+        "audio/ogg",
+        ["-c:a", "libopus", "-b:a", "32k", "-application", "voip"],
+    ),
+}
+
+
+class _CountingReader:
+    """File wrapper that counts bytes handed to httpx and notes when it hit EOF. 📏"""
+
+    def __init__(self, file):
+        self.file = file
+        self.bytes_read = 0
+        self.finished_at: Optional[float] = None
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.file.read(size)
+        self.bytes_read += len(chunk)
+        if not chunk and self.finished_at is None:
+            self.finished_at = time.perf_counter()
+        return chunk
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        self.bytes_read = 0
+        self.finished_at = None
+        return self.file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self.file.tell()
+
+    def fileno(self) -> int:
+        return self.file.fileno()
+
+
 class AzureFastTranscriber(ITranscriber):
     """
     Azure AI Speech Fast Transcription implementation. 🎤☁️✨
@@ -129,15 +472,37 @@ class AzureFastTranscriber(ITranscriber):
         api_key: str,
         region: str,
         logger: ILogger = NullLogger(),
+        upload_codec: str = "wav",
+        endpoint: Optional[str] = None,
+        max_retries: int = 3,
+        retry_base_delay: float = 5.0,
     ):
+        if upload_codec not in UPLOAD_CODECS:
+            raise ValueError(
+                f"❌ Unknown upload codec '{upload_codec}'! Use one of: {', '.join(UPLOAD_CODECS)}"
+            )
         self.api_key = api_key
         self.region = region
         self.logger = logger
-        self.endpoint = f"https://{self.region}.api.cognitive.microsoft.com/speechtotext/transcriptions:transcribe?api-version=2025-10-15"
+        self.upload_codec = upload_codec
+        self.max_retries = max(1, max_retries)
+        self.retry_base_delay = retry_base_delay
+        # An explicit endpoint points the adapter at a proxy or a local fake 🎭
+        self.endpoint = (
+            endpoint
+            or f"https://{self.region}.api.cognitive.microsoft.com/speechtotext/transcriptions:transcribe?api-version=2025-10-15"
+        )
 
     def transcribe(
         self, audio: AudioArtifact, language: LanguageTag
     ) -> List[Utterance]:
+        data = self.request_transcription(audio.file_path, language)
+        # 🏛️ Enshrine the raw response as an intermediary artifact for forensic analysis! 💎✨
+        self.save_raw(audio.file_path, data)
+        return self._map_to_utterances(data)
+
+    def request_transcription(self, wav_path: str, language: LanguageTag) -> dict:
+        """Uploads one WAV and returns Azure's raw JSON response. ☁️"""
         definition = {
             "locales": [str(language)],
             "diarization": {"enabled": True},
@@ -146,26 +511,71 @@ class AzureFastTranscriber(ITranscriber):
             "model": "azure-speech",
         }
 
-        with open(audio.file_path, "rb") as f:
+        upload_path, content_type = self._prepare_upload(wav_path)
+        try:
+            for attempt in range(self.max_retries):
+                last_attempt = attempt == self.max_retries - 1
+                try:
+                    response = self._upload(upload_path, content_type, definition)
+                except httpx.TransportError as e:
+                    # Timed out or dropped: re-send just this file (or chunk) 🔌
+                    if last_attempt:
+                        raise
+                    delay = self._backoff(attempt)
+                    self.logger.warning(
+                        f"🔌 Azure Fast Transcription upload failed ({e.__class__.__name__}); "
+                        f"retrying in {delay:.1f}s..."
+                    )
+                    time.sleep(delay)
+                    continue
+                if response.status_code != 429 or last_attempt:
+                    break
+                # Throttled: wait as long as the service asks, then re-send 🚦
+                delay = retry_after_seconds(response, self._backoff(attempt))
+                self.logger.warning(
+                    f"🚦 Azure Fast Transcription throttled (429); retrying in {delay:.1f}s..."
+                )
+                time.sleep(delay)
+        finally:
+            if upload_path != wav_path and os.path.exists(upload_path):
+                os.remove(upload_path)
+
+        if response.status_code != 200:
+            error_msg = f"❌ Azure Fast Transcription failed! Status: {response.status_code}, Error: {response.text}"
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        return response.json()
+
+    def _backoff(self, attempt: int) -> float:
+        return min(self.retry_base_delay * (2**attempt), MAX_RETRY_DELAY_SECONDS)
+
+    def _upload(self, upload_path: str, content_type: str, definition: dict):
+        # httpx pulls the multipart body from the file in small chunks, so
+        # the recording is streamed from disk instead of held in memory 📤
+        with open(upload_path, "rb") as f:
+            reader = _CountingReader(f)
             files = {
-                "audio": (os.path.basename(audio.file_path), f, "audio/wav"),
+                "audio": (os.path.basename(upload_path), reader, content_type),
                 "definition": (None, json.dumps(definition), "application/json"),
             }
 
             headers = {"Ocp-Apim-Subscription-Key": self.api_key}
 
+            started = time.perf_counter()
             with httpx.Client(timeout=300.0) as client:
                 response = client.post(self.endpoint, headers=headers, files=files)
+            finished = time.perf_counter()
 
-        if response.status_code != 200:
-            error_msg = f"❌ Azure Fast Transcription failed! Status: {response.status_code}, Error: {response.text}"
-            self.logger.error(error_msg)
-            raise RuntimeError(error_msg)
-
-        data = response.json()
+        upload_seconds = (reader.finished_at or finished) - started
+        self.logger.info(
+            f"📤 Uploaded {reader.bytes_read / 2**20:.1f} MiB ({content_type}) in "
+            f"{upload_seconds:.1f}s; Azure answered after {finished - started:.1f}s."
+        )
+        return response
 
-        # 🏛️ Enshrine the raw response as an intermediary artifact for forensic analysis! 💎✨
-        raw_output_path = audio.file_path.rsplit(".", 1)[0] + ".azure.json"
+    def save_raw(self, wav_path: str, data: dict):
+        raw_output_path = wav_path.rsplit(".", 1)[0] + ".azure.json"
         try:
             with open(raw_output_path, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
@@ -175,18 +585,45 @@ class AzureFastTranscriber(ITranscriber):
         except Exception as e:
             self.logger.warning(f"⚠️ Failed to save raw Azure artifact: {e}")
 
-        return self._map_to_utterances(data)
+    def _prepare_upload(self, wav_path: str) -> Tuple[str, str]:
+        """
+        Transcodes the normalized WAV into the configured upload codec. 🗜️
+        FLAC is lossless at roughly half the size; Opus is a speech codec at a
+        small fraction of it. Falls back to the WAV if FFmpeg is unavailable.
+        """
+        extension, content_type, codec_args = UPLOAD_CODECS[self.upload_codec]
+        if not codec_args:
+            return wav_path, content_type
+
+        upload_path = f"{wav_path.rsplit('.', 1)[0]}.upload.{extension}"
+        command = ["ffmpeg", "-y", "-loglevel", "error", "-i", wav_path]
+        command += codec_args + [upload_path]
+        try:
+            result = subprocess.run(command, capture_output=True, text=True)
+        except FileNotFoundError:
+            result = None
+        if result is None or result.returncode != 0:
+            reason = result.stderr.strip() if result else "ffmpeg not found"
+            self.logger.warning(
+                f"⚠️ Could not encode {self.upload_codec} for upload ({reason}); sending WAV."
+            )
+            if os.path.exists(upload_path):
+                os.remove(upload_path)
+            return wav_path, UPLOAD_CODECS["wav"][1]
+        return upload_path, content_type
 
-    def _map_to_utterances(self, data: dict) -> List[Utterance]:
+    def _map_to_utterances(self, data: dict, shift_ms: int = 0) -> List[Utterance]:
+        """Maps 'phrases' to utterances; 'shift_ms' moves chunk time to recording time. 🧵"""
         utterances = []
         for phrase in data.get("phrases", []):
-            offset_ms = phrase.get("offsetMilliseconds", 0)
+            offset_ms = phrase.get("offsetMilliseconds", 0) + shift_ms
             duration_ms = phrase.get("durationMilliseconds", 0)
-            speaker_id = str(phrase.get("speaker", "Unknown"))
+            speaker_id = str(phrase.get("speaker", UNKNOWN_SPEAKER))
 
             words = []
             for word_data in phrase["words"]:
-                w_offset = word_data.get("offsetMilliseconds", offset_ms)
+                w_offset = word_data.get("offsetMilliseconds")
+                w_offset = offset_ms if w_offset is None else w_offset + shift_ms
                 w_duration = word_data.get("durationMilliseconds", 0)
                 words.append(
                     Word(
@@ -213,3 +650,151 @@ class AzureFastTranscriber(ITranscriber):
             )
 
         return utterances
+
+
+class ChunkedAzureTranscriber(ITranscriber):
+    """
+    Sends long recordings to Fast Transcription as overlapping chunks, all in
+    flight at once, so latency is bounded by the slowest chunk and a timeout
+    or dropped connection only re-sends that chunk (see AzureFastTranscriber's
+    max_retries) instead of the whole job. ☁️🧩🏎️
+    Azure numbers speakers per request, so labels are reconciled chunk by
+    chunk: the speakers talking in an overlap region are matched by how long
+    their phrases coincide there (max-overlap, like the alignment service).
+    ⚠️ Reconciliation is only as good as the overlaps: Azure returns no voice
+    features, so a speaker who is silent in an overlap cannot be recognized
+    in the next chunk and gets a NEW global id - one person may show up as
+    several speakers across a long recording. Each such split is logged.
+    """
+
+    def __init__(
+        self,
+        azure: AzureFastTranscriber,
+        workers: int = 4,
+        chunk_seconds: float = 300.0,
+        overlap_seconds: float = 15.0,
+        logger: ILogger = NullLogger(),
+    ):
+        self.azure = azure
+        self.workers = workers
+        self.chunk_seconds = chunk_seconds
+        self.overlap_seconds = overlap_seconds
+        self.logger = logger
+
+    def transcribe(
+        self, audio: AudioArtifact, language: LanguageTag
+    ) -> List[Utterance]:
+        from src.infrastructure.chunking import plan_chunks
+        from src.infrastructure.pcm import map_pcm16, write_pcm16
+
+        samples = audio.pcm if audio.pcm is not None else map_pcm16(audio.file_path)
+        chunks = plan_chunks(
+            samples, audio.sample_rate, self.chunk_seconds, self.overlap_seconds
+        )
+        if len(chunks) == 1:
+            return self.azure.transcribe(audio, language)
+
+        self.logger.info(
+            f"🧩 Sending {len(chunks)} chunks to Azure, {self.workers} at a time..."
+        )
+        with tempfile.TemporaryDirectory(
+            prefix="azure_chunks_", dir=os.path.dirname(audio.file_path) or None
+        ) as chunk_dir:
+            paths = []
+            for chunk in chunks:
+                path = os.path.join(chunk_dir, f"chunk_{chunk.index:04d}.wav")
+                write_pcm16(
+                    path, [samples[chunk.start : chunk.stop]], audio.sample_rate
+                )
+                paths.append(path)
+
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                outputs = list(
+                    pool.map(
+                        lambda path: self.azure.request_transcription(path, language),
+                        paths,
+                    )
+                )
+
+        self.azure.save_raw(
+            audio.file_path,
+            {
+                "chunks": [
+                    {
+                        "offsetMilliseconds": chunk.start * 1000 // audio.sample_rate,
+                        "response": data,
+                    }
+                    for chunk, data in zip(chunks, outputs)
+                ]
+            },
+        )
+        return self._stitch(chunks, outputs, audio.sample_rate)
+
+    def _stitch(
+        self, chunks: List["AudioChunk"], outputs: List[dict], sample_rate: int
+    ) -> List[Utterance]:
+        """Shifts phrases to recording time, relabels speakers, keeps owned phrases. 🧵🏷️"""
+        utterances: List[Utterance] = []
+        previous: List[Utterance] = []
+        next_id = 1
+        for chunk, data in zip(chunks, outputs):
+            local = self.azure._map_to_utterances(
+                data, shift_ms=chunk.start * 1000 // sample_rate
+            )
+            mapping = self._match_speakers(previous, local)
+            mapping[UNKNOWN_SPEAKER] = UNKNOWN_SPEAKER
+            for u in local:
+                if u.speaker_id not in mapping:
+                    mapping[u.speaker_id] = str(next_id)
+                    next_id += 1
+                    if chunk.index > 0:
+                        self.logger.warning(
+                            f"🏷️ Chunk {chunk.index}: speaker {u.speaker_id} was silent in "
+                            f"the overlap, so it became new speaker {next_id - 1} - it may "
+                            f"be someone heard in an earlier chunk."
+                        )
+
+            relabelled = [
+                dataclasses.replace(u, speaker_id=mapping[u.speaker_id]) for u in local
+            ]
+            for u in relabelled:
+                midpoint = (u.timestamp.start + u.timestamp.end) / 2
+                if chunk.owns(midpoint.total_seconds() * sample_rate):
+                    utterances.append(u)
+            previous = relabelled
+
+        self.logger.debug(
+            f"🏷️ Reconciled chunk speakers into {next_id - 1} global ids."
+        )
+        return utterances
+
+    def _match_speakers(
+        self, previous: List[Utterance], current: List[Utterance]
+    ) -> Dict[str, str]:
+        """
+        Maps this chunk's local labels onto the previous chunk's global ids.
+        Phrases can only coincide inside the overlap region, so the overlap
+        matrix is built from there alone; pairs are taken greedily by overlap. 🤝
+        """
+        overlap: Dict[Tuple[str, str], float] = defaultdict(float)
+        for cur in current:
+            for prev in previous:
+                seconds = (
+                    min(cur.timestamp.end, prev.timestamp.end)
+                    - max(cur.timestamp.start, prev.timestamp.start)
+                ).total_seconds()
+                if seconds > 0 and UNKNOWN_SPEAKER not in (
+                    cur.speaker_id,
+                    prev.speaker_id,
+                ):
+                    overlap[(cur.speaker_id, prev.speaker_id)] += seconds
+
+        mapping: Dict[str, str] = {}
+        taken = set()
+        for (local, global_id), _ in sorted(
+            overlap.items(), key=lambda item: item[1], reverse=True
+        ):
+            if local not in mapping and global_id not in taken:
+                mapping[local] = global_id
+                taken.add(global_id)
+        return mapping
@@ -0,0 +1,122 @@
+import os
+from datetime import timedelta
+from typing import List, Tuple
+import numpy as np
+from src.domain.interfaces import IVoiceActivityDetector, ILogger
+from src.infrastructure.logging import NullLogger
+from src.domain.entities import AudioArtifact
+from src.domain.value_objects import SpeechOffsetMap
+from src.infrastructure.pcm import map_pcm16, frame_mean_square, write_pcm16
+
+
+class EnergyVoiceActivityDetector(IVoiceActivityDetector):
+    """
+    Cheap frame-energy VAD: drops stretches of near-silence so Whisper and
+    Pyannote only see audio that can contain speech. 🔇✂️🏎️
+    Speech regions are padded so word onsets and trailing consonants survive.
+    """
+
+    def __init__(
+        self,
+        threshold_dbfs: float = -45.0,
+        frame_ms: int = 30,
+        min_silence_ms: int = 1000,
+        padding_ms: int = 250,
+        work_dir: str = None,
+        logger: ILogger = NullLogger(),
+    ):
+        self.threshold_dbfs = threshold_dbfs
+        self.frame_ms = frame_ms
+        self.min_silence_ms = min_silence_ms
+        self.padding_ms = padding_ms
+        self.work_dir = work_dir
+        self.logger = logger
+
+    def compact(self, audio: AudioArtifact) -> Tuple[AudioArtifact, SpeechOffsetMap]:
+        samples = audio.pcm if audio.pcm is not None else map_pcm16(audio.file_path)
+        sample_rate = audio.sample_rate
+        total = timedelta(seconds=len(samples) / sample_rate)
+
+        regions = self._speech_regions(samples, sample_rate)
+        if not regions:
+            self.logger.warning(
+                "🔇 VAD found no speech at all; keeping the full audio."
+            )
+            return audio, SpeechOffsetMap.identity(total)
+        if regions == [(0, len(samples))]:
+            self.logger.debug("🔇 VAD found no silence worth trimming.")
+            return audio, SpeechOffsetMap.identity(total)
+
+        output_path = self._output_path(audio.file_path)
+        written = write_pcm16(
+            output_path, (samples[start:stop] for start, stop in regions), sample_rate
+        )
+
+        compacted_starts, original_starts = [], []
+        position = 0
+        for start, stop in regions:
+            compacted_starts.append(timedelta(seconds=position / sample_rate))
+            original_starts.append(timedelta(seconds=start / sample_rate))
+            position += stop - start
+
+        offset_map = SpeechOffsetMap(
+            compacted_starts=tuple(compacted_starts),
+            original_starts=tuple(original_starts),
+            original_duration=total,
+            speech_duration=timedelta(seconds=written / sample_rate),
+        )
+        self.logger.debug(
+            f"🔇 Kept {len(regions)} speech regions ({offset_map.speech_duration} of {total})."
+        )
+
+        compacted = AudioArtifact(
+            file_path=output_path, format="wav", sample_rate=sample_rate
+        )
+        if audio.pcm is not None:
+            compacted.pcm = map_pcm16(output_path)  # Keep the in-memory fast path 🗺️
+        return compacted, offset_map
+
+    def _speech_regions(
+        self, samples: np.ndarray, sample_rate: int
+    ) -> List[Tuple[int, int]]:
+        """[start, stop) sample ranges of padded speech, short pauses bridged. 🌉"""
+        frame = sample_rate * self.frame_ms // 1000
+        is_speech = self._loud_frames(samples, frame)
+        if not is_speech.any():
+            return []
+
+        # Run boundaries: +1 where speech starts, -1 where it stops 📈📉
+        edges = np.diff(np.concatenate(([0], is_speech.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        stops = np.flatnonzero(edges == -1)
+
+        pad = sample_rate * self.padding_ms // 1000
+        min_gap = sample_rate * self.min_silence_ms // 1000
+        last_frame_stop = len(is_speech)
+
+        regions = []
+        for start_f, stop_f in zip(starts, stops):
+            start = max(0, int(start_f) * frame - pad)
+            # Speech up to the final frame keeps the partial tail frame too 🧷
+            stop = (
+                len(samples)
+                if stop_f == last_frame_stop
+                else min(len(samples), int(stop_f) * frame + pad)
+            )
+            if regions and start - regions[-1][1] < min_gap:
+                regions[-1] = (regions[-1][0], stop)
+            else:
+                regions.append((start, stop))
+        return regions
+
+    def _loud_frames(self, samples: np.ndarray, frame: int) -> np.ndarray:
+        """Frames whose RMS is above the dBFS threshold. 🔊"""
+        # Compare mean squares instead of taking sqrt/log of every frame 🧮
+        threshold = (32768.0 * 10 ** (self.threshold_dbfs / 20)) ** 2
+        return frame_mean_square(samples, frame) > threshold
+
+    def _output_path(self, source_path: str) -> str:
+        filename = os.path.basename(source_path).rsplit(".", 1)[0] + "_speech.wav"
+        if self.work_dir:
+            os.makedirs(self.work_dir, exist_ok=True)
+        return os.path.join(self.work_dir or os.path.dirname(source_path), filename)
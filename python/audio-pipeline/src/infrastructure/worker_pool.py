@@ -0,0 +1,234 @@
+import gc
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from multiprocessing import Pipe
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from src.domain.interfaces import ILogger
+from src.infrastructure.logging import NullLogger
+
+
+@dataclass
+class _Worker:
+    pid: int
+    conn: Connection
+    served: int = 0
+    idle_since: float = field(default_factory=time.monotonic)
+    job: Optional[int] = None
+
+
+class PreforkWorkerPool:
+    """
+    Fork-after-load worker pool. 🍴🧠
+    Whatever the parent built BEFORE the first fork (e.g. the Pyannote pipeline)
+    is shared copy-on-write by every worker instead of loaded once per process.
+    gc.freeze() moves those objects out of the collector's reach, so worker GC
+    passes don't write to (and thereby copy) the shared pages.
+    Workers are forked lazily, retired after 'max_jobs_per_worker' jobs and
+    reaped when idle longer than 'idle_seconds'; all recycling is driven by the
+    parent, so a job can never be sent to a worker that is about to quit.
+    Idle reaping runs inside map() - including while the last slow jobs of a
+    batch finish - and on reap_idle(). There is no timer thread (a thread alive
+    at fork() time is unsafe), so between batches call reap_idle() yourself.
+    Fork before any inference has run: threads of an already-used OpenMP pool
+    do not survive fork().
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Any], Any],
+        workers: int = 2,
+        max_jobs_per_worker: Optional[int] = None,
+        idle_seconds: float = 300.0,
+        on_worker_exit: Optional[Callable[[], None]] = None,
+        logger: ILogger = NullLogger(),
+    ):
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.idle_seconds = idle_seconds
+        self.on_worker_exit = on_worker_exit
+        self.logger = logger
+        self._pool: Dict[int, _Worker] = {}
+        self._frozen = False
+
+    def map(self, payloads: Iterable[Any]) -> List[Any]:
+        """Runs handler(payload) in the workers; results come back in input order. 🔁"""
+        pending = deque(enumerate(payloads))
+        results: List[Any] = [None] * len(pending)
+        failures = []
+
+        while pending or any(w.job is not None for w in self._pool.values()):
+            self.reap_idle()
+            while pending:
+                worker = self._idle_worker() or self._spawn()
+                if worker is None:
+                    break
+                index, payload = pending.popleft()
+                worker.job = index
+                worker.conn.send(payload)
+
+            busy = {w.conn: w for w in self._pool.values() if w.job is not None}
+            # Wake up when an idle worker is due, not only when a job finishes ⏰
+            for conn in wait(list(busy), timeout=self._until_next_idle_deadline()):
+                worker = busy[conn]
+                try:
+                    ok, value = conn.recv()
+                except EOFError:
+                    ok, value = False, f"worker {worker.pid} died"
+                    self._retire(worker, graceful=False)
+                if ok:
+                    results[worker.job] = value
+                else:
+                    failures.append(f"job {worker.job}: {value}")
+                worker.job = None
+                worker.served += 1
+                worker.idle_since = time.monotonic()
+                if (
+                    self.max_jobs_per_worker
+                    and worker.served >= self.max_jobs_per_worker
+                    and worker.pid in self._pool
+                ):
+                    self._retire(worker)
+
+        if failures:
+            raise RuntimeError(
+                f"❌ {len(failures)} job(s) failed: {'; '.join(failures)}"
+            )
+        return results
+
+    def memory_report(self) -> List[Dict[str, int]]:
+        """
+        Per-worker memory from /proc/<pid>/smaps_rollup (Linux), in KiB. 📊
+        RSS counts shared pages in full; PSS splits them among the sharers, so
+        PSS well below RSS means the model weights really are shared.
+        """
+        report = []
+        for pid in self._pool:
+            stats = smaps_rollup(pid)
+            if stats:
+                report.append({"pid": pid, **stats})
+        return report
+
+    def log_memory(self):
+        for stats in self.memory_report():
+            self.logger.info(
+                f"📊 Worker {stats['pid']}: RSS {stats['rss'] / 1024:.0f} MiB, "
+                f"PSS {stats['pss'] / 1024:.0f} MiB, "
+                f"private {stats['private'] / 1024:.0f} MiB"
+            )
+
+    def close(self):
+        for worker in list(self._pool.values()):
+            self._retire(worker)
+        if self._frozen:
+            gc.unfreeze()
+            self._frozen = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _idle_worker(self) -> Optional[_Worker]:
+        for worker in self._pool.values():
+            if worker.job is None:
+                return worker
+        return None
+
+    def _spawn(self) -> Optional[_Worker]:
+        if len(self._pool) >= self.workers:
+            return None
+        if not self._frozen:
+            gc.collect()
+            gc.freeze()  # Everything loaded so far stays untouched by worker GC 🧊
+            self._frozen = True
+
+        parent_conn, child_conn = Pipe()
+        pid = os.fork()
+        if pid == 0:  # 👶 Worker
+            parent_conn.close()
+            for other in self._pool.values():
+                other.conn.close()
+            self._worker_loop(child_conn)
+
+        child_conn.close()
+        worker = _Worker(pid=pid, conn=parent_conn)
+        self._pool[pid] = worker
+        self.logger.debug(f"🍴 Forked worker {pid}")
+        return worker
+
+    def _worker_loop(self, conn: Connection):
+        code = 0
+        try:
+            while True:
+                payload = conn.recv()
+                if payload is None:
+                    break
+                try:
+                    conn.send((True, self.handler(payload)))
+                except Exception as e:
+                    conn.send((False, f"{type(e).__name__}: {e}"))
+        except (EOFError, KeyboardInterrupt):
+            pass
+        except BaseException:
+            code = 1
+        finally:
+            try:
+                if self.on_worker_exit:
+                    self.on_worker_exit()
+            finally:
+                # Never return into the parent's stack (or run its atexit hooks) 🚪
+                os._exit(code)
+
+    def _until_next_idle_deadline(self) -> Optional[float]:
+        deadlines = [
+            w.idle_since + self.idle_seconds
+            for w in self._pool.values()
+            if w.job is None
+        ]
+        if not deadlines:
+            return None
+        # Just past the deadline: reap_idle() wants idle time > idle_seconds
+        return max(0.0, min(deadlines) - time.monotonic()) + 0.01
+
+    def reap_idle(self):
+        """Retires workers idle longer than 'idle_seconds'. ♻️"""
+        now = time.monotonic()
+        for worker in list(self._pool.values()):
+            if worker.job is None and now - worker.idle_since > self.idle_seconds:
+                self.logger.debug(f"♻️ Recycling idle worker {worker.pid}")
+                self._retire(worker)
+
+    def _retire(self, worker: _Worker, graceful: bool = True):
+        if graceful:
+            try:
+                worker.conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        worker.conn.close()
+        try:
+            os.waitpid(worker.pid, 0)
+        except ChildProcessError:
+            pass
+        self._pool.pop(worker.pid, None)
+
+
+def smaps_rollup(pid: int) -> Optional[Dict[str, int]]:
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", "r") as f:
+            fields = {
+                key: int(value.split()[0])
+                for key, value in (line.split(":", 1) for line in f if ":" in line)
+                if value.strip().endswith("kB")
+            }
+    except (OSError, ValueError):
+        return None
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "private": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
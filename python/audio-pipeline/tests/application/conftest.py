@@ -0,0 +1,56 @@
+import json
+import os
+import pytest
+from datetime import timedelta
+from src.domain.value_objects import Utterance, Word, TimestampRange, ConfidenceScore
+
+
+@pytest.fixture
+def raw_utterances():
+    """Fixture to load raw Whisper JSON data using LOOSE segment bounds. 🏗️📉"""
+    json_path = os.path.join(os.path.dirname(__file__), "../data/test_30s_raw.json")
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    utterances = []
+    for segment in data.get("transcription", []):
+        offsets = segment.get("offsets", {})
+        seg_start = offsets.get("from", 0)
+        seg_end = offsets.get("to", 0)
+
+        words = []
+        for token in segment.get("tokens", []):
+            t_text = token.get("text", "")
+            if not t_text or t_text.strip().startswith("[_"):
+                continue
+
+            t_offsets = token.get("offsets", {})
+            t_start = t_offsets.get("from", seg_start)
+            t_end = t_offsets.get("to", seg_end)
+            t_p = token.get("p", 1.0)
+
+            words.append(
+                Word(
+                    text=t_text,
+                    timestamp=TimestampRange(
+                        timedelta(milliseconds=t_start), timedelta(milliseconds=t_end)
+                    ),
+                    confidence=ConfidenceScore(t_p),
+                )
+            )
+
+        if words:
+            # Load with the original LOOSE segment bounds 🌬️🚫
+            utterances.append(
+                Utterance(
+                    timestamp=TimestampRange(
+                        timedelta(milliseconds=seg_start),
+                        timedelta(milliseconds=seg_end),
+                    ),
+                    text=segment.get("text", "").strip(),
+                    speaker_id="SPEAKER_00",
+                    confidence=ConfidenceScore(1.0),
+                    words=words,
+                )
+            )
+    return utterances
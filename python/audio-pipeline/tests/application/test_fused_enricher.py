@@ -0,0 +1,45 @@
+import dataclasses
+import pytest
+from src.application.enrichers import (
+    SentenceSegmentationEnricher,
+    TokenMergerEnricher,
+    MergingSegmentationEnricher,
+)
+from src.domain.value_objects import LanguageTag
+from src.domain.word_store import WordStore, WordView
+
+
+def two_pass(utterances, threshold):
+    """The classic local chain: Segmentation first, then TokenMerger. ✂️ -> 🧩"""
+    segmented = SentenceSegmentationEnricher(threshold).enrich(
+        utterances, LanguageTag("de")
+    )
+    return TokenMergerEnricher().enrich(segmented, LanguageTag("de"))
+
+
+@pytest.mark.parametrize("threshold", [1.0, 3.0, 5.0, 12.0, 100.0])
+def test_fused_enricher_matches_two_pass_chain(raw_utterances, threshold):
+    """Regression: one fused pass == Segmentation -> TokenMerger, row for row. 🎯"""
+    expected = two_pass(raw_utterances, threshold)
+    actual = MergingSegmentationEnricher(threshold).enrich(
+        raw_utterances, LanguageTag("de")
+    )
+
+    assert actual == expected
+
+
+@pytest.mark.parametrize("threshold", [3.0, 100.0])
+def test_fused_enricher_matches_two_pass_chain_on_columnar_words(
+    raw_utterances, threshold
+):
+    """Same equivalence when Whisper tokens live in a WordStore. 🗄️🎯"""
+    store = WordStore()
+    columnar = [
+        dataclasses.replace(u, words=store.extend(u.words)) for u in raw_utterances
+    ]
+
+    expected = two_pass(columnar, threshold)
+    actual = MergingSegmentationEnricher(threshold).enrich(columnar, LanguageTag("de"))
+
+    assert all(isinstance(u.words, WordView) for u in actual)
+    assert actual == expected
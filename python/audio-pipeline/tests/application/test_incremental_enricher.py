@@ -0,0 +1,190 @@
+import dataclasses
+from datetime import timedelta
+from src.application.enrichers.incremental import IncrementalEnricher
+from src.application.enrichers.translation import TranslationEnricher
+from src.application.enrichers.annotation import LinguisticAnnotationEnricher
+from src.domain.interfaces import ITranslator, ILinguisticAnnotationService
+from src.domain.value_objects import (
+    Utterance,
+    TimestampRange,
+    ConfidenceScore,
+    LanguageTag,
+)
+
+
+def create_utterances(texts):
+    return [
+        Utterance(
+            TimestampRange(timedelta(seconds=i), timedelta(seconds=i + 1)),
+            text,
+            "SPK1",
+            ConfidenceScore(1.0),
+        )
+        for i, text in enumerate(texts)
+    ]
+
+
+def build_translation_enricher(mocker, context_size=1, batch_size=1):
+    translator = mocker.Mock(spec=ITranslator)
+    translator.translate.side_effect = (
+        lambda texts, source_lang, target_lang, context=None: [f"T_{t}" for t in texts]
+    )
+    enricher = TranslationEnricher(
+        translator=translator,
+        target_lang=LanguageTag("en"),
+        batch_size=batch_size,
+        context_size=context_size,
+    )
+    return enricher, translator
+
+
+def test_incremental_translation_reuses_unchanged_utterances(mocker):
+    """
+    Verifies that only utterances whose text or context window changed are
+    sent to the translator again. ♻️🎯
+    """
+    # Arrange: A previous run translated four lines...
+    enricher, translator = build_translation_enricher(mocker, context_size=1)
+    previous = enricher.enrich(
+        create_utterances(["A", "B", "C", "D"]), LanguageTag("de")
+    )
+    translator.translate.reset_mock()
+
+    # ...then line 'B' was hand-corrected to 'B2'.
+    current = create_utterances(["A", "B2", "C", "D"])
+    incremental = IncrementalEnricher(enricher, previous)
+
+    # Act
+    result = incremental.enrich(current, LanguageTag("de"))
+
+    # Assert: 'B2' changed, and 'C' sees 'B2' in its context window! 🪟
+    translated = [call.args[0] for call in translator.translate.call_args_list]
+    assert translated == [["B2"], ["C"]]
+    assert [u.translated_text for u in result] == ["T_A", "T_B2", "T_C", "T_D"]
+    assert [u.text for u in result] == ["A", "B2", "C", "D"]
+
+
+def test_incremental_translation_retries_previous_failures(mocker):
+    """Verifies that empty (failed) translations are never carried over. 🔄🛡️"""
+    enricher, translator = build_translation_enricher(mocker, context_size=0)
+    previous = [
+        dataclasses.replace(u, translated_text=t)
+        for u, t in zip(create_utterances(["A", "B"]), ["T_A", ""])
+    ]
+
+    result = IncrementalEnricher(enricher, previous).enrich(
+        create_utterances(["A", "B"]), LanguageTag("de")
+    )
+
+    assert [call.args[0] for call in translator.translate.call_args_list] == [["B"]]
+    assert [u.translated_text for u in result] == ["T_A", "T_B"]
+
+
+def test_incremental_annotation_tracks_following_context(mocker):
+    """
+    Verifies that annotation fingerprints include FUTURE context, so editing a
+    line also refreshes the note of the line before it. 🏔️🎓
+    """
+    # Arrange
+    service = mocker.Mock(spec=ILinguisticAnnotationService)
+    service.annotate.side_effect = lambda texts, language, context=None: [
+        f"N_{t}" for t in texts
+    ]
+    enricher = LinguisticAnnotationEnricher(
+        annotation_service=service, batch_size=1, context_size=1
+    )
+    previous = enricher.enrich(create_utterances(["A", "B", "C"]), LanguageTag("de"))
+    service.annotate.reset_mock()
+
+    # Act
+    result = IncrementalEnricher(enricher, previous).enrich(
+        create_utterances(["A", "B", "C2"]), LanguageTag("de")
+    )
+
+    # Assert
+    annotated = [call.kwargs["texts"] for call in service.annotate.call_args_list]
+    assert annotated == [["B"], ["C2"]]
+    assert [u.learner_notes for u in result] == ["N_A", "N_B", "N_C2"]
+
+
+def test_incremental_translation_fingerprints_whole_batches(mocker):
+    """
+    With batches, an utterance's translation depends on every text in its
+    request: an edit re-runs the whole batch, an insert every shifted one. 📦
+    """
+    enricher, translator = build_translation_enricher(
+        mocker, context_size=0, batch_size=2
+    )
+    previous = enricher.enrich(
+        create_utterances(["A", "B", "C", "D"]), LanguageTag("de")
+    )
+    translator.translate.reset_mock()
+
+    # 'A' is unchanged but shares its request with the edited 'B'
+    IncrementalEnricher(enricher, previous).enrich(
+        create_utterances(["A", "B2", "C", "D"]), LanguageTag("de")
+    )
+    assert [c.args[0] for c in translator.translate.call_args_list] == [["A", "B2"]]
+    translator.translate.reset_mock()
+
+    # An insert moves 'C' and 'D' into different batches
+    IncrementalEnricher(enricher, previous).enrich(
+        create_utterances(["A", "B", "X", "C", "D"]), LanguageTag("de")
+    )
+    assert [c.args[0] for c in translator.translate.call_args_list] == [
+        ["X", "C"],
+        ["D"],
+    ]
+
+
+def test_incremental_enrichment_is_keyed_on_the_language(mocker):
+    """A transcript re-run as another spoken language reuses nothing. 🌍"""
+    enricher, translator = build_translation_enricher(mocker, context_size=0)
+    previous = enricher.enrich(create_utterances(["A", "B"]), LanguageTag("de"))
+    translator.translate.reset_mock()
+
+    IncrementalEnricher(enricher, previous, previous_language=LanguageTag("de")).enrich(
+        create_utterances(["A", "B"]), LanguageTag("nl")
+    )
+
+    assert translator.translate.call_count == 2
+
+
+def test_incremental_annotation_batch_sees_context_after_its_last_member(mocker):
+    """'A' is annotated in one request with 'B', so an edit right after 'B' counts. 🏔️"""
+    service = mocker.Mock(spec=ILinguisticAnnotationService)
+    service.annotate.side_effect = lambda texts, language, context=None: [
+        f"N_{t}" for t in texts
+    ]
+    enricher = LinguisticAnnotationEnricher(
+        annotation_service=service, batch_size=2, context_size=1
+    )
+    previous = enricher.enrich(
+        create_utterances(["A", "B", "C", "D"]), LanguageTag("de")
+    )
+    service.annotate.reset_mock()
+
+    IncrementalEnricher(enricher, previous).enrich(
+        create_utterances(["A", "B", "C2", "D"]), LanguageTag("de")
+    )
+
+    annotated = [call.kwargs["texts"] for call in service.annotate.call_args_list]
+    assert annotated == [["A", "B"], ["C2", "D"]]
+
+
+def test_incremental_translation_is_keyed_on_the_target_language(mocker):
+    """English translations are never reused for a French re-run. 🌍"""
+    enricher, translator = build_translation_enricher(mocker, context_size=0)
+    previous = enricher.enrich(create_utterances(["A", "B"]), LanguageTag("de"))
+    translator.translate.reset_mock()
+    enricher.target_lang = LanguageTag("fr")
+
+    result = IncrementalEnricher(
+        enricher, previous, previous_output_language=LanguageTag("en")
+    ).enrich(create_utterances(["A", "B"]), LanguageTag("de"))
+
+    assert translator.translate.call_count == 2
+    assert all(
+        c.kwargs["target_lang"] == "fr" for c in translator.translate.call_args_list
+    )
+    assert [u.translated_text for u in result] == ["T_A", "T_B"]
@@ -1,6 +1,8 @@
+import dataclasses
 import pytest
 from datetime import timedelta
 from src.application.enrichers.merging import TokenMergerEnricher
+from src.domain.word_store import WordStore, WordView
 from src.domain.value_objects import (
     Utterance,
     TimestampRange,
@@ -64,3 +66,42 @@ def test_token_merger_reconstructs_words_from_tokens():
     assert results[0].text == "Hallo"
     assert len(results[0].words) == 1
     assert results[0].words[0].text == "Hallo"
+
+
+def test_token_merger_columnar_matches_object_words():
+    """
+    Behavioral Test: Verifies that columnar word views merge into exactly the
+    same words as the Word-object path. 🗄️🧩
+    """
+    # Arrange
+    words = [
+        Word(
+            " Hal", TimestampRange(timedelta(0), timedelta(0.5)), ConfidenceScore(0.5)
+        ),
+        Word(
+            "lo", TimestampRange(timedelta(0.5), timedelta(1.0)), ConfidenceScore(1.0)
+        ),
+        Word(
+            " Welt",
+            TimestampRange(timedelta(1.0), timedelta(2.0)),
+            ConfidenceScore(0.75),
+        ),
+    ]
+    store = WordStore()
+    objects_u = Utterance(
+        TimestampRange(timedelta(0), timedelta(2.0)),
+        "Hallo Welt",
+        "S1",
+        ConfidenceScore(1.0),
+        words=words,
+    )
+    columnar_u = dataclasses.replace(objects_u, words=store.extend(words))
+
+    # Act
+    expected = TokenMergerEnricher().enrich([objects_u], LanguageTag("de"))
+    actual = TokenMergerEnricher().enrich([columnar_u], LanguageTag("de"))
+
+    # Assert
+    assert isinstance(actual[0].words, WordView)
+    assert actual[0].text == expected[0].text == "Hallo Welt"
+    assert actual == expected
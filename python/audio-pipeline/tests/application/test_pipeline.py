@@ -1,4 +1,5 @@
 import pytest
+from datetime import timedelta
 from unittest.mock import Mock
 from src.application.pipeline import AudioProcessingPipeline
 from src.domain.interfaces import (
@@ -8,8 +9,19 @@ from src.domain.interfaces import (
     ILogger,
     IAlignmentService,
     IEventBus,
+    IVoiceActivityDetector,
+    ITranslator,
+)
+from src.application.enrichers.translation import TranslationEnricher
+from src.domain.entities import JobStatus, AudioArtifact
+from src.domain.events import SpeechCompacted
+from src.domain.value_objects import (
+    Utterance,
+    TimestampRange,
+    ConfidenceScore,
+    SpeechOffsetMap,
+    LanguageTag,
 )
-from src.domain.entities import JobStatus
 
 
 def test_pipeline_execution_flow(mocker):
@@ -48,6 +60,27 @@ def test_pipeline_execution_flow(mocker):
     mock_alignment_service.align.assert_called_once()
 
 
+def test_pipeline_records_the_translation_language(mocker):
+    """The saved transcript says what its translations are in. 🌍"""
+    mock_alignment_service = mocker.Mock(spec=IAlignmentService)
+    mock_alignment_service.align.return_value = []
+    translator = mocker.Mock(spec=ITranslator)
+    pipeline = AudioProcessingPipeline(
+        audio_processor=mocker.Mock(spec=IAudioProcessor),
+        transcriber=mocker.Mock(spec=ITranscriber, **{"transcribe.return_value": []}),
+        diarizer=mocker.Mock(spec=IDiarizer, **{"diarize.return_value": []}),
+        alignment_service=mock_alignment_service,
+        event_bus=mocker.Mock(spec=IEventBus),
+        enrichers=[TranslationEnricher(translator, target_lang=LanguageTag("fr"))],
+    )
+    mocker.patch("os.path.exists", return_value=True)
+
+    job = pipeline.execute("source.m4a", "de")
+
+    assert job.result.target_language == "de"
+    assert job.result.translation_language == "fr"
+
+
 def test_pipeline_failure_handles_exceptions(mocker):
     processor = mocker.Mock(spec=IAudioProcessor)
     processor.normalize.side_effect = Exception("Boom! 💥")
@@ -85,3 +118,59 @@ def test_pipeline_fails_on_missing_language(mocker):
 
     with pytest.raises(ValueError, match="Target language must be provided"):
         pipeline.execute("source.wav", "")
+
+
+def test_pipeline_restores_original_timeline_after_vad(mocker):
+    """ASR and diarization run on trimmed audio; alignment sees original times. 🔇🧵"""
+
+    def utterance(start_s, end_s):
+        return Utterance(
+            timestamp=TimestampRange(
+                timedelta(seconds=start_s), timedelta(seconds=end_s)
+            ),
+            text="Hallo",
+            speaker_id="S1",
+            confidence=ConfidenceScore(1.0),
+        )
+
+    trimmed = AudioArtifact(file_path="speech.wav")
+    vad = mocker.Mock(spec=IVoiceActivityDetector)
+    vad.compact.return_value = (
+        trimmed,
+        SpeechOffsetMap(
+            compacted_starts=(timedelta(0), timedelta(seconds=2)),
+            original_starts=(timedelta(0), timedelta(seconds=30)),
+            original_duration=timedelta(seconds=40),
+            speech_duration=timedelta(seconds=10),
+        ),
+    )
+    transcriber = mocker.Mock(spec=ITranscriber)
+    transcriber.transcribe.return_value = [utterance(3, 4)]
+    diarizer = mocker.Mock(spec=IDiarizer)
+    diarizer.diarize.return_value = [utterance(2, 5)]
+    alignment = mocker.Mock(spec=IAlignmentService)
+    alignment.align.return_value = []
+    event_bus = mocker.Mock(spec=IEventBus)
+
+    pipeline = AudioProcessingPipeline(
+        audio_processor=mocker.Mock(spec=IAudioProcessor),
+        transcriber=transcriber,
+        diarizer=diarizer,
+        alignment_service=alignment,
+        event_bus=event_bus,
+        vad=vad,
+    )
+    mocker.patch("os.path.exists", return_value=True)
+
+    job = pipeline.execute("source.m4a", "de")
+
+    assert job.status == JobStatus.COMPLETED
+    transcriber.transcribe.assert_called_once_with(trimmed, "de")
+    (raw,), (turns,) = alignment.align.call_args.args
+    assert raw.timestamp.start == timedelta(seconds=31)
+    assert turns.timestamp == TimestampRange(
+        timedelta(seconds=30), timedelta(seconds=33)
+    )
+    published = [c.args[0] for c in event_bus.publish.call_args_list]
+    compacted = [e for e in published if isinstance(e, SpeechCompacted)]
+    assert compacted[0].speech_seconds == 10.0
@@ -3,7 +3,9 @@ from datetime import timedelta
 from unittest.mock import Mock
 from src.application.pipeline import AudioProcessingPipeline
 from src.domain.entities import ProcessingJob, JobStatus
-from src.domain.events import PipelineStepTimed
+from src.domain.events import PipelineStepTimed, PipelineStepProfiled, JobProfiled
+from src.domain.interfaces import IStepProfiler
+from src.domain.value_objects import StepProfile
 
 
 def test_pipeline_records_component_durations(mocker):
@@ -37,3 +39,50 @@ def test_pipeline_records_component_durations(mocker):
     assert len(timed_events) > 0
     # The first step (Ingestion) took 3661s according to our side_effect (3661 - 0)
     assert timed_events[0].duration_seconds == 3661
+
+
+def test_pipeline_publishes_step_profiles_and_a_job_summary(mocker):
+    """With a profiler, every step gets a profile and the job a summary - even a failed one. 🔬"""
+    profiler = mocker.Mock(spec=IStepProfiler)
+    profiler.start.return_value = "before"
+    profiler.finish.side_effect = lambda name, started: StepProfile(
+        step_name=name,
+        wall_seconds=2.0,
+        cpu_seconds=0.5,
+        child_cpu_seconds=1.5,
+        peak_rss_bytes=0,
+        rss_growth_bytes=0,
+    )
+    transcriber = mocker.Mock()
+    transcriber.transcribe.return_value = []
+    diarizer = mocker.Mock()
+    diarizer.diarize.side_effect = RuntimeError("out of memory")
+    mock_bus = mocker.Mock()
+    pipeline = AudioProcessingPipeline(
+        audio_processor=mocker.Mock(),
+        transcriber=transcriber,
+        diarizer=diarizer,
+        alignment_service=mocker.Mock(),
+        event_bus=mock_bus,
+        profiler=profiler,
+    )
+    mocker.patch("os.path.exists", return_value=True)
+
+    job = pipeline.execute("source.wav", "de")
+
+    events = [call.args[0] for call in mock_bus.publish.call_args_list]
+    profiled = [
+        e.profile.step_name for e in events if isinstance(e, PipelineStepProfiled)
+    ]
+    assert profiled == [
+        "📦 Ingestion & Normalization",
+        "🎤 Transcription (de)",
+        "🕵️‍♀️ Diarization",
+    ]
+    assert all(call.args[1] == "before" for call in profiler.finish.call_args_list)
+
+    assert isinstance(events[-1], JobProfiled)
+    assert [p.step_name for p in events[-1].steps] == profiled
+    assert events[-1].steps[0].bound == "cpu"
+    assert job.status == JobStatus.FAILED
+    assert job.step_profiles == list(events[-1].steps)
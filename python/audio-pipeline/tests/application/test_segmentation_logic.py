@@ -1,5 +1,4 @@
-import json
-import os
+import dataclasses
 import pytest
 import logging
 from datetime import timedelta
@@ -21,57 +20,6 @@ LOOSE_SEGMENT_START_MS = 0
 LOOSE_SEGMENT_END_MS = 6780
 
 
-@pytest.fixture
-def raw_utterances():
-    """Fixture to load raw Whisper JSON data using LOOSE segment bounds. 🏗️📉"""
-    json_path = os.path.join(os.path.dirname(__file__), "../data/test_30s_raw.json")
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    utterances = []
-    for segment in data.get("transcription", []):
-        offsets = segment.get("offsets", {})
-        seg_start = offsets.get("from", 0)
-        seg_end = offsets.get("to", 0)
-
-        words = []
-        for token in segment.get("tokens", []):
-            t_text = token.get("text", "")
-            if not t_text or t_text.strip().startswith("[_"):
-                continue
-
-            t_offsets = token.get("offsets", {})
-            t_start = t_offsets.get("from", seg_start)
-            t_end = t_offsets.get("to", seg_end)
-            t_p = token.get("p", 1.0)
-
-            words.append(
-                Word(
-                    text=t_text,
-                    timestamp=TimestampRange(
-                        timedelta(milliseconds=t_start), timedelta(milliseconds=t_end)
-                    ),
-                    confidence=ConfidenceScore(t_p),
-                )
-            )
-
-        if words:
-            # Load with the original LOOSE segment bounds 🌬️🚫
-            utterances.append(
-                Utterance(
-                    timestamp=TimestampRange(
-                        timedelta(milliseconds=seg_start),
-                        timedelta(milliseconds=seg_end),
-                    ),
-                    text=segment.get("text", "").strip(),
-                    speaker_id="SPEAKER_00",
-                    confidence=ConfidenceScore(1.0),
-                    words=words,
-                )
-            )
-    return utterances
-
-
 def test_utterance_snapping_behavior(raw_utterances):
     """
     STRICTLY verifies that loose segment bounds are snapped tight to word tokens. 📏⚡️
@@ -141,3 +89,96 @@ def test_segmentation_logic_threshold_too_high_no_splits(raw_utterances):
     assert len(enriched) == len(raw_utterances)
     for i, u in enumerate(enriched):
         assert u.text == raw_utterances[i].text
+
+
+class RecursiveSegmentationEnricher(SentenceSegmentationEnricher):
+    """The original recursive splitter, kept as the reference oracle. 🔄📜"""
+
+    def _split_if_needed(self, u):
+        if not u.words:
+            return [u]
+        u = dataclasses.replace(
+            u,
+            timestamp=TimestampRange(
+                start=u.words[0].timestamp.start, end=u.words[-1].timestamp.end
+            ),
+        )
+        duration = (u.timestamp.end - u.timestamp.start).total_seconds()
+        if duration <= self.max_duration_seconds:
+            return [u]
+        valid_splits = [
+            i
+            for i, w in enumerate(u.words)
+            if self.sentence_end_regex.match(w.text.strip()) and i < len(u.words) - 1
+        ]
+        if not valid_splits:
+            self._warn_unsplittable(u.text, duration)
+            return [u]
+        split_idx = valid_splits[0]
+        part1 = self._create_utterance_from_words(
+            u.words[: split_idx + 1], u.speaker_id
+        )
+        part2 = self._create_utterance_from_words(
+            u.words[split_idx + 1 :], u.speaker_id
+        )
+        return self._split_if_needed(part1) + self._split_if_needed(part2)
+
+
+def build_monologue(token_count: int, sentence_every: int) -> Utterance:
+    """A single speaker rambling on for 'token_count' tokens. 🗣️📜"""
+    words = []
+    for i in range(token_count):
+        text = f" w{i % 97}" + ("." if (i + 1) % sentence_every == 0 else "")
+        words.append(
+            Word(
+                text=text,
+                timestamp=TimestampRange(
+                    timedelta(milliseconds=i * 250),
+                    timedelta(milliseconds=i * 250 + 240),
+                ),
+                confidence=ConfidenceScore(0.5 + (i % 50) / 100),
+            )
+        )
+    return Utterance(
+        timestamp=TimestampRange(words[0].timestamp.start, words[-1].timestamp.end),
+        text="".join(w.text for w in words).strip(),
+        speaker_id="SPEAKER_00",
+        confidence=ConfidenceScore(1.0),
+        words=words,
+    )
+
+
+@pytest.mark.parametrize("threshold", [1.0, 3.0, 5.0, 12.0])
+def test_single_pass_segmentation_matches_recursive_on_fixture(
+    raw_utterances, threshold
+):
+    """Regression: the single-pass splitter reproduces the recursive output exactly. 🎯"""
+    expected = RecursiveSegmentationEnricher(threshold).enrich(
+        raw_utterances, LanguageTag("de")
+    )
+    actual = SentenceSegmentationEnricher(threshold).enrich(
+        raw_utterances, LanguageTag("de")
+    )
+
+    assert actual == expected
+
+
+def test_single_pass_segmentation_matches_recursive_on_long_monologue():
+    """Regression on a 12k-token monologue with uneven sentence lengths. 📜🏎️"""
+    monologue = build_monologue(token_count=12_000, sentence_every=37)
+
+    expected = RecursiveSegmentationEnricher(4.0).enrich([monologue], LanguageTag("de"))
+    actual = SentenceSegmentationEnricher(4.0).enrich([monologue], LanguageTag("de"))
+
+    assert len(actual) > 100
+    assert actual == expected
+
+
+def test_single_pass_segmentation_survives_thousands_of_sentences():
+    """The old recursion blew the stack here; the single pass doesn't care. 🧱🚫"""
+    monologue = build_monologue(token_count=20_000, sentence_every=2)
+
+    enriched = SentenceSegmentationEnricher(0.1).enrich([monologue], LanguageTag("de"))
+
+    assert len(enriched) == 10_000
+    assert sum(len(u.words) for u in enriched) == 20_000
@@ -1,6 +1,14 @@
 from datetime import timedelta
-from src.domain.value_objects import Utterance, TimestampRange, ConfidenceScore
-from src.application.services import MaxOverlapAlignmentService
+import dataclasses
+from src.domain.value_objects import (
+    Utterance,
+    TimestampRange,
+    ConfidenceScore,
+    Word,
+    SpeechOffsetMap,
+)
+from src.domain.word_store import WordStore, WordView
+from src.application.services import MaxOverlapAlignmentService, SpeechTimelineRestorer
 
 
 def test_alignment_service_simple():
@@ -75,3 +83,77 @@ def test_align_no_overlap_defaults_to_unknown():
     # Assert
 
     assert result[0].speaker_id == "Unknown"
+
+
+def ms(value):
+    return timedelta(milliseconds=value)
+
+
+# Trimmed audio keeps [0, 1000) and [5000, 7000) of the original 🔇
+OFFSET_MAP = SpeechOffsetMap(
+    compacted_starts=(ms(0), ms(1000)),
+    original_starts=(ms(0), ms(5000)),
+    original_duration=ms(7000),
+    speech_duration=ms(3000),
+)
+
+
+def build_spanning_utterance():
+    """One utterance whose words straddle the removed silence. 🌉"""
+    return Utterance(
+        timestamp=TimestampRange(ms(500), ms(1500)),
+        text="Hallo Welt",
+        speaker_id="S1",
+        confidence=ConfidenceScore(0.9),
+        words=[
+            Word("Hallo", TimestampRange(ms(500), ms(1000)), ConfidenceScore(0.5)),
+            Word("Welt", TimestampRange(ms(1000), ms(1500)), ConfidenceScore(1.0)),
+        ],
+    )
+
+
+def test_timeline_restorer_remaps_utterances_and_words():
+    # Act
+    (restored,) = SpeechTimelineRestorer().restore(
+        [build_spanning_utterance()], OFFSET_MAP
+    )
+
+    # Assert: the silence reappears between the two words 🧵
+    assert restored.timestamp == TimestampRange(ms(500), ms(5500))
+    assert restored.words[0].timestamp == TimestampRange(ms(500), ms(1000))
+    assert restored.words[1].timestamp == TimestampRange(ms(5000), ms(5500))
+    assert restored.text == "Hallo Welt"
+
+
+def test_timeline_restorer_keeps_columnar_words_columnar():
+    u = build_spanning_utterance()
+    columnar = dataclasses.replace(u, words=WordStore().extend(u.words))
+
+    (expected,) = SpeechTimelineRestorer().restore([u], OFFSET_MAP)
+    (actual,) = SpeechTimelineRestorer().restore([columnar], OFFSET_MAP)
+
+    assert isinstance(actual.words, WordView)
+    assert actual == expected
+
+
+def test_timeline_restorer_keeps_a_zero_length_seam_word_inside_its_utterance():
+    """'ja' sits exactly on the seam, where its utterance ends. 📍🧵"""
+    u = Utterance(
+        timestamp=TimestampRange(ms(500), ms(1000)),
+        text="Hallo ja",
+        speaker_id="S1",
+        confidence=ConfidenceScore(0.9),
+        words=[
+            Word("Hallo", TimestampRange(ms(500), ms(1000)), ConfidenceScore(0.5)),
+            Word("ja", TimestampRange(ms(1000), ms(1000)), ConfidenceScore(0.5)),
+        ],
+    )
+    columnar = dataclasses.replace(u, words=WordStore().extend(u.words))
+
+    for utterance in (u, columnar):
+        (restored,) = SpeechTimelineRestorer().restore([utterance], OFFSET_MAP)
+
+        assert restored.timestamp == TimestampRange(ms(500), ms(1000))
+        assert restored.words[1].timestamp == TimestampRange(ms(1000), ms(1000))
+        # Strict construction agrees the words still fit 🛡️
+        dataclasses.replace(restored, words=list(restored.words))
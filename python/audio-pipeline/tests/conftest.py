@@ -0,0 +1,16 @@
+import pytest
+from src.domain.value_objects import set_strict_validation
+
+
+@pytest.fixture(autouse=True)
+def strict_validation():
+    """Every test re-validates 'trusted' utterances, so shortcuts can't hide bugs. 🛡️⚖️"""
+    previous = set_strict_validation(True)
+    yield
+    set_strict_validation(previous)
+
+
+@pytest.fixture
+def relaxed_validation(strict_validation):
+    """Opts a test back into production behaviour (trusted means trusted). 🏎️"""
+    set_strict_validation(False)
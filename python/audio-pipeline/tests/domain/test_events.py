@@ -0,0 +1,16 @@
+from uuid import uuid4
+from src.domain.events import PipelineStepTimed
+
+
+def make_event():
+    return PipelineStepTimed(
+        job_id=uuid4(), step_name="🧩 Alignment", duration_seconds=1.0
+    )
+
+
+def test_event_records_the_line_that_created_it():
+    """origin_file/line point past the dataclass machinery to the real caller. 🕵️‍♀️"""
+    event = make_event()
+
+    assert event.origin_file == "test_events.py"
+    assert event.origin_line == make_event.__code__.co_firstlineno + 1
@@ -1,6 +1,14 @@
+import dataclasses
 import pytest
 from datetime import timedelta
-from src.domain.value_objects import TimestampRange, Utterance, Word, ConfidenceScore
+from src.domain.value_objects import (
+    TimestampRange,
+    Utterance,
+    Word,
+    ConfidenceScore,
+    SpeechOffsetMap,
+    StepProfile,
+)
 
 
 def test_timestamp_range_valid():
@@ -66,3 +74,104 @@ def test_utterance_allows_words_within_range():
 
     # Assert
     assert u.words[0] == good_word
+
+
+def _utterance_with_word():
+    return Utterance(
+        timestamp=TimestampRange(timedelta(seconds=0), timedelta(seconds=5)),
+        text="hello",
+        speaker_id="S1",
+        confidence=ConfidenceScore(1.0),
+        words=[
+            Word(
+                "hello",
+                TimestampRange(timedelta(seconds=1), timedelta(seconds=2)),
+                ConfidenceScore(1.0),
+            )
+        ],
+    )
+
+
+def test_utterance_evolve_skips_validation_for_non_temporal_fields(
+    mocker, relaxed_validation
+):
+    # Arrange
+    u = _utterance_with_word()
+    validate = mocker.spy(Utterance, "_validate_words")
+
+    # Act
+    translated = u.evolve(translated_text="hallo")
+
+    # Assert: Same words, new field, and no O(words) re-check ♻️
+    validate.assert_not_called()
+    assert translated.words is u.words
+    assert translated == dataclasses.replace(u, translated_text="hallo")
+
+
+def test_utterance_evolve_validates_temporal_changes():
+    u = _utterance_with_word()
+
+    with pytest.raises(ValueError, match="falls outside utterance range"):
+        u.evolve(timestamp=TimestampRange(timedelta(seconds=3), timedelta(seconds=5)))
+
+
+def test_strict_mode_validates_trusted_construction():
+    """The autouse strict fixture makes 'trusted' shortcuts fail loudly in tests. 🛡️"""
+    u = _utterance_with_word()
+
+    with pytest.raises(ValueError, match="falls outside utterance range"):
+        Utterance.trusted(
+            timestamp=TimestampRange(timedelta(seconds=3), timedelta(seconds=5)),
+            text=u.text,
+            speaker_id=u.speaker_id,
+            confidence=u.confidence,
+            words=u.words,
+        )
+
+
+def seconds(value):
+    return timedelta(seconds=value)
+
+
+def test_speech_offset_map_restores_original_times():
+    """Kept regions [1s, 3s) and [10s, 13s) sit back to back after trimming. ✂️🗺️"""
+    offset_map = SpeechOffsetMap(
+        compacted_starts=(seconds(0), seconds(2)),
+        original_starts=(seconds(1), seconds(10)),
+        original_duration=seconds(15),
+        speech_duration=seconds(5),
+    )
+
+    assert offset_map.to_original(seconds(0.5)) == seconds(1.5)
+    assert offset_map.to_original(seconds(4)) == seconds(12)
+    # On the seam a start opens the next region, an end closes the previous one 🧵
+    assert offset_map.to_original(seconds(2)) == seconds(10)
+    assert offset_map.to_original(seconds(2), is_end=True) == seconds(3)
+    assert offset_map.skipped_fraction == pytest.approx(2 / 3)
+
+
+def test_speech_offset_map_rejects_mismatched_regions():
+    with pytest.raises(ValueError, match="one original start per region"):
+        SpeechOffsetMap((seconds(0),), (), seconds(1), seconds(1))
+
+
+def profile(wall=10.0, cpu=0.0, child_cpu=0.0, growth=0):
+    return StepProfile(
+        step_name="step",
+        wall_seconds=wall,
+        cpu_seconds=cpu,
+        child_cpu_seconds=child_cpu,
+        peak_rss_bytes=growth,
+        rss_growth_bytes=growth,
+    )
+
+
+def test_step_profile_names_what_bounds_the_step():
+    """Memory growth outranks CPU; idle CPU means the step was waiting. ⚖️"""
+    # whisper-cli burning 4 cores in a subprocess
+    assert profile(cpu=0.5, child_cpu=39.5).cpu_utilization == pytest.approx(4.0)
+    assert profile(cpu=0.5, child_cpu=39.5).bound == "cpu"
+    assert profile(cpu=20.0, growth=2 * 1024**3).bound == "memory"
+    # a remote API: the process just sat there
+    assert profile(cpu=0.2).bound == "wait"
+    assert profile(wall=0.0).cpu_utilization == 0.0
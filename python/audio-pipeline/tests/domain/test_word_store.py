@@ -0,0 +1,83 @@
+import pytest
+from datetime import timedelta
+from src.domain.word_store import WordStore, WordView
+from src.domain.value_objects import TimestampRange, Utterance, Word, ConfidenceScore
+
+
+def build_store():
+    store = WordStore()
+    store.append(" Hal", 0, 500, 0.5)
+    store.append("lo", 500, 1000, 0.75)
+    store.append(" Hal", 1000, 1500, 0.25)
+    return store
+
+
+def test_word_store_interns_repeated_texts():
+    # Arrange & Act
+    store = build_store()
+
+    # Assert: Three words, but ' Hal' is stored only once 🗄️
+    assert len(store) == 3
+    assert store.text_ids.tolist() == [0, 1, 0]
+    assert store.text(2) == " Hal"
+
+
+def test_word_store_materializes_equivalent_words():
+    store = build_store()
+
+    word = store.word(1)
+
+    assert word == Word(
+        "lo",
+        TimestampRange(timedelta(milliseconds=500), timedelta(milliseconds=1000)),
+        ConfidenceScore(0.75),
+    )
+
+
+def test_word_store_rejects_inverted_ranges():
+    with pytest.raises(ValueError, match="Start time cannot be after end time"):
+        WordStore().append("oops", 10, 5, 1.0)
+
+
+def test_word_view_slices_stay_views():
+    # Arrange
+    view = build_store().view()
+
+    # Act
+    tail = view[1:]
+
+    # Assert
+    assert isinstance(tail, WordView)
+    assert len(tail) == 2
+    assert tail.texts() == ["lo", " Hal"]
+    assert tail[-1].timestamp.end == timedelta(milliseconds=1500)
+    assert list(tail.rows())[0] == ("lo", 500, 1000, 0.75)
+    with pytest.raises(IndexError):
+        tail[2]
+
+
+def test_utterance_accepts_word_view_within_range():
+    view = build_store().view()
+
+    u = Utterance(
+        timestamp=TimestampRange(timedelta(0), timedelta(milliseconds=1500)),
+        text="Hallo Hal",
+        speaker_id="S1",
+        confidence=ConfidenceScore(1.0),
+        words=view,
+    )
+
+    assert u.words == list(view)
+
+
+def test_utterance_rejects_word_view_outside_range():
+    view = build_store().view()
+
+    with pytest.raises(ValueError, match="falls outside utterance range"):
+        Utterance(
+            timestamp=TimestampRange(timedelta(0), timedelta(milliseconds=1000)),
+            text="Hallo Hal",
+            speaker_id="S1",
+            confidence=ConfidenceScore(1.0),
+            words=view,
+        )
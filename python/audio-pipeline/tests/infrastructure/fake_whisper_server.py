@@ -0,0 +1,58 @@
+"""
+A stand-in for whisper.cpp's server: same CLI flags, a /health endpoint, and
+/inference answering with the whisper-cli JSON of tests/data/test_30s_raw.json. 🎭
+"""
+
+import argparse
+import json
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+RAW_JSON = os.path.join(os.path.dirname(__file__), "../data/test_30s_raw.json")
+
+
+class FakeWhisperHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/health":
+            self._reply(200, {"status": "ok"})
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path != "/inference":
+            self._reply(404, {"error": "not found"})
+            return
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if b'name="file"' not in body:
+            self._reply(400, {"error": "no file"})
+            return
+        with open(RAW_JSON, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+        payload["server_pid"] = os.getpid()  # Lets tests prove the process is reused 🔁
+        self._reply(200, payload)
+
+    def _reply(self, status: int, payload: dict):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Keep test output clean 🤫
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-m", "--model")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("-t", "--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    ThreadingHTTPServer((args.host, args.port), FakeWhisperHandler).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
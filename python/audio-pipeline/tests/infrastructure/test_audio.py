@@ -1,6 +1,8 @@
+import filecmp
 import pytest
 import os
 import subprocess
+import wave
 from src.infrastructure.audio import FFmpegAudioProcessor
 
 
@@ -41,3 +43,124 @@ def test_ffmpeg_processor_failure_on_binary_error(mocker, tmp_path):
     processor = FFmpegAudioProcessor()
     with pytest.raises(RuntimeError, match="FFmpeg failed! Error: Error!"):
         processor.normalize(str(source))
+
+
+NORMALIZED_WAV = os.path.join(
+    os.path.dirname(__file__), "../data/test_10s_normalized.wav"
+)
+
+
+def test_ffmpeg_processor_reuses_already_normalized_wav(mocker, tmp_path):
+    """A 16kHz mono PCM WAV is linked into work_dir, FFmpeg never runs. 🏎️🔍"""
+    run = mocker.patch("subprocess.run")
+
+    artifact = FFmpegAudioProcessor(work_dir=str(tmp_path)).normalize(NORMALIZED_WAV)
+
+    run.assert_not_called()
+    assert artifact.file_path == str(tmp_path / "test_10s_normalized_normalized.wav")
+    # A hard link, or a copy when tmp is another file system
+    assert filecmp.cmp(artifact.file_path, NORMALIZED_WAV, shallow=False)
+    assert artifact.sample_rate == 16000
+
+
+def test_ffmpeg_processor_keeps_derived_files_out_of_the_input_dir(tmp_path):
+    """Files named after the artifact (e.g. whisper's talk.json) go to work_dir. 📂"""
+    inputs = tmp_path / "inputs"
+    inputs.mkdir()
+    source = inputs / "talk.wav"
+    with open(NORMALIZED_WAV, "rb") as f:
+        source.write_bytes(f.read())
+    (inputs / "talk.json").write_text("the user's own notes")
+    work_dir = tmp_path / "work"
+    processor = FFmpegAudioProcessor(work_dir=str(work_dir))
+
+    artifact = processor.normalize(str(source))
+    # Running twice (e.g. a re-run) replaces the link instead of failing
+    assert processor.normalize(str(source)).file_path == artifact.file_path
+
+    assert os.path.dirname(artifact.file_path) == str(work_dir)
+    assert sorted(os.listdir(inputs)) == ["talk.json", "talk.wav"]
+
+
+def test_ffmpeg_processor_transcodes_wav_with_wrong_format(mocker, tmp_path):
+    """A stereo WAV still goes through FFmpeg. 🔨"""
+    source = tmp_path / "stereo.wav"
+    with wave.open(str(source), "wb") as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(44100)
+        wav.writeframes(b"\x00" * 400)
+    run = mocker.patch("subprocess.run", return_value=mocker.Mock(returncode=0))
+
+    artifact = FFmpegAudioProcessor().normalize(str(source))
+
+    run.assert_called_once()
+    assert artifact.file_path.endswith("stereo_normalized.wav")
+
+
+def test_ffmpeg_processor_cache_transcodes_each_source_once(mocker, tmp_path):
+    """Same content -> one FFmpeg run, even under a different file name. 🗄️🔑"""
+    first = tmp_path / "episode.mp3"
+    first.write_bytes(b"fake mp3 bytes")
+    copy = tmp_path / "episode_copy.mp3"
+    copy.write_bytes(b"fake mp3 bytes")
+    cache_dir = tmp_path / "cache"
+
+    def fake_ffmpeg(command, **kwargs):
+        with open(command[-1], "wb") as f:
+            f.write(b"RIFF")
+        return mocker.Mock(returncode=0)
+
+    run = mocker.patch("subprocess.run", side_effect=fake_ffmpeg)
+    processor = FFmpegAudioProcessor(cache_dir=str(cache_dir))
+
+    a = processor.normalize(str(first))
+    b = processor.normalize(str(copy))
+
+    run.assert_called_once()
+    (cached,) = os.listdir(cache_dir)
+    # Each job works on its own link, never inside the shared cache 🔗
+    assert os.path.dirname(a.file_path) == os.path.dirname(b.file_path) == str(tmp_path)
+    assert os.path.samefile(a.file_path, cache_dir / cached)
+    assert os.path.samefile(b.file_path, cache_dir / cached)
+
+
+def test_ffmpeg_processor_cache_leaves_no_partial_file_on_failure(mocker, tmp_path):
+    """A failed transcode must not poison the cache. 🛡️"""
+    source = tmp_path / "broken.mp3"
+    source.write_bytes(b"garbage")
+    cache_dir = tmp_path / "cache"
+
+    def failing_ffmpeg(command, **kwargs):
+        with open(command[-1], "wb") as f:
+            f.write(b"half")
+        return mocker.Mock(returncode=1, stderr="boom")
+
+    mocker.patch("subprocess.run", side_effect=failing_ffmpeg)
+
+    with pytest.raises(RuntimeError, match="FFmpeg failed"):
+        FFmpegAudioProcessor(cache_dir=str(cache_dir)).normalize(str(source))
+
+    assert os.listdir(cache_dir) == []
+
+
+def test_ffmpeg_processor_never_writes_through_a_staged_cache_link(mocker, tmp_path):
+    """An uncached run after a cache hit must not overwrite the cache entry. 🔗🛡️"""
+    source = tmp_path / "episode.mp3"
+    source.write_bytes(b"fake mp3 bytes")
+    cache_dir = tmp_path / "cache"
+
+    def fake_ffmpeg(command, **kwargs):
+        with open(command[-1], "wb") as f:
+            f.write(b"RIFF from " + os.path.basename(command[-1]).encode())
+        return mocker.Mock(returncode=0)
+
+    mocker.patch("subprocess.run", side_effect=fake_ffmpeg)
+    FFmpegAudioProcessor(cache_dir=str(cache_dir)).normalize(str(source))
+    (cached,) = os.listdir(cache_dir)
+    cached_bytes = (cache_dir / cached).read_bytes()
+
+    artifact = FFmpegAudioProcessor().normalize(str(source))
+
+    assert not os.path.samefile(artifact.file_path, cache_dir / cached)
+    assert (cache_dir / cached).read_bytes() == cached_bytes
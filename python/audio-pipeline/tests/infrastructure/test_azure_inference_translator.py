@@ -1,5 +1,6 @@
 import json
 import os
+import httpx
 import pytest
 from dotenv import load_dotenv
 from src.infrastructure.azure_inference_translation import AzureInferenceTranslator
@@ -55,7 +56,7 @@ def test_azure_inference_translator_real_success(real_translator):
 
 def test_azure_inference_translator_real_empty_input(real_translator):
     """Verifies handling of empty input. 🧼🚿"""
-    results = real_translator.translate([], LanguageTag("en"))
+    results = real_translator.translate([], target_lang=LanguageTag("en"))
     assert results == []
 
 
@@ -95,7 +96,7 @@ def test_azure_inference_translator_retry_on_429(mock_translator, mocker):
         "httpx.Client.post", side_effect=[mock_response_429, mock_response_200]
     )
 
-    results = mock_translator.translate(["Hallo"], LanguageTag("en"))
+    results = mock_translator.translate(["Hallo"], target_lang=LanguageTag("en"))
 
     assert results == ["Hello"]
     assert mock_post.call_count == 2
@@ -109,7 +110,44 @@ def test_azure_inference_translator_exhausts_retries_on_exception(
     mocker.patch("httpx.Client.post", side_effect=Exception("Connection failure"))
 
     results = mock_translator.translate(
-        ["Hallo", "Welt"], LanguageTag("en")
+        ["Hallo", "Welt"], target_lang=LanguageTag("en")
     )
 
-    assert results == ["", ""]
\ No newline at end of file
+    assert results == ["", ""]
+
+def test_azure_inference_translator_accepts_source_lang_keyword(mock_translator, mocker):
+    """TranslationEnricher passes source_lang= like every ITranslator gets. 🌍"""
+    response = mocker.Mock(status_code=200)
+    response.json.return_value = {
+        "choices": [
+            {"message": {"content": json.dumps({"translations": [{"id": "0", "text": "Hi"}]})}}
+        ]
+    }
+    post = mocker.patch("httpx.Client.post", return_value=response)
+
+    results = mock_translator.translate(
+        ["Hallo"], source_lang=LanguageTag("de"), target_lang=LanguageTag("en")
+    )
+
+    assert results == ["Hi"]
+    assert "into en" in post.call_args.kwargs["json"]["messages"][0]["content"]
+
+
+def test_azure_inference_translator_honours_retry_after(mock_translator, mocker):
+    """A 429 with Retry-After waits as long as the service asks, not 65s. 🚦"""
+    sleep = mocker.patch("time.sleep")
+    request = httpx.Request("POST", mock_translator.endpoint)
+    throttled = httpx.Response(429, headers={"Retry-After": "2"}, request=request)
+    ok = httpx.Response(
+        200,
+        request=request,
+        json={
+            "choices": [
+                {"message": {"content": json.dumps({"translations": [{"id": "0", "text": "Hi"}]})}}
+            ]
+        },
+    )
+    mocker.patch("httpx.Client.post", side_effect=[throttled, ok])
+
+    assert mock_translator.translate(["Hallo"], target_lang=LanguageTag("en")) == ["Hi"]
+    sleep.assert_called_once_with(2.0)
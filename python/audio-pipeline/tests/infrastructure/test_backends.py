@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+import pytest
+from src.infrastructure.backends import BACKENDS, load_backend
+from src.infrastructure.transcription import AzureFastTranscriber
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def test_load_backend_resolves_registered_class():
+    assert load_backend("azure-fast") is AzureFastTranscriber
+
+
+def test_load_backend_rejects_unknown_name():
+    with pytest.raises(ValueError, match="Unknown backend"):
+        load_backend("nope")
+
+
+def test_every_registered_target_is_well_formed():
+    for target in BACKENDS.values():
+        module_name, class_name = target.split(":")
+        assert module_name.startswith("src.infrastructure.") and class_name
+
+
+def test_azure_stack_does_not_import_torch_or_pyannote():
+    """Builds the Azure stack in a fresh interpreter and inspects sys.modules. 💤☁️"""
+    code = """
+import sys
+from types import SimpleNamespace
+from src.infrastructure.factory import PipelineComponentFactory
+from src.infrastructure.logging import NullLogger
+args = SimpleNamespace(
+    use_azure=True, audio_cache_dir=None, in_memory_audio=False, vad=False,
+    cpu_threads=None, parallel_jobs=1, previous_transcript=None,
+    max_duration=15.0, target_language="en", translation_context=3,
+    translation_batch=10, annotation_batch=1, annotation_context=10,
+    azure_upload_codec="flac", azure_workers=1,
+    record=None, replay=None, replay_latency=False, output_dir="output",
+)
+PipelineComponentFactory(args, NullLogger()).build_components()
+heavy = [m for m in ("torch", "pyannote", "pyannote.audio") if m in sys.modules]
+print(",".join(heavy) or "clean")
+"""
+    env = dict(
+        os.environ,
+        AZURE_SPEECH_KEY="k",
+        AZURE_SPEECH_REGION="westeurope",
+        AZURE_AI_INFERENCE_KEY="k",
+        AZURE_AI_INFERENCE_ENDPOINT="https://x/chat/completions?api-version=1",
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "clean"
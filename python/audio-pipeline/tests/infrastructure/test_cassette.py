@@ -0,0 +1,199 @@
+import json
+import os
+import stat
+import subprocess
+import sys
+import threading
+from datetime import timedelta
+from http.server import ThreadingHTTPServer
+import httpx
+import pytest
+from src.domain.entities import AudioArtifact
+from src.domain.interfaces import IDiarizer
+from src.domain.value_objects import (
+    ConfidenceScore,
+    LanguageTag,
+    TimestampRange,
+    Utterance,
+)
+from src.infrastructure.cassette import Cassette, CassetteDiarizer
+from src.infrastructure.transcription import AzureFastTranscriber, WhisperTranscriber
+from tests.infrastructure.fake_whisper_server import FakeWhisperHandler
+
+RAW_JSON = os.path.join(os.path.dirname(__file__), "../data/test_30s_raw.json")
+
+
+def make_fake_whisper_cli(path):
+    """Writes <-of>.json like whisper-cli does, from the test fixture. 🎭"""
+    path.write_text(
+        "#!/bin/sh\n"
+        'while [ "$1" != "-of" ]; do shift; done\n'
+        f'cp "{RAW_JSON}" "$2.json"\n'
+        "echo done\n"
+    )
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+@pytest.fixture
+def fake_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeWhisperHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_whisper_cli_replays_without_the_binary(tmp_path, mocker):
+    """The JSON whisper-cli wrote is restored in a fresh temp dir, nothing is spawned. 📼🔁"""
+    cassette_path = str(tmp_path / "run.json")
+    recorded, replayed = tmp_path / "a", tmp_path / "b"
+    recorded.mkdir()
+    replayed.mkdir()
+    (recorded / "episode.wav").write_bytes(b"RIFF")
+    (replayed / "episode.wav").write_bytes(b"RIFF")
+    transcriber = WhisperTranscriber(
+        make_fake_whisper_cli(tmp_path / "whisper-cli"), "model"
+    )
+
+    with Cassette(cassette_path, mode="record"):
+        expected = transcriber.transcribe(
+            AudioArtifact(file_path=str(recorded / "episode.wav")), LanguageTag("de")
+        )
+
+    os.remove(transcriber.executable_path)
+    popen = mocker.patch("subprocess.Popen", side_effect=AssertionError("spawned!"))
+    with Cassette(cassette_path, mode="replay"):
+        actual = transcriber.transcribe(
+            AudioArtifact(file_path=str(replayed / "episode.wav")), LanguageTag("de")
+        )
+
+    assert len(expected) > 0
+    assert actual == expected
+    assert os.path.exists(replayed / "episode.json")
+    popen.assert_not_called()
+
+
+def test_replay_keeps_stdout_text_mode_and_check(tmp_path):
+    cassette_path = str(tmp_path / "run.json")
+    command = [sys.executable, "-c", "import sys; print('héllo'); sys.exit(3)"]
+    with Cassette(cassette_path, mode="record"):
+        recorded = subprocess.run(command, capture_output=True)
+
+    with Cassette(cassette_path, mode="replay"):
+        as_text = subprocess.run(command, capture_output=True, text=True)
+    with Cassette(cassette_path, mode="replay"):
+        with pytest.raises(subprocess.CalledProcessError):
+            subprocess.run(command, capture_output=True, check=True)
+
+    assert recorded.returncode == as_text.returncode == 3
+    assert as_text.stdout.strip() == "héllo"
+
+
+def test_subprocess_run_is_restored_after_the_cassette(tmp_path):
+    original = subprocess.run
+    with Cassette(str(tmp_path / "run.json"), mode="record"):
+        assert subprocess.run is not original
+    assert subprocess.run is original
+
+
+def test_http_replays_by_path_and_body_on_any_host(tmp_path, fake_server, mocker):
+    """Recorded against one server, replayed with no server at all. 🌐📼"""
+    cassette_path = str(tmp_path / "http.json")
+    files = {"file": ("a.wav", b"RIFF")}
+
+    with Cassette(cassette_path, mode="record"):
+        with httpx.Client() as client:
+            health = client.get(f"{fake_server}/health").json()
+            inference = client.post(f"{fake_server}/inference", files=files).json()
+
+    sleep = mocker.patch("time.sleep")
+    with Cassette(cassette_path, mode="replay", replay_latency=True):
+        with httpx.Client() as client:
+            # A fresh multipart boundary, yet the same key once normalized
+            replayed = client.post(
+                "http://replay.invalid/inference", files=files
+            ).json()
+            assert client.get("http://replay.invalid/health").json() == health
+
+    assert health == {"status": "ok"}
+    assert replayed == inference
+    assert sleep.call_count == 2
+
+
+def test_chunk_uploads_replay_their_own_responses_in_any_order(tmp_path, mocker):
+    """Chunks finishing in another order still get their own transcripts. 🧩📼"""
+    cassette_path = str(tmp_path / "azure.json")
+    chunks = []
+    for i in range(2):
+        path = tmp_path / f"chunk_{i:04d}.wav"
+        path.write_bytes(b"RIFF" + bytes([i]) * 64)
+        chunks.append(str(path))
+
+    def fake_azure(transport, request):
+        name = "chunk_0001" if b"chunk_0001" in request.read() else "chunk_0000"
+        return httpx.Response(200, json={"phrases": [{"text": name}]})
+
+    azure = AzureFastTranscriber(
+        "k", "eastus2", endpoint="http://azure.invalid/transcribe"
+    )
+    mocker.patch.object(httpx.HTTPTransport, "handle_request", fake_azure)
+    with Cassette(cassette_path, mode="record"):
+        for path in chunks:
+            azure.request_transcription(path, LanguageTag("de"))
+    mocker.stopall()
+
+    with Cassette(cassette_path, mode="replay"):
+        replayed = [
+            azure.request_transcription(path, LanguageTag("de"))
+            for path in reversed(chunks)
+        ]
+
+    assert [r["phrases"][0]["text"] for r in replayed] == ["chunk_0001", "chunk_0000"]
+
+
+def test_replay_raises_for_unrecorded_calls(tmp_path):
+    cassette_path = str(tmp_path / "empty.json")
+    with Cassette(cassette_path, mode="record"):
+        pass
+
+    with Cassette(cassette_path, mode="replay"):
+        with pytest.raises(RuntimeError, match="No recorded subprocess call"):
+            subprocess.run(["ffmpeg", "-i", "/tmp/x.mp3"])
+        with pytest.raises(RuntimeError, match="No recorded http call"):
+            httpx.get("http://replay.invalid/health")
+
+
+def test_unknown_mode_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Unknown cassette mode"):
+        Cassette(str(tmp_path / "x.json"), mode="rewind")
+
+
+class FixedDiarizer(IDiarizer):
+    def diarize(self, audio, options=None):
+        return [
+            Utterance(
+                timestamp=TimestampRange(
+                    start=timedelta(seconds=0.5), end=timedelta(seconds=2.25)
+                ),
+                text="",
+                speaker_id="SPEAKER_01",
+                confidence=ConfidenceScore(1.0),
+            )
+        ]
+
+
+def test_diarization_replays_recorded_speaker_turns(tmp_path):
+    """No Pyannote needed on replay: the turns come from the cassette. 🗣️📼"""
+    cassette_path = str(tmp_path / "run.json")
+    audio = AudioArtifact(file_path="/data/episode.wav")
+    with Cassette(cassette_path, mode="record") as cassette:
+        expected = CassetteDiarizer(cassette, inner=FixedDiarizer()).diarize(audio)
+
+    with Cassette(cassette_path, mode="replay") as cassette:
+        actual = CassetteDiarizer(cassette).diarize(audio)
+
+    assert actual == expected
+    with open(cassette_path, "r", encoding="utf-8") as f:
+        assert json.load(f)["interactions"][0]["turns"] == [[0.5, 2.25, "SPEAKER_01"]]
@@ -0,0 +1,62 @@
+import numpy as np
+from src.infrastructure.chunking import AudioChunk, plan_chunks
+
+SR = 16000
+
+
+def speech_with_pauses(pause_at_seconds, total_seconds):
+    """Loud noise everywhere except 0.5s pauses at the given times. 🔊🔇"""
+    rng = np.random.default_rng(0)
+    samples = rng.integers(-8000, 8000, int(total_seconds * SR)).astype("<i2")
+    for t in pause_at_seconds:
+        samples[int(t * SR) : int((t + 0.5) * SR)] = 0
+    return samples
+
+
+def test_plan_chunks_short_audio_is_one_chunk():
+    samples = np.zeros(SR * 5, dtype="<i2")
+
+    assert plan_chunks(samples, SR, chunk_seconds=10) == [
+        AudioChunk(0, 0, SR * 5, 0, SR * 5, is_last=True)
+    ]
+
+
+def test_plan_chunks_cuts_inside_nearby_pauses():
+    # Pauses near (but not at) 30s and 30s after the first cut 🎯
+    samples = speech_with_pauses([27.0, 58.5], total_seconds=80)
+
+    chunks = plan_chunks(
+        samples, SR, chunk_seconds=30, overlap_seconds=1, search_seconds=5
+    )
+
+    cuts = [c.keep_start / SR for c in chunks[1:]]
+    assert len(chunks) == 3
+    assert 27.0 <= cuts[0] <= 27.5
+    assert 58.5 <= cuts[1] <= 59.0
+
+
+def test_plan_chunks_overlap_and_ownership_tile_the_recording():
+    samples = speech_with_pauses([], total_seconds=95)
+
+    chunks = plan_chunks(samples, SR, chunk_seconds=20, overlap_seconds=2)
+
+    assert chunks[0].keep_start == 0 and chunks[-1].keep_stop == len(samples)
+    for left, right in zip(chunks, chunks[1:]):
+        assert left.keep_stop == right.keep_start
+        assert left.stop == left.keep_stop + 2 * SR
+        assert right.start == right.keep_start - 2 * SR
+        # Every instant is owned by exactly one chunk 🧵
+        assert left.owns(left.keep_stop - 1) and not right.owns(left.keep_stop - 1)
+        assert right.owns(right.keep_start) and not left.owns(right.keep_start)
+    assert chunks[-1].owns(len(samples) + SR)
+
+
+def test_plan_chunks_without_overlap_still_own_each_instant_once():
+    """With no overlap stop == keep_stop everywhere; only the last chunk owns the tail. 🧷"""
+    samples = speech_with_pauses([], total_seconds=65)
+
+    chunks = plan_chunks(samples, SR, chunk_seconds=20, overlap_seconds=0)
+
+    assert [c.is_last for c in chunks] == [False] * (len(chunks) - 1) + [True]
+    for t in range(0, 70 * SR, SR // 2):
+        assert sum(c.owns(t) for c in chunks) == 1
@@ -0,0 +1,49 @@
+import pytest
+from src.infrastructure.cpu_budget import CpuBudget, ThreadLease
+
+
+def test_cpu_budget_splits_threads_between_parallel_jobs():
+    budget = CpuBudget(total_threads=16, concurrent_jobs=2)
+
+    assert budget.per_job == 8
+    assert budget.lease("pyannote") == ThreadLease("pyannote", threads=8)
+
+
+def test_cpu_budget_divides_a_stage_among_its_processes():
+    """4 whisper-cli processes share the job's 12 threads: 3 each. 🧩"""
+    budget = CpuBudget(total_threads=12)
+
+    lease = budget.lease("whisper", processes=4)
+
+    assert (lease.processes, lease.threads, lease.total) == (4, 3, 12)
+
+
+def test_cpu_budget_never_leases_zero_threads():
+    budget = CpuBudget(total_threads=2, concurrent_jobs=4)
+
+    assert budget.lease("whisper", processes=3).threads == 1
+
+
+def test_cpu_budget_honours_explicit_request_but_warns(mocker):
+    logger = mocker.Mock()
+    budget = CpuBudget(total_threads=8, logger=logger)
+
+    lease = budget.lease("whisper", requested=16)
+
+    assert lease.threads == 16
+    assert "oversubscribed" in logger.warning.call_args[0][0]
+
+
+def test_cpu_budget_reports_leases_and_utilization(mocker):
+    logger = mocker.Mock()
+    budget = CpuBudget(total_threads=8, logger=logger)
+    budget.lease("whisper", processes=2)
+    budget.lease("llama.cpp")
+
+    budget.report(wall_seconds=10.0, cpu_seconds=60.0)
+
+    lines = [c.args[0] for c in logger.info.call_args_list]
+    assert budget.utilization(10.0, 60.0) == pytest.approx(0.75)
+    assert any("whisper: 2 process(es) x 4 threads" in line for line in lines)
+    assert any("llama.cpp: 1 process(es) x 8 threads" in line for line in lines)
+    assert "CPU utilization: 75% of 8 threads" in lines[-1]
@@ -62,3 +62,135 @@ def test_pyannote_diarize_with_full_options(mocker):
     assert kwargs["num_speakers"] == 2
     assert kwargs["min_speakers"] == 1
     assert kwargs["max_speakers"] == 3
+
+
+def test_pyannote_diarize_passes_mapped_pcm_as_waveform(mocker):
+    """Mapped samples go to Pyannote as an in-memory waveform, not a path. 🗺️"""
+    import numpy as np
+
+    mocker.patch.dict(os.environ, {"HF_TOKEN": "valid"})
+    mock_pipeline = MagicMock()
+    mocker.patch("pyannote.audio.Pipeline.from_pretrained", return_value=mock_pipeline)
+
+    diarizer = PyannoteDiarizer()
+    pcm = np.array([0, 16384, -32768], dtype="<i2")
+    diarizer.diarize(AudioArtifact(file_path="test.wav", pcm=pcm))
+
+    (audio_input,), _ = mock_pipeline.call_args
+    assert audio_input["sample_rate"] == 16000
+    assert tuple(audio_input["waveform"].shape) == (1, 3)
+    assert audio_input["waveform"][0].tolist() == [0.0, 0.5, -1.0]
+
+
+def test_pyannote_windowed_diarization_clusters_speakers_globally(mocker):
+    """
+    Each window numbers its speakers from scratch; the embeddings say window
+    1's SPEAKER_00 is window 0's SPEAKER_01, so both get one global id. 🪟🧲
+    """
+    import numpy as np
+
+    mocker.patch.dict(os.environ, {"HF_TOKEN": "valid"})
+
+    def window_output(turns, embeddings):
+        diarization = MagicMock()
+        diarization.labels.return_value = sorted({label for _, _, label in turns})
+        diarization.itertracks.return_value = [
+            (Mock(start=start, end=end), None, label) for start, end, label in turns
+        ]
+        return Mock(speaker_diarization=diarization, speaker_embeddings=embeddings)
+
+    alice, bob = np.array([1.0, 0.0, 0.0]), np.array([0.0, 1.0, 0.0])
+    mock_pipeline = MagicMock(
+        side_effect=[
+            window_output(
+                [(1.0, 4.0, "SPEAKER_00"), (5.0, 9.0, "SPEAKER_01")],
+                np.stack([alice, bob]),
+            ),
+            window_output([(0.5, 3.0, "SPEAKER_00")], np.stack([bob])),
+        ]
+    )
+    mocker.patch("pyannote.audio.Pipeline.from_pretrained", return_value=mock_pipeline)
+
+    diarizer = PyannoteDiarizer(window_seconds=10)
+    pcm = np.random.default_rng(0).integers(-8000, 8000, 16000 * 16).astype("<i2")
+    pcm[160000:168000] = 0  # 0.5s pause at 10s -> window cut at 10.025s 🔇
+    turns = diarizer.diarize(
+        AudioArtifact(file_path="test.wav", pcm=pcm),
+        options=DiarizationOptions(num_speakers=2),
+    )
+
+    assert mock_pipeline.call_count == 2
+    _, kwargs = mock_pipeline.call_args
+    assert kwargs == {"max_speakers": 2}
+    assert [t.speaker_id for t in turns] == ["SPEAKER_00", "SPEAKER_01", "SPEAKER_01"]
+    # Window 1 starts at the cut, so its turn is shifted into recording time
+    assert turns[2].timestamp.start.total_seconds() == 10.525
+
+
+def test_pyannote_names_known_speakers_from_the_index(mocker):
+    """Clusters matching an enrolled voice get its name; others stay anonymous. 🗂️"""
+    import numpy as np
+
+    mocker.patch.dict(os.environ, {"HF_TOKEN": "valid"})
+    diarization = MagicMock()
+    diarization.labels.return_value = ["SPEAKER_00", "SPEAKER_01"]
+    diarization.itertracks.return_value = [
+        (Mock(start=0.0, end=2.0), None, "SPEAKER_00"),
+        (Mock(start=2.0, end=4.0), None, "SPEAKER_01"),
+    ]
+    embeddings = np.array([[1.0, 0.0], [0.0, 1.0]])
+    mock_pipeline = MagicMock(
+        return_value=Mock(
+            speaker_diarization=diarization, speaker_embeddings=embeddings
+        )
+    )
+    mocker.patch("pyannote.audio.Pipeline.from_pretrained", return_value=mock_pipeline)
+    index = Mock()
+    index.identify.return_value = [None, "Anna"]
+
+    turns = PyannoteDiarizer(speaker_index=index).diarize(
+        AudioArtifact(file_path="test.wav")
+    )
+
+    assert [t.speaker_id for t in turns] == ["SPEAKER_00", "Anna"]
+    assert index.identify.call_args.args[0].tolist() == embeddings.tolist()
+
+
+def test_pyannote_cpu_tuning_sets_batches_and_quantizes_embeddings(mocker):
+    """Batch sizes land on the pipeline; the embedding model is swapped for int8. 🎛️🗜️"""
+    mocker.patch.dict(os.environ, {"HF_TOKEN": "valid"})
+    mocker.patch("torch.cuda.is_available", return_value=False)
+    mock_pipeline = MagicMock()
+    mock_pipeline.segmentation_batch_size = 1
+    mock_pipeline.embedding_batch_size = 1
+    float_model = mock_pipeline._embedding.model_
+    mocker.patch("pyannote.audio.Pipeline.from_pretrained", return_value=mock_pipeline)
+    quantize = mocker.patch(
+        "torch.ao.quantization.quantize_dynamic", return_value="int8_model"
+    )
+
+    PyannoteDiarizer(
+        segmentation_batch_size=32, embedding_batch_size=64, quantize_embeddings=True
+    )
+
+    assert mock_pipeline.segmentation_batch_size == 32
+    assert mock_pipeline.embedding_batch_size == 64
+    assert quantize.call_args.args[0] is float_model
+    assert mock_pipeline._embedding.model_ == "int8_model"
+
+
+def test_pyannote_runs_under_inference_mode(mocker):
+    import torch
+
+    mocker.patch.dict(os.environ, {"HF_TOKEN": "valid"})
+    seen = []
+    mock_pipeline = MagicMock(
+        side_effect=lambda *a, **k: seen.append(torch.is_inference_mode_enabled())
+        or MagicMock()
+    )
+    mocker.patch("pyannote.audio.Pipeline.from_pretrained", return_value=mock_pipeline)
+
+    PyannoteDiarizer().diarize(AudioArtifact(file_path="test.wav"))
+    PyannoteDiarizer(inference_mode=False).diarize(AudioArtifact(file_path="test.wav"))
+
+    assert seen == [True, False]
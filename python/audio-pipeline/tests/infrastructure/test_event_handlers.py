@@ -1,7 +1,8 @@
 import pytest
 from uuid import uuid4
 from src.infrastructure.event_handlers import LoggingEventHandler
-from src.domain.events import PipelineStepTimed
+from src.domain.events import PipelineStepTimed, SpeechCompacted, JobProfiled
+from src.domain.value_objects import StepProfile
 
 
 def test_logging_handler_duration_formatting_via_public_api(mocker):
@@ -35,3 +36,38 @@ def test_logging_handler_duration_formatting_via_public_api(mocker):
     e4 = PipelineStepTimed(job_id=job_id, step_name="Step4", duration_seconds=3665)
     handler.handle_step_timed(e4)
     assert "Finished Step4 in 1h 1m 5s" in mock_logger.info.call_args[0][0]
+
+
+def test_logging_handler_reports_skipped_silence(mocker):
+    """The VAD summary states how much audio never reached ASR. 🔇"""
+    mock_logger = mocker.Mock()
+    handler = LoggingEventHandler(mock_logger, mocker.Mock())
+
+    handler.handle_speech_compacted(
+        SpeechCompacted(job_id=uuid4(), original_seconds=3600, speech_seconds=2700)
+    )
+
+    message = mock_logger.info.call_args[0][0]
+    assert "VAD kept 45m 0s of 1h 0m 0s" in message
+    assert "skipped 25.0%" in message
+    assert "15m 0s never reaches ASR" in message
+
+
+def test_logging_handler_summarizes_job_profile_slowest_first(mocker):
+    """The job-end profile puts the bottleneck on top with its verdict. 📊"""
+    mock_logger = mocker.Mock()
+    handler = LoggingEventHandler(mock_logger, mocker.Mock())
+    ingest = StepProfile("📦 Ingestion", 1.0, 0.1, 0.8, 200 * 1024**2, 0)
+    asr = StepProfile("🎤 Transcription", 3.0, 0.2, 11.8, 3 * 1024**3, 0, 40 * 1024**2)
+
+    handler.handle_job_profiled(JobProfiled(job_id=uuid4(), steps=(ingest, asr)))
+
+    lines = [call.args[0] for call in mock_logger.info.call_args_list]
+    assert "Profile: 4.000s wall, 12.9 CPU-s over 2 step(s)" in lines[0]
+    assert "75% 🎤 Transcription: cpu-bound, 3.000s wall, 12.0 CPU-s" in lines[1]
+    assert (
+        "(11.8 in subprocesses, 400%), peak RSS 3.0 GiB (+0 B), Python peak 40.0 MiB"
+        in lines[1]
+    )
+    assert "25% 📦 Ingestion: cpu-bound" in lines[2]
+    assert "Python peak" not in lines[2]
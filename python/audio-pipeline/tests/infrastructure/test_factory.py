@@ -2,9 +2,17 @@ from dataclasses import dataclass
 import pytest
 from src.infrastructure.factory import PipelineComponentFactory
 from src.infrastructure.logging import NullLogger
-from src.infrastructure.transcription import WhisperTranscriber, AzureFastTranscriber
+from src.infrastructure.transcription import (
+    WhisperTranscriber,
+    ChunkedWhisperTranscriber,
+    WhisperServerTranscriber,
+    AzureFastTranscriber,
+    ChunkedAzureTranscriber,
+)
 from src.infrastructure.diarization import PyannoteDiarizer, NullDiarizer
 from src.application.enrichers.merging import TokenMergerEnricher
+from src.application.enrichers.fused import MergingSegmentationEnricher
+from src.infrastructure.vad import EnergyVoiceActivityDetector
 
 
 @dataclass
@@ -20,6 +28,28 @@ class MockArgs:
     annotation_context: int = 10
     annotation_batch: int = 1
     use_azure: bool = False
+    previous_transcript: str = None
+    columnar_words: bool = False
+    fused_merge: bool = False
+    audio_cache_dir: str = None
+    in_memory_audio: bool = False
+    vad: bool = False
+    whisper_threads: int = None
+    whisper_workers: int = 1
+    whisper_server: bool = False
+    cpu_threads: int = None
+    parallel_jobs: int = 1
+    chunk_seconds: float = 300.0
+    azure_upload_codec: str = "flac"
+    azure_workers: int = 1
+    diarization_window: float = None
+    speaker_index: str = None
+    diarization_segmentation_batch: int = None
+    diarization_embedding_batch: int = None
+    quantize_diarization: bool = False
+    record: str = None
+    replay: str = None
+    replay_latency: bool = False
 
 
 def test_factory_builds_local_stack(mocker):
@@ -40,6 +70,65 @@ def test_factory_builds_local_stack(mocker):
     assert any(isinstance(e, TokenMergerEnricher) for e in enrichers)
 
 
+def test_factory_builds_fused_local_stack(mocker):
+    """Verifies --fused-merge swaps Segmentation + TokenMerger for the fused pass. ✂️🧩"""
+    mocker.patch("os.path.exists", return_value=True)
+    mocker.patch.dict("os.environ", {"HF_TOKEN": "fake_token"})
+
+    args = MockArgs(use_azure=False, fused_merge=True)
+    factory = PipelineComponentFactory(args, NullLogger())
+
+    _, _, _, _, enrichers = factory.build_components()
+
+    assert isinstance(enrichers[0], MergingSegmentationEnricher)
+    assert not any(isinstance(e, TokenMergerEnricher) for e in enrichers)
+
+
+def test_factory_builds_chunked_whisper_for_multiple_workers(mocker):
+    """--whisper-workers > 1 wraps Whisper in the chunked parallel transcriber. 🧩"""
+    mocker.patch("os.path.exists", return_value=True)
+    mocker.patch.dict("os.environ", {"HF_TOKEN": "fake_token"})
+
+    args = MockArgs(use_azure=False, whisper_workers=4, whisper_threads=16)
+    _, transcriber, _, _, _ = PipelineComponentFactory(
+        args, NullLogger()
+    ).build_components()
+
+    assert isinstance(transcriber, ChunkedWhisperTranscriber)
+    assert transcriber.workers == 4
+    assert transcriber.whisper.threads == 16
+
+
+def test_factory_builds_whisper_server_transcriber(mocker):
+    """--whisper-server swaps the per-file CLI for the supervised server. 🖥️"""
+    mocker.patch("os.path.exists", return_value=True)
+    mocker.patch.dict("os.environ", {"HF_TOKEN": "fake_token"})
+
+    args = MockArgs(use_azure=False, whisper_server=True)
+    _, transcriber, _, _, _ = PipelineComponentFactory(
+        args, NullLogger()
+    ).build_components()
+
+    assert isinstance(transcriber, WhisperServerTranscriber)
+    assert transcriber.executable_path.endswith("whisper-server")
+    assert transcriber.process is None  # Spawned lazily on the first job 💤
+
+
+def test_factory_leases_threads_from_the_cpu_budget(mocker):
+    """Two parallel jobs on 12 cores: 6 threads per job, split over 3 Whisper workers. 🧮"""
+    mocker.patch("os.path.exists", return_value=True)
+    mocker.patch.dict("os.environ", {"HF_TOKEN": "fake_token"})
+    set_threads = mocker.patch("torch.set_num_threads")
+
+    args = MockArgs(use_azure=False, cpu_threads=12, parallel_jobs=2, whisper_workers=3)
+    factory = PipelineComponentFactory(args, NullLogger())
+    _, transcriber, _, _, _ = factory.build_components()
+
+    assert transcriber.whisper.threads == 6
+    assert factory.cpu_budget.leases["whisper"].threads == 2
+    set_threads.assert_called_once_with(6)
+
+
 def test_factory_builds_azure_stack(mocker):
     """Verifies factory builds the Azure Fast Transcription stack when use_azure is True. ☁️🏎️💨"""
     args = MockArgs(use_azure=True)
@@ -63,3 +152,49 @@ def test_factory_builds_azure_stack(mocker):
     assert isinstance(diarizer, NullDiarizer)
     # Check if TokenMergerEnricher is ABSENT in the Azure stack! 🧼🚿
     assert not any(isinstance(e, TokenMergerEnricher) for e in enrichers)
+
+
+def test_factory_builds_chunked_azure_for_multiple_workers(mocker):
+    """--azure-workers > 1 wraps Fast Transcription in the chunked transcriber. ☁️🧩"""
+    mocker.patch.dict(
+        "os.environ",
+        {
+            "AZURE_SPEECH_KEY": "fake",
+            "AZURE_SPEECH_REGION": "eastus2",
+            "AZURE_AI_INFERENCE_KEY": "fake",
+            "AZURE_AI_INFERENCE_ENDPOINT": "https://fake.models.ai.azure.com/chat/completions?api-version=2024-05-01-preview",
+        },
+    )
+    factory = PipelineComponentFactory(
+        MockArgs(use_azure=True, azure_workers=4), NullLogger()
+    )
+
+    _, transcriber, _, _, _ = factory.build_components()
+
+    assert isinstance(transcriber, ChunkedAzureTranscriber)
+    assert transcriber.workers == 4
+    assert isinstance(transcriber.azure, AzureFastTranscriber)
+
+
+def test_factory_builds_vad_only_when_requested():
+    """--vad is opt-in; without it the pipeline gets no detector. 🔇"""
+    assert PipelineComponentFactory(MockArgs(), NullLogger()).build_vad() is None
+    assert isinstance(
+        PipelineComponentFactory(MockArgs(vad=True), NullLogger()).build_vad(),
+        EnergyVoiceActivityDetector,
+    )
+
+
+def test_factory_replays_azure_stack_without_credentials(mocker, tmp_path):
+    """--replay answers from the cassette, so no Azure keys are needed. 📼☁️"""
+    mocker.patch.dict("os.environ", {}, clear=True)
+    cassette_path = tmp_path / "run.json"
+    cassette_path.write_text('{"version": 1, "interactions": []}')
+
+    factory = PipelineComponentFactory(
+        MockArgs(use_azure=True, replay=str(cassette_path)), NullLogger()
+    )
+    _, transcriber, _, _, _ = factory.build_components()
+
+    assert factory.replaying
+    assert isinstance(transcriber, AzureFastTranscriber)
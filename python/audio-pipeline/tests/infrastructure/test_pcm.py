@@ -0,0 +1,79 @@
+import os
+import struct
+import wave
+import numpy as np
+import pytest
+from src.infrastructure.audio import FFmpegAudioProcessor
+from src.infrastructure.pcm import find_data_chunk, map_pcm16, to_float_waveform
+
+NORMALIZED_WAV = os.path.join(
+    os.path.dirname(__file__), "../data/test_10s_normalized.wav"
+)
+
+
+def test_map_pcm16_matches_wave_module_samples():
+    """The memmap sees exactly the samples the stdlib decoder returns. 🗺️🎯"""
+    with wave.open(NORMALIZED_WAV, "rb") as wav:
+        expected = np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2")
+
+    samples = map_pcm16(NORMALIZED_WAV)
+
+    assert isinstance(samples, np.memmap)
+    assert np.array_equal(samples, expected)
+
+
+def test_find_data_chunk_skips_extra_chunks(tmp_path):
+    """LIST/odd-sized chunks before 'data' are skipped with word alignment. 🧱"""
+    fmt = struct.pack("<HHIIHH", 1, 1, 16000, 32000, 2, 16)
+    extra = b"abc"  # Odd size -> one pad byte
+    data = struct.pack("<3h", 1, -2, 3)
+    body = (
+        b"WAVE"
+        + b"fmt "
+        + struct.pack("<I", len(fmt))
+        + fmt
+        + b"LIST"
+        + struct.pack("<I", len(extra))
+        + extra
+        + b"\x00"
+        + b"data"
+        + struct.pack("<I", len(data))
+        + data
+    )
+    path = tmp_path / "odd.wav"
+    path.write_bytes(b"RIFF" + struct.pack("<I", len(body)) + body)
+
+    offset, size = find_data_chunk(str(path))
+
+    assert size == len(data)
+    assert map_pcm16(str(path)).tolist() == [1, -2, 3]
+
+
+def test_find_data_chunk_rejects_non_wav(tmp_path):
+    path = tmp_path / "fake.wav"
+    path.write_bytes(b"ID3" + b"\x00" * 20)
+
+    with pytest.raises(ValueError, match="Not a RIFF/WAVE file"):
+        find_data_chunk(str(path))
+
+
+def test_to_float_waveform_scales_into_unit_range():
+    samples = np.array([-32768, 0, 16384, 32767], dtype="<i2")
+
+    waveform = to_float_waveform(samples)
+
+    assert waveform.shape == (1, 4)
+    assert waveform.dtype == np.float32
+    assert waveform[0].tolist() == [-1.0, 0.0, 0.5, 32767 / 32768]
+
+
+def test_ffmpeg_processor_attaches_mapped_pcm(mocker, tmp_path):
+    """With map_pcm the artifact carries the samples, file path still set. 💾"""
+    mocker.patch("subprocess.run")
+
+    artifact = FFmpegAudioProcessor(map_pcm=True, work_dir=str(tmp_path)).normalize(
+        NORMALIZED_WAV
+    )
+
+    assert artifact.file_path.startswith(str(tmp_path))
+    assert len(artifact.pcm) == 160125
@@ -0,0 +1,39 @@
+import subprocess
+import sys
+import tracemalloc
+from src.infrastructure.profiling import ResourceStepProfiler
+
+
+def test_profiler_counts_cpu_of_waited_for_subprocesses():
+    """whisper-cli/FFmpeg burn CPU in a child; it must not look like waiting. 🔬"""
+    profiler = ResourceStepProfiler()
+
+    started = profiler.start()
+    subprocess.run(
+        [sys.executable, "-c", "sum(i * i for i in range(3_000_000))"], check=True
+    )
+    profile = profiler.finish("🎤 Transcription", started)
+
+    assert profile.step_name == "🎤 Transcription"
+    assert profile.child_cpu_seconds > 0.05
+    assert profile.cpu_seconds < profile.child_cpu_seconds
+    assert profile.wall_seconds >= profile.child_cpu_seconds * 0.5
+    assert profile.peak_rss_bytes > 0
+    assert profile.python_peak_bytes is None
+
+
+def test_profiler_traces_python_peak_only_inside_steps():
+    profiler = ResourceStepProfiler(trace_python_memory=True)
+
+    started = profiler.start()
+    block = bytearray(8 * 1024 * 1024)
+    del block
+    profile = profiler.finish("🧩 Alignment", started)
+
+    assert profile.python_peak_bytes >= 8 * 1024 * 1024
+    assert not tracemalloc.is_tracing()
+
+    # Each step reports its own peak, not the biggest one so far 📉
+    started = profiler.start()
+    profile = profiler.finish("✨ Enrichment", started)
+    assert profile.python_peak_bytes < 1024 * 1024
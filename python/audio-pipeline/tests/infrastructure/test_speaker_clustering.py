@@ -0,0 +1,44 @@
+import numpy as np
+from src.infrastructure.speaker_clustering import cluster_embeddings, cosine_distances
+
+
+def speakers(rng, centres, per_speaker, noise=0.05):
+    """Noisy copies of each centre embedding, speaker by speaker. 🎙️"""
+    return np.concatenate(
+        [c + noise * rng.standard_normal((per_speaker, len(c))) for c in centres]
+    )
+
+
+def test_cosine_distances_are_zero_for_parallel_vectors():
+    d = cosine_distances(np.array([[1.0, 0.0], [2.0, 0.0], [0.0, 1.0]]))
+    assert np.allclose(np.diag(d), 0.0)
+    assert np.isclose(d[0, 1], 0.0)
+    assert np.isclose(d[0, 2], 1.0)
+
+
+def test_threshold_clustering_recovers_speakers():
+    rng = np.random.default_rng(0)
+    centres = np.eye(3, 16)
+    labels = cluster_embeddings(speakers(rng, centres, 4))
+    assert labels.tolist() == [0] * 4 + [1] * 4 + [2] * 4
+
+
+def test_num_clusters_forces_the_count():
+    rng = np.random.default_rng(1)
+    centres = np.eye(4, 16)
+    labels = cluster_embeddings(speakers(rng, centres, 3), num_clusters=2)
+    assert len(set(labels.tolist())) == 2
+
+
+def test_same_window_speakers_are_never_merged():
+    """Two near-identical voices in ONE window stay apart (cannot-link). 🚫🔗"""
+    embeddings = np.array([[1.0, 0.0], [1.0, 0.01], [1.0, 0.005]])
+    labels = cluster_embeddings(embeddings, groups=[0, 0, 1])
+    assert labels[0] != labels[1]
+    assert labels[2] in (labels[0], labels[1])
+
+
+def test_labels_follow_first_appearance_and_empty_input():
+    embeddings = np.array([[0.0, 1.0], [1.0, 0.0], [0.0, 1.0]])
+    assert cluster_embeddings(embeddings).tolist() == [0, 1, 0]
+    assert cluster_embeddings(np.zeros((0, 4))).tolist() == []
@@ -0,0 +1,53 @@
+import numpy as np
+from src.infrastructure.speaker_index import NumpySpeakerIndex
+
+ANNA = np.array([1.0, 0.0, 0.0, 0.0])
+BEN = np.array([0.0, 1.0, 0.0, 0.0])
+GUEST = np.array([0.0, 0.0, 1.0, 0.0])
+
+
+def test_empty_index_identifies_nobody(tmp_path):
+    index = NumpySpeakerIndex(str(tmp_path / "voices.npz"))
+    assert index.identify(np.stack([ANNA, BEN])) == [None, None]
+
+
+def test_identifies_enrolled_speakers_and_leaves_strangers_anonymous(tmp_path):
+    index = NumpySpeakerIndex(str(tmp_path / "voices.npz"))
+    index.enroll("Anna", ANNA)
+    index.enroll("Ben", 3.0 * BEN)  # Scale doesn't matter, direction does 📐
+
+    clusters = np.stack([BEN + 0.1 * GUEST, GUEST, ANNA + 0.05 * BEN])
+    assert index.identify(clusters) == ["Ben", None, "Anna"]
+
+
+def test_each_name_is_used_once_per_job(tmp_path):
+    """Two clusters close to Anna: only the closer one gets her name. 🏷️"""
+    index = NumpySpeakerIndex(str(tmp_path / "voices.npz"), threshold=0.5)
+    index.enroll("Anna", ANNA)
+
+    clusters = np.stack([ANNA + 0.3 * BEN, ANNA + 0.1 * BEN])
+    assert index.identify(clusters) == [None, "Anna"]
+
+
+def test_best_of_several_voiceprints_counts(tmp_path):
+    index = NumpySpeakerIndex(str(tmp_path / "voices.npz"))
+    index.enroll("Anna", ANNA)
+    index.enroll("Anna", GUEST)  # e.g. a second microphone setup 🎙️
+
+    assert index.identify(GUEST + 0.05 * BEN) == ["Anna"]
+
+
+def test_index_round_trips_through_npz_and_removes(tmp_path):
+    path = str(tmp_path / "nested" / "voices.npz")
+    index = NumpySpeakerIndex(path)
+    index.enroll("Anna", ANNA)
+    index.enroll("Ben", BEN)
+    index.save()
+
+    reloaded = NumpySpeakerIndex(path)
+    assert reloaded.identify(np.stack([BEN, ANNA])) == ["Ben", "Anna"]
+    assert reloaded.remove("Ben") == 1
+    assert reloaded.identify(BEN) == [None]
+    assert not any(
+        p.name.endswith(".partial.npz") for p in (tmp_path / "nested").iterdir()
+    )
@@ -1,8 +1,19 @@
+import os
+import re
+import shutil
 import pytest
+import httpx
 import subprocess
 from src.domain.value_objects import LanguageTag
 from src.domain.entities import AudioArtifact
-from src.infrastructure.transcription import WhisperTranscriber, AzureFastTranscriber
+import numpy as np
+from src.infrastructure.pcm import write_pcm16
+from src.infrastructure.transcription import (
+    WhisperTranscriber,
+    ChunkedWhisperTranscriber,
+    AzureFastTranscriber,
+    ChunkedAzureTranscriber,
+)
 
 
 def test_whisper_transcriber_failure_on_missing_binary(mocker):
@@ -95,3 +106,341 @@ def test_azure_fast_transcriber_initialization(mocker):
     transcriber = AzureFastTranscriber(api_key="fake_key", region="eastus2")
     assert transcriber.api_key == "fake_key"
     assert "eastus2" in transcriber.endpoint
+
+
+def test_whisper_transcriber_columnar_words_match_objects(mocker, tmp_path):
+    """Verifies that the columnar word store yields the same tokens as Word objects. 🗄️🎤"""
+    raw_json = os.path.join(os.path.dirname(__file__), "../data/test_30s_raw.json")
+    shutil.copy(raw_json, tmp_path / "test_30s.json")
+    mocker.patch("subprocess.run", return_value=mocker.Mock(returncode=0))
+    audio = AudioArtifact(file_path=str(tmp_path / "test_30s.wav"))
+
+    objects = WhisperTranscriber("whisper", "model").transcribe(
+        audio, LanguageTag("de")
+    )
+    columnar = WhisperTranscriber("whisper", "model", columnar_words=True).transcribe(
+        audio, LanguageTag("de")
+    )
+
+    assert len(columnar) == len(objects)
+    for expected, actual in zip(objects, columnar):
+        assert actual.timestamp == expected.timestamp
+        assert actual.words.texts() == [w.text for w in expected.words]
+        assert [w.timestamp for w in actual.words] == [
+            w.timestamp for w in expected.words
+        ]
+
+
+def whisper_json(*segments):
+    """Minimal whisper-cli JSON: (from_ms, to_ms, text) per segment. 🎤"""
+    return {
+        "transcription": [
+            {
+                "offsets": {"from": start, "to": end},
+                "text": text,
+                "tokens": [
+                    {
+                        "text": f" {text}",
+                        "offsets": {"from": start, "to": end},
+                        "p": 0.9,
+                    }
+                ],
+            }
+            for start, end, text in segments
+        ]
+    }
+
+
+def test_chunked_whisper_stitches_chunks_without_duplicates(mocker, tmp_path):
+    """
+    Two chunks cut in a pause at ~10s with 2s overlap: the segment inside the
+    overlap shows up in BOTH whisper outputs but only once in the result,
+    shifted to recording time. 🧩🧵
+    """
+    noise = np.random.default_rng(0).integers(-8000, 8000, 16000 * 20)
+    noise[160000:168000] = 0  # 0.5s pause at 10s -> cut at 10.025s 🔇
+    wav = tmp_path / "long.wav"
+    write_pcm16(str(wav), [noise], 16000)
+    outputs = {
+        # Chunk 0 covers [0s, 12.025s), chunk 1 covers [8.025s, 20s) 🧭
+        "chunk_0000.wav": whisper_json((1000, 2000, "eins"), (9500, 10400, "zwei")),
+        "chunk_0001.wav": whisper_json((1475, 2375, "zwei"), (5000, 6000, "drei")),
+    }
+    seen_threads = []
+
+    def fake_run(path, language, threads):
+        seen_threads.append(threads)
+        assert os.path.exists(path)
+        return outputs[os.path.basename(path)]
+
+    whisper = WhisperTranscriber("whisper-cli", "model.bin", threads=8)
+    mocker.patch.object(whisper, "run_whisper", side_effect=fake_run)
+    transcriber = ChunkedWhisperTranscriber(
+        whisper, workers=2, chunk_seconds=12, overlap_seconds=2
+    )
+
+    utterances = transcriber.transcribe(
+        AudioArtifact(file_path=str(wav), format="wav"), LanguageTag("de")
+    )
+
+    assert [u.text for u in utterances] == ["eins", "zwei", "drei"]
+    assert [u.timestamp.start.total_seconds() for u in utterances] == [1.0, 9.5, 13.025]
+    assert seen_threads == [4, 4]
+    # Chunk WAVs are cleaned up afterwards 🧹
+    assert not any(p.name.startswith("whisper_chunks_") for p in tmp_path.iterdir())
+
+
+def _capturing_client(mocker, captured):
+    """A real httpx.Client whose transport records the streamed request. 📤"""
+    real_client = httpx.Client
+
+    def handler(request):
+        captured["content_type"] = request.headers["content-type"]
+        captured["body"] = request.read()
+        return httpx.Response(200, json={"phrases": []})
+
+    mocker.patch(
+        "httpx.Client",
+        side_effect=lambda **kw: real_client(transport=httpx.MockTransport(handler)),
+    )
+
+
+def test_azure_upload_streams_wav_and_reports_bytes(mocker, tmp_path):
+    wav = tmp_path / "clip.wav"
+    wav.write_bytes(b"RIFF" + b"\x01" * 200_000)
+    captured = {}
+    _capturing_client(mocker, captured)
+    logger = mocker.Mock()
+
+    AzureFastTranscriber("k", "eastus2", logger=logger).transcribe(
+        AudioArtifact(file_path=str(wav)), LanguageTag("en")
+    )
+
+    assert wav.read_bytes() in captured["body"]
+    assert b"audio/wav" in captured["body"]
+    uploaded = [
+        c.args[0] for c in logger.info.call_args_list if "Uploaded" in c.args[0]
+    ]
+    assert uploaded and "0.2 MiB (audio/wav)" in uploaded[0]
+
+
+def test_azure_upload_sends_flac_and_cleans_up(mocker, tmp_path):
+    wav = tmp_path / "clip.wav"
+    wav.write_bytes(b"RIFF" + b"\x01" * 1000)
+
+    def fake_ffmpeg(command, **kwargs):
+        with open(command[-1], "wb") as f:
+            f.write(b"fLaC-compressed")
+        return mocker.Mock(returncode=0, stderr="")
+
+    run = mocker.patch("subprocess.run", side_effect=fake_ffmpeg)
+    captured = {}
+    _capturing_client(mocker, captured)
+
+    AzureFastTranscriber("k", "eastus2", upload_codec="flac").transcribe(
+        AudioArtifact(file_path=str(wav)), LanguageTag("en")
+    )
+
+    assert "flac" in run.call_args.args[0]
+    assert b"fLaC-compressed" in captured["body"]
+    assert b"audio/flac" in captured["body"]
+    assert not (tmp_path / "clip.upload.flac").exists()
+
+
+def test_azure_upload_falls_back_to_wav_without_ffmpeg(mocker, tmp_path):
+    wav = tmp_path / "clip.wav"
+    wav.write_bytes(b"RIFF" + b"\x01" * 1000)
+    mocker.patch("subprocess.run", side_effect=FileNotFoundError)
+    captured = {}
+    _capturing_client(mocker, captured)
+
+    AzureFastTranscriber("k", "eastus2", upload_codec="opus").transcribe(
+        AudioArtifact(file_path=str(wav)), LanguageTag("en")
+    )
+
+    assert wav.read_bytes() in captured["body"]
+    assert b"audio/wav" in captured["body"]
+
+
+def test_azure_rejects_unknown_upload_codec():
+    with pytest.raises(ValueError, match="Unknown upload codec"):
+        AzureFastTranscriber("k", "eastus2", upload_codec="mp3")
+
+
+def azure_json(*phrases):
+    """(offset_ms, duration_ms, text, speaker) tuples -> Fast Transcription JSON ☁️"""
+    return {
+        "phrases": [
+            {
+                "offsetMilliseconds": offset,
+                "durationMilliseconds": duration,
+                "text": text,
+                "speaker": speaker,
+                "words": [
+                    {
+                        "text": text,
+                        "offsetMilliseconds": offset,
+                        "durationMilliseconds": duration,
+                    }
+                ],
+            }
+            for offset, duration, text, speaker in phrases
+        ]
+    }
+
+
+def test_chunked_azure_stitches_and_reconciles_speakers(mocker, tmp_path):
+    """
+    Chunk 1 numbers its speakers the other way round. The phrase in the
+    overlap identifies its local speaker 1 as global speaker 2; its unseen
+    local speaker 2 becomes a new global id. 🏷️🧵
+    """
+    noise = np.random.default_rng(0).integers(-8000, 8000, 16000 * 20)
+    noise[160000:168000] = 0  # 0.5s pause at 10s -> cut at 10.025s 🔇
+    wav = tmp_path / "long.wav"
+    write_pcm16(str(wav), [noise], 16000)
+    outputs = {
+        # Chunk 0 covers [0s, 12.025s), chunk 1 covers [8.025s, 20s) 🧭
+        "chunk_0000.wav": azure_json((1000, 2000, "eins", 1), (9000, 800, "zwei", 2)),
+        "chunk_0001.wav": azure_json(
+            (975, 800, "zwei", 1), (4000, 2000, "drei", 2), (7000, 1000, "vier", 1)
+        ),
+    }
+
+    azure = AzureFastTranscriber("k", "eastus2")
+    mocker.patch.object(
+        azure,
+        "request_transcription",
+        side_effect=lambda path, language: outputs[os.path.basename(path)],
+    )
+    logger = mocker.Mock()
+    transcriber = ChunkedAzureTranscriber(
+        azure, workers=2, chunk_seconds=12, overlap_seconds=2, logger=logger
+    )
+
+    utterances = transcriber.transcribe(
+        AudioArtifact(file_path=str(wav), format="wav"), LanguageTag("de")
+    )
+
+    assert [u.text for u in utterances] == ["eins", "zwei", "drei", "vier"]
+    assert [u.speaker_id for u in utterances] == ["1", "2", "3", "2"]
+    # It may be speaker 1 again - nothing to tell from, so the split is reported
+    (split,) = [c.args[0] for c in logger.warning.call_args_list]
+    assert "Chunk 1: speaker 2 was silent in the overlap" in split
+    assert [u.timestamp.start.total_seconds() for u in utterances] == [
+        1.0,
+        9.0,
+        12.025,
+        15.025,
+    ]
+    assert utterances[3].words[0].timestamp.start.total_seconds() == 15.025
+    assert (tmp_path / "long.azure.json").exists()
+    assert not any(p.name.startswith("azure_chunks_") for p in tmp_path.iterdir())
+
+
+def test_chunked_azure_sends_short_audio_as_one_request(mocker, tmp_path):
+    wav = tmp_path / "short.wav"
+    write_pcm16(str(wav), [np.zeros(16000 * 5, dtype="<i2")], 16000)
+    azure = AzureFastTranscriber("k", "eastus2")
+    single = mocker.patch.object(azure, "transcribe", return_value=[])
+
+    ChunkedAzureTranscriber(azure, chunk_seconds=12).transcribe(
+        AudioArtifact(file_path=str(wav), format="wav"), LanguageTag("de")
+    )
+
+    single.assert_called_once()
+
+
+def test_azure_upload_retries_after_429_as_told(mocker, tmp_path):
+    """A throttled upload is re-sent after the Retry-After the service sent. 🚦"""
+    wav = tmp_path / "episode.wav"
+    wav.write_bytes(b"RIFF" + b"\0" * 64)
+    sleep = mocker.patch("time.sleep")
+    replies = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.Response(200, json={"phrases": []}),
+        ]
+    )
+    bodies = []
+
+    def handler(request):
+        bodies.append(request.read())
+        return next(replies)
+
+    real_client = httpx.Client
+    mocker.patch(
+        "httpx.Client",
+        side_effect=lambda **kw: real_client(transport=httpx.MockTransport(handler)),
+    )
+
+    transcriber = AzureFastTranscriber(
+        "k", "eastus2", endpoint="http://127.0.0.1:9/transcribe"
+    )
+    assert transcriber.request_transcription(str(wav), LanguageTag("en")) == {
+        "phrases": []
+    }
+
+    sleep.assert_called_once_with(3.0)
+    assert len(bodies) == 2 and wav.read_bytes() in bodies[1]
+
+
+def test_chunked_azure_resends_only_the_chunk_that_timed_out(mocker, tmp_path):
+    """One chunk's upload times out once; only that chunk goes out again. ⏳🧩"""
+    noise = np.random.default_rng(0).integers(-8000, 8000, 16000 * 20)
+    noise[160000:168000] = 0  # Cut at 10.025s: two chunks, as above 🔇
+    wav = tmp_path / "long.wav"
+    write_pcm16(str(wav), [noise], 16000)
+    sleep = mocker.patch("time.sleep")
+    sent = []
+    timed_out = []
+
+    def handler(request):
+        name = re.search(rb"chunk_\d+\.wav", request.read()).group().decode()
+        sent.append(name)
+        if name == "chunk_0001.wav" and not timed_out:
+            timed_out.append(name)
+            raise httpx.ReadTimeout("slow", request=request)
+        # 5s in: past the overlap, so each chunk owns its phrase
+        return httpx.Response(200, json=azure_json((5000, 500, name, 1)))
+
+    real_client = httpx.Client
+    mocker.patch(
+        "httpx.Client",
+        side_effect=lambda **kw: real_client(transport=httpx.MockTransport(handler)),
+    )
+    azure = AzureFastTranscriber(
+        "k", "eastus2", endpoint="http://127.0.0.1:9/transcribe", retry_base_delay=2.0
+    )
+
+    utterances = ChunkedAzureTranscriber(
+        azure, workers=2, chunk_seconds=12, overlap_seconds=2
+    ).transcribe(AudioArtifact(file_path=str(wav), format="wav"), LanguageTag("de"))
+
+    assert sorted(sent) == ["chunk_0000.wav", "chunk_0001.wav", "chunk_0001.wav"]
+    sleep.assert_called_once_with(2.0)
+    assert [u.text for u in utterances] == ["chunk_0000.wav", "chunk_0001.wav"]
+
+
+def test_azure_upload_gives_up_after_max_retries_on_timeouts(mocker, tmp_path):
+    wav = tmp_path / "episode.wav"
+    wav.write_bytes(b"RIFF" + b"\0" * 64)
+    sleep = mocker.patch("time.sleep")
+
+    def handler(request):
+        raise httpx.ConnectTimeout("down", request=request)
+
+    real_client = httpx.Client
+    mocker.patch(
+        "httpx.Client",
+        side_effect=lambda **kw: real_client(transport=httpx.MockTransport(handler)),
+    )
+    transcriber = AzureFastTranscriber(
+        "k", "eastus2", endpoint="http://127.0.0.1:9/transcribe", max_retries=3
+    )
+
+    with pytest.raises(httpx.ConnectTimeout):
+        transcriber.request_transcription(str(wav), LanguageTag("en"))
+
+    assert [c.args[0] for c in sleep.call_args_list] == [5.0, 10.0]
+    assert not wav.with_suffix(".flac").exists()
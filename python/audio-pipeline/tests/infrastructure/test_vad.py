@@ -0,0 +1,81 @@
+import wave
+from datetime import timedelta
+import numpy as np
+import pytest
+from src.domain.entities import AudioArtifact
+from src.infrastructure.pcm import map_pcm16
+from src.infrastructure.vad import EnergyVoiceActivityDetector
+
+SR = 16000
+
+
+def write_wav(path, samples):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SR)
+        wav.writeframes(samples.astype("<i2").tobytes())
+
+
+def tone(seconds):
+    t = np.arange(int(seconds * SR)) / SR
+    return (8000 * np.sin(2 * np.pi * 440 * t)).astype("<i2")
+
+
+def silence(seconds):
+    return np.zeros(int(seconds * SR), dtype="<i2")
+
+
+@pytest.fixture
+def podcast(tmp_path):
+    """1s speech, 5s dead air, 2s speech, 3s of trailing silence. 🎙️"""
+    path = tmp_path / "podcast.wav"
+    write_wav(path, np.concatenate([tone(1), silence(5), tone(2), silence(3)]))
+    return AudioArtifact(file_path=str(path), format="wav", sample_rate=SR)
+
+
+def test_vad_trims_long_silences_and_maps_back(podcast):
+    vad = EnergyVoiceActivityDetector(frame_ms=20, padding_ms=100, min_silence_ms=500)
+
+    compacted, offset_map = vad.compact(podcast)
+
+    # Two padded regions: [0, 1.1s) and [5.9s, 8.1s) 🔊
+    assert compacted.file_path.endswith("podcast_speech.wav")
+    assert len(map_pcm16(compacted.file_path)) == int(3.3 * SR)
+    assert offset_map.original_starts == (timedelta(0), timedelta(seconds=5.9))
+    assert offset_map.compacted_starts == (timedelta(0), timedelta(seconds=1.1))
+    assert offset_map.skipped_fraction == pytest.approx(1 - 3.3 / 11)
+
+    # 1.5s into the trimmed audio is 0.4s into the second region 🧵
+    assert offset_map.to_original(timedelta(seconds=1.5)) == timedelta(seconds=6.3)
+
+
+def test_vad_keeps_short_pauses(tmp_path):
+    path = tmp_path / "chatty.wav"
+    write_wav(path, np.concatenate([tone(1), silence(0.3), tone(1)]))
+    artifact = AudioArtifact(file_path=str(path), format="wav", sample_rate=SR)
+
+    compacted, offset_map = EnergyVoiceActivityDetector().compact(artifact)
+
+    assert compacted is artifact
+    assert offset_map.skipped_fraction == 0.0
+
+
+def test_vad_keeps_everything_when_nothing_is_loud(tmp_path):
+    path = tmp_path / "quiet.wav"
+    write_wav(path, silence(2))
+    artifact = AudioArtifact(file_path=str(path), format="wav", sample_rate=SR)
+
+    compacted, offset_map = EnergyVoiceActivityDetector().compact(artifact)
+
+    assert compacted is artifact
+    assert offset_map.speech_duration == timedelta(seconds=2)
+
+
+def test_vad_maps_compacted_pcm_when_input_was_mapped(podcast):
+    podcast.pcm = map_pcm16(podcast.file_path)
+
+    compacted, _ = EnergyVoiceActivityDetector(padding_ms=100).compact(podcast)
+
+    assert compacted.pcm is not None
+    assert len(compacted.pcm) == len(map_pcm16(compacted.file_path))
@@ -0,0 +1,109 @@
+import json
+import os
+import stat
+import sys
+import pytest
+from src.domain.entities import AudioArtifact
+from src.domain.value_objects import LanguageTag
+from src.infrastructure.transcription import (
+    WhisperTranscriber,
+    WhisperServerTranscriber,
+)
+
+FAKE_SERVER = os.path.join(os.path.dirname(__file__), "fake_whisper_server.py")
+RAW_JSON = os.path.join(os.path.dirname(__file__), "../data/test_30s_raw.json")
+
+
+def make_executable(path, script: str):
+    path.write_text(script)
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+@pytest.fixture
+def server_transcriber(tmp_path):
+    """A transcriber supervising the fake server as if it were whisper-server. 🎭"""
+    executable = make_executable(
+        tmp_path / "whisper-server",
+        f'#!/bin/sh\nexec "{sys.executable}" "{FAKE_SERVER}" "$@"\n',
+    )
+    transcriber = WhisperServerTranscriber(
+        executable, "ggml-large-v3.bin", startup_timeout=15
+    )
+    yield transcriber
+    transcriber.close()
+
+
+@pytest.fixture
+def audio(tmp_path):
+    path = tmp_path / "episode.wav"
+    path.write_bytes(b"RIFF fake wav")
+    return AudioArtifact(file_path=str(path), format="wav")
+
+
+def test_whisper_server_matches_cli_output(server_transcriber, audio):
+    """Same JSON in, same utterances out - just without the per-file model load. 🖥️🎯"""
+    with open(RAW_JSON, "r", encoding="utf-8") as f:
+        expected = WhisperTranscriber("whisper-cli", "model").parse_segments(
+            json.load(f), None
+        )
+
+    actual = server_transcriber.transcribe(audio, LanguageTag("de"))
+
+    assert len(actual) > 0
+    assert actual == expected
+
+
+def test_whisper_server_is_reused_across_jobs(server_transcriber, audio):
+    """Two jobs, ONE server process - the model stays loaded. 🔥"""
+    first = server_transcriber.run_whisper(audio.file_path, LanguageTag("de"), 8)
+    second = server_transcriber.run_whisper(audio.file_path, LanguageTag("de"), 8)
+
+    assert first["server_pid"] == second["server_pid"] == server_transcriber.process.pid
+
+
+def test_whisper_server_is_restarted_after_crash(server_transcriber, audio):
+    """The supervisor notices a dead server and brings up a fresh one. 🚑"""
+    first = server_transcriber.run_whisper(audio.file_path, LanguageTag("de"), 8)
+    server_transcriber.process.kill()
+    server_transcriber.process.wait()
+
+    second = server_transcriber.run_whisper(audio.file_path, LanguageTag("de"), 8)
+
+    assert second["server_pid"] != first["server_pid"]
+    assert second["transcription"] == first["transcription"]
+
+
+def test_whisper_server_reports_startup_failure(tmp_path, audio):
+    executable = make_executable(
+        tmp_path / "broken-server", "#!/bin/sh\necho 'model not found' >&2\nexit 3\n"
+    )
+    transcriber = WhisperServerTranscriber(executable, "missing.bin", startup_timeout=5)
+
+    with pytest.raises(RuntimeError, match="died during startup! model not found"):
+        transcriber.transcribe(audio, LanguageTag("de"))
+
+
+def test_whisper_server_maps_verbose_json_segments():
+    """Real whisper-server replies OpenAI-style; tokens come from 'words'. 🔁"""
+    transcriber = WhisperServerTranscriber("whisper-server", "model")
+    payload = {
+        "segments": [
+            {
+                "start": 0.5,
+                "end": 1.25,
+                "text": " Hallo Welt",
+                "words": [
+                    {"word": " Hallo", "start": 0.5, "end": 0.9, "probability": 0.8},
+                    {"word": " Welt", "start": 0.9, "end": 1.25, "probability": 0.7},
+                ],
+            }
+        ]
+    }
+
+    (u,) = transcriber.parse_segments(transcriber._from_verbose_json(payload), None)
+
+    assert u.text == "Hallo Welt"
+    assert [w.text for w in u.words] == [" Hallo", " Welt"]
+    assert u.timestamp.end.total_seconds() == 1.25
+    assert u.words[0].confidence == 0.8
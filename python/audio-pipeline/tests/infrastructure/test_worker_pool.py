@@ -0,0 +1,96 @@
+import os
+import sys
+import time
+import pytest
+from src.infrastructure.worker_pool import PreforkWorkerPool
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "fork"), reason="Prefork pool needs os.fork()"
+)
+
+# Built in the parent before forking: workers read it without reloading 🧠
+SHARED_MODEL = {"scale": 3}
+
+
+def scale(payload):
+    return payload * SHARED_MODEL["scale"], os.getpid()
+
+
+def test_results_come_back_in_order_from_forked_workers():
+    with PreforkWorkerPool(scale, workers=2) as pool:
+        results = pool.map(range(6))
+
+    assert [value for value, _ in results] == [0, 3, 6, 9, 12, 15]
+    pids = {pid for _, pid in results}
+    assert os.getpid() not in pids
+    assert 1 <= len(pids) <= 2
+
+
+def test_workers_are_retired_after_max_jobs():
+    with PreforkWorkerPool(scale, workers=2, max_jobs_per_worker=1) as pool:
+        results = pool.map(range(4))
+
+    assert len({pid for _, pid in results}) == 4
+
+
+def test_idle_workers_are_recycled_between_batches():
+    with PreforkWorkerPool(scale, workers=1, idle_seconds=60) as pool:
+        ((_, first),) = pool.map([1])
+        ((_, again),) = pool.map([1])
+        pool.idle_seconds = 0
+        ((_, fresh),) = pool.map([1])
+
+    assert first == again
+    assert fresh != first
+
+
+def test_idle_workers_are_reaped_while_a_slow_job_runs():
+    """The tail of a batch: one worker is done, the other still busy. ⏰"""
+
+    def sleepy(seconds):
+        time.sleep(seconds)
+        return os.getpid()
+
+    with PreforkWorkerPool(sleepy, workers=2, idle_seconds=0.1) as pool:
+        fast, slow = pool.map([0.0, 1.0])
+        survivors = set(pool._pool)
+
+    assert fast != slow
+    assert survivors == {slow}
+
+
+def test_failures_are_reported_after_other_jobs_finish():
+    def fragile(payload):
+        if payload == 2:
+            raise ValueError("bad input")
+        return payload
+
+    with PreforkWorkerPool(fragile, workers=2) as pool:
+        with pytest.raises(RuntimeError, match="job 2: ValueError: bad input"):
+            pool.map(range(4))
+        assert pool.map([7]) == [7]
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="smaps_rollup is Linux-only")
+def test_memory_report_shows_shared_pages():
+    with PreforkWorkerPool(scale, workers=2) as pool:
+        pool.map(range(4))
+        report = pool.memory_report()
+
+    assert report
+    for stats in report:
+        assert 0 < stats["pss"] <= stats["rss"]
+        assert stats["private"] <= stats["rss"]
+
+
+def test_exit_hook_runs_in_each_worker(tmp_path):
+    marker = tmp_path / "closed"
+
+    def close_components():
+        with open(marker, "a") as f:
+            f.write(f"{os.getpid()}\n")
+
+    with PreforkWorkerPool(scale, workers=2, on_worker_exit=close_components) as pool:
+        results = pool.map(range(4))
+
+    assert set(marker.read_text().split()) == {str(pid) for _, pid in results}
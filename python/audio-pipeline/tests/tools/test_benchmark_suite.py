@@ -0,0 +1,75 @@
+import json
+from dataclasses import asdict
+import pytest
+from tools.benchmark_suite import SuiteConfig, compare, main, run_suite
+from tools.synthetic_transcripts import synthetic_turns
+
+
+def test_synthetic_turns_cover_the_audio_with_alternating_speakers():
+    turns = synthetic_turns(hours=0.1, speakers=3, turns=40, seed=1)
+
+    assert len(turns) == 40
+    assert {t.speaker_id for t in turns} == {"SPEAKER_00", "SPEAKER_01", "SPEAKER_02"}
+    assert all(a.speaker_id != b.speaker_id for a, b in zip(turns, turns[1:]))
+    assert abs(turns[-1].timestamp.end.total_seconds() - 360) < 1
+
+
+def test_suite_times_every_stage():
+    config = SuiteConfig(hours=0.02, events=50)
+
+    results = run_suite(config, repeat=2, min_seconds=0.0)
+
+    assert set(results) == {
+        "alignment",
+        "segmentation",
+        "token_merging",
+        "serialize",
+        "deserialize",
+        "deserialize_trusted",
+        "events",
+    }
+    assert results["events"]["items"] == 50
+    assert all(r["best"] <= r["median"] for r in results.values())
+
+
+def test_suite_runs_only_selected_cases():
+    results = run_suite(
+        SuiteConfig(hours=0.01), repeat=1, only=["alignment"], min_seconds=0.0
+    )
+    assert list(results) == ["alignment"]
+
+
+def test_compare_flags_only_slowdowns_beyond_the_threshold():
+    baseline = {
+        "alignment": {"best": 1.0},
+        "events": {"best": 1.0},
+        "serialize": {"best": 1.0},
+    }
+    current = {
+        "alignment": {"best": 1.3},
+        "events": {"best": 1.1},
+        "serialize": {"best": 0.5},
+        "new_case": {"best": 9.0},  # No baseline yet: nothing to compare
+    }
+
+    regressions = compare(baseline, current, threshold=0.25)
+
+    assert [name for name, _ in regressions] == ["alignment"]
+    assert abs(regressions[0][1] - 0.3) < 1e-9
+
+
+def test_baseline_of_another_workload_is_refused(tmp_path, monkeypatch, mocker):
+    """A 1h baseline vs. a 0.5h run is no regression check: exit before timing. 🚫"""
+    baseline = tmp_path / "base.json"
+    baseline.write_text(json.dumps({"config": asdict(SuiteConfig()), "cases": {}}))
+    run = mocker.patch("tools.benchmark_suite.run_suite")
+    monkeypatch.setattr(
+        "sys.argv",
+        ["benchmark_suite.py", "--hours", "0.5", "--baseline", str(baseline)],
+    )
+
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+
+    assert exit_info.value.code == 2
+    run.assert_not_called()
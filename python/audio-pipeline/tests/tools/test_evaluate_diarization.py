@@ -0,0 +1,86 @@
+import json
+import pytest
+from tools.evaluate_diarization import find_pairs, score_pair, split_recordings
+from tools.metrics import load_segments
+
+
+def write_corpus(tmp_path):
+    (tmp_path / "ref").mkdir()
+    (tmp_path / "hyp").mkdir()
+    (tmp_path / "ref" / "ep1.rttm").write_text(
+        "SPEAKER ep1 1 0.00 4.00 <NA> <NA> anna <NA> <NA>\n"
+        "SPEAKER ep1 1 4.00 4.00 <NA> <NA> ben <NA> <NA>\n"
+    )
+    (tmp_path / "ref" / "ep2.rttm").write_text(
+        "SPEAKER ep2 1 0.00 2.00 <NA> <NA> anna <NA> <NA>\n"
+    )
+    transcript = {
+        "utterances": [
+            {"start": 0.0, "end": 4.0, "speaker": "SPEAKER_01", "text": "Hallo"},
+            {"start": 4.0, "end": 8.0, "speaker": "SPEAKER_00", "text": "Hi"},
+        ]
+    }
+    (tmp_path / "hyp" / "ep1.transcript.json").write_text(json.dumps(transcript))
+
+
+def test_pairs_are_matched_by_stem(tmp_path):
+    write_corpus(tmp_path)
+    pairs = find_pairs(str(tmp_path / "ref"), str(tmp_path / "hyp"))
+    assert [name for name, _, _ in pairs] == ["ep1"]
+
+
+def test_score_pair_reads_transcript_speaker_key(tmp_path):
+    """transcript.json stores the label under 'speaker', not 'speaker_id'. 🏷️"""
+    write_corpus(tmp_path)
+    ((name, ref, hyp),) = find_pairs(str(tmp_path / "ref"), str(tmp_path / "hyp"))
+    result = score_pair((name, ref, hyp, None, 0.01, 0.0))
+    assert result["der"] == 0.0
+    assert result["mapping"] == {"anna": "SPEAKER_01", "ben": "SPEAKER_00"}
+
+
+def test_collar_forgives_boundary_jitter(tmp_path):
+    write_corpus(tmp_path)
+    shifted = {
+        "utterances": [
+            {"start": 0.2, "end": 4.2, "speaker": "A"},
+            {"start": 4.2, "end": 8.0, "speaker": "B"},
+        ]
+    }
+    (tmp_path / "hyp" / "ep1.transcript.json").write_text(json.dumps(shifted))
+    ((name, ref, hyp),) = find_pairs(str(tmp_path / "ref"), str(tmp_path / "hyp"))
+    assert score_pair((name, ref, hyp, None, 0.01, 0.0))["der"] > 0
+    assert score_pair((name, ref, hyp, None, 0.01, 0.25))["der"] == pytest.approx(0.0)
+
+
+def test_corpus_rttm_is_scored_per_recording(tmp_path):
+    """Two recordings in one RTTM must not be laid over each other. 🗂️"""
+    corpus = (
+        "SPEAKER ep1 1 0.00 4.00 <NA> <NA> anna <NA> <NA>\n"
+        "SPEAKER ep2 1 0.00 4.00 <NA> <NA> ben <NA> <NA>\n"
+    )
+    (tmp_path / "ref.rttm").write_text(corpus)
+    (tmp_path / "hyp.rttm").write_text(corpus.replace("anna", "A").replace("ben", "B"))
+    pairs = find_pairs(str(tmp_path / "ref.rttm"), str(tmp_path / "hyp.rttm"))
+
+    recordings = split_recordings(pairs)
+    results = [score_pair((*recording, 0.01, 0.0)) for recording in recordings]
+
+    assert [r["name"] for r in results] == ["ep1", "ep2"]
+    assert [r["der"] for r in results] == [0.0, 0.0]
+    assert results[0]["mapping"] == {"anna": "A"}
+    with pytest.raises(ValueError, match="holds 2 recordings"):
+        load_segments(str(tmp_path / "ref.rttm"))
+
+
+def test_corpus_rttm_against_one_transcript_is_rejected(tmp_path):
+    write_corpus(tmp_path)
+    (tmp_path / "all.rttm").write_text(
+        (tmp_path / "ref" / "ep1.rttm").read_text()
+        + (tmp_path / "ref" / "ep2.rttm").read_text()
+    )
+    pairs = find_pairs(
+        str(tmp_path / "all.rttm"), str(tmp_path / "hyp" / "ep1.transcript.json")
+    )
+
+    with pytest.raises(ValueError, match="single transcript"):
+        split_recordings(pairs)
@@ -0,0 +1,102 @@
+from types import SimpleNamespace
+import pytest
+from src.domain.entities import AudioArtifact
+from src.domain.value_objects import LanguageTag
+from src.infrastructure.azure_inference_annotation import (
+    AzureInferenceAnnotationService,
+)
+from src.infrastructure.azure_inference_translation import AzureInferenceTranslator
+from src.infrastructure.transcription import AzureFastTranscriber
+from tools.fake_azure import FakeAzureServer, FaultConfig, parse_latency
+from tools.load_test_enrichers import run_load
+
+
+def translator(server, **kwargs):
+    return AzureInferenceTranslator(
+        endpoint=server.inference_endpoint,
+        api_key="fake",
+        retry_base_delay=0.0,
+        **kwargs,
+    )
+
+
+def test_fake_foundry_answers_in_the_mappers_schemas():
+    with FakeAzureServer() as server:
+        translations = translator(server).translate(
+            ["Hallo", "Welt"],
+            source_lang=LanguageTag("de"),
+            target_lang=LanguageTag("en"),
+        )
+        notes = AzureInferenceAnnotationService(
+            endpoint=server.inference_endpoint, api_key="fake"
+        ).annotate(["der der Bundes-CDU", "Alles gut."], LanguageTag("de"))
+
+    assert translations == ["[en] Hallo", "[en] Welt"]
+    assert "Repetition" in notes[0]
+    assert notes[1] is None  # 'OK' means nothing to note
+
+
+def test_throttled_requests_are_retried_until_they_succeed():
+    """429s carry Retry-After; the adapter waits and tries again. 🚦"""
+    config = FaultConfig(throttle_rate=0.5, retry_after=0.0, seed=7)
+    with FakeAzureServer(config) as server:
+        patient = translator(server, max_retries=20)
+        results = patient.translate(
+            [f"Satz {i}" for i in range(3)], target_lang=LanguageTag("en")
+        )
+        results += [
+            patient.translate(["Noch einer"], target_lang=LanguageTag("en"))[0]
+            for _ in range(10)
+        ]
+
+    assert all(r.startswith("[en] ") for r in results)
+    assert server.stats.throttled > 0
+    assert server.stats.requests == 11 + server.stats.throttled
+
+
+def test_malformed_replies_exhaust_retries_into_fallbacks():
+    with FakeAzureServer(FaultConfig(malformed_rate=1.0, seed=1)) as server:
+        results = translator(server, max_retries=3).translate(
+            ["Hallo"], target_lang=LanguageTag("en")
+        )
+
+    assert server.stats.malformed == server.stats.requests == 3
+    # A reply missing its item maps to "", everything else fails parsing
+    assert results == [""]
+
+
+def test_fake_speech_transcribes_uploaded_wav(tmp_path):
+    """10 s of audio come back as ~4 s phrases from alternating speakers. 🎤"""
+    wav = tmp_path / "episode.wav"
+    wav.write_bytes(b"RIFF" + b"\0" * 320000)
+    with FakeAzureServer() as server:
+        transcriber = AzureFastTranscriber(
+            "fake", "local", upload_codec="wav", endpoint=server.speech_endpoint
+        )
+        utterances = transcriber.transcribe(
+            AudioArtifact(file_path=str(wav)), LanguageTag("de-DE")
+        )
+
+    assert [u.speaker_id for u in utterances] == ["1", "2", "1"]
+    assert all(len(u.words) == 8 for u in utterances)
+    assert 9.5 < utterances[-1].timestamp.end.total_seconds() < 10.5
+
+
+def test_latency_distributions_are_validated():
+    assert parse_latency("fixed:0.25")(None) == 0.25
+    with pytest.raises(ValueError, match="Unknown latency distribution"):
+        parse_latency("pareto:1")
+    with pytest.raises(IndexError):
+        parse_latency("uniform:0.1")
+
+
+def test_load_driver_reports_throughput_and_tail_latency():
+    args = SimpleNamespace(
+        jobs=2, utterances=5, batch=1, context=2, max_retries=2, retry_base_delay=0.0
+    )
+    with FakeAzureServer(FaultConfig(latency="uniform:0,0.01", seed=3)) as server:
+        result = run_load("translation", server.inference_endpoint, args)
+
+    assert result["calls"] == result["utterances"] == 10
+    assert result["failed_utterances"] == 0
+    assert 0 < result["p50"] <= result["p95"] <= result["p99"] <= result["max"]
@@ -0,0 +1,100 @@
+import pytest
+from tools.metrics import diarization_error_rate, load_rttm
+
+
+def test_der_is_zero_for_relabelled_identical_diarization():
+    reference = [(0.0, 5.0, "anna"), (5.0, 9.0, "ben")]
+    hypothesis = [(0.0, 5.0, "SPEAKER_01"), (5.0, 9.0, "SPEAKER_00")]
+    assert diarization_error_rate(reference, hypothesis)["der"] == 0.0
+
+
+def test_der_components():
+    reference = [(0.0, 4.0, "anna"), (4.0, 8.0, "ben")]
+    # 1s of Anna missed, 2s of Ben given to Anna's cluster, 1s false alarm
+    hypothesis = [(1.0, 4.0, "A"), (4.0, 6.0, "B"), (6.0, 8.0, "A"), (8.0, 9.0, "B")]
+    result = diarization_error_rate(reference, hypothesis)
+    assert result["total"] == pytest.approx(8.0)
+    assert result["missed"] == pytest.approx(1.0)
+    assert result["false_alarm"] == pytest.approx(1.0)
+    assert result["confusion"] == pytest.approx(2.0)
+    assert result["der"] == pytest.approx(0.5)
+
+
+def test_der_counts_overlapping_speech_per_speaker():
+    reference = [(0.0, 2.0, "anna"), (1.0, 2.0, "ben")]
+    hypothesis = [(0.0, 2.0, "A")]
+    result = diarization_error_rate(reference, hypothesis)
+    assert result["total"] == pytest.approx(3.0)
+    assert result["missed"] == pytest.approx(1.0)
+    assert result["der"] == pytest.approx(1 / 3)
+
+
+def test_der_of_pure_false_alarm_is_not_perfect():
+    result = diarization_error_rate([], [(0.0, 2.0, "A")])
+    assert result["total"] == 0.0
+    assert result["false_alarm"] == pytest.approx(2.0)
+    assert result["der"] == float("inf")
+    assert diarization_error_rate([], [])["der"] == 0.0
+
+
+def test_load_rttm(tmp_path):
+    rttm = tmp_path / "ref.rttm"
+    rttm.write_text(
+        "SPEAKER ep1 1 0.50 2.00 <NA> <NA> anna <NA> <NA>\n"
+        "SPEAKER ep1 1 3.00 1.50 <NA> <NA> ben <NA> <NA>\n"
+    )
+    assert load_rttm(str(rttm)) == {"ep1": [(0.5, 2.5, "anna"), (3.0, 4.5, "ben")]}
+
+
+def test_der_reports_mapping_and_speaker_confusion():
+    reference = [(0.0, 4.0, "anna"), (4.0, 8.0, "ben")]
+    hypothesis = [(0.0, 6.0, "A"), (6.0, 8.0, "B")]
+    result = diarization_error_rate(reference, hypothesis)
+    assert result["mapping"] == {"anna": "A", "ben": "B"}
+    assert result["speakers"]["ben"] == pytest.approx({"A": 2.0, "B": 2.0})
+    assert result["speakers"]["anna"] == pytest.approx({"A": 4.0})
+
+
+def test_edit_operations_counts_each_error_kind():
+    from tools.metrics import edit_operations
+
+    ops = edit_operations("a b c d".split(), "a c d e".split())
+    assert ops == {
+        "substitutions": 0,
+        "deletions": 1,
+        "insertions": 1,
+        "errors": 2,
+        "length": 4,
+    }
+    assert edit_operations("a b c".split(), "a x c".split())["substitutions"] == 1
+
+
+def test_edit_operations_matches_textbook_levenshtein():
+    import random
+    from tools.metrics import edit_operations
+
+    def levenshtein(a, b):
+        row = list(range(len(b) + 1))
+        for i, x in enumerate(a, 1):
+            prev, row[0] = row[0], i
+            for j, y in enumerate(b, 1):
+                prev, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, prev + (x != y))
+        return row[-1]
+
+    rng = random.Random(7)
+    for _ in range(300):
+        a = [rng.choice("abc") for _ in range(rng.randint(0, 8))]
+        b = [rng.choice("abc") for _ in range(rng.randint(0, 8))]
+        ops = edit_operations(a, b)
+        assert ops["errors"] == levenshtein(a, b)
+        assert ops["insertions"] - ops["deletions"] == len(b) - len(a)
+
+
+def test_wer_ignores_case_and_punctuation():
+    from tools.metrics import word_error_rate, character_error_rate
+
+    assert word_error_rate("Guten Tag, Anna!", "guten tag anna")["wer"] == 0.0
+    assert word_error_rate("Guten Tag Anna", "Guten Abend Anna")[
+        "wer"
+    ] == pytest.approx(1 / 3)
+    assert character_error_rate("Straße", "strasse")["errors"] == 2
@@ -0,0 +1,103 @@
+import argparse
+import os
+import sys
+import time
+from multiprocessing import get_context
+
+import numpy as np
+
+# Robust pathing relative to this script! 🗺️💎
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from src.infrastructure.worker_pool import PreforkWorkerPool, smaps_rollup  # noqa: E402
+
+
+def load_model(args):
+    """The heavy component: real Pyannote, or a stand-in array of weights. 🧠"""
+    if args.pyannote:
+        from src.infrastructure.diarization import PyannoteDiarizer
+
+        return PyannoteDiarizer(threads=1)
+    return np.random.default_rng(0).random(args.model_mib * 2**20 // 8)
+
+
+def touch(model) -> float:
+    """Reads every weight, like inference does, without writing any. 👀"""
+    if isinstance(model, np.ndarray):
+        return float(model.sum())
+    return 0.0
+
+
+def own_copy_worker(args, conn):
+    model = load_model(args)
+    touch(model)
+    conn.send(smaps_rollup(os.getpid()))
+    conn.recv()  # Stay alive until the parent has measured everyone
+
+
+def measure_independent(args):
+    """Each worker loads its own model - today's behaviour. 📦📦📦"""
+    ctx = get_context("spawn")
+    pipes, procs = [], []
+    for _ in range(args.workers):
+        parent_conn, child_conn = ctx.Pipe()
+        proc = ctx.Process(target=own_copy_worker, args=(args, child_conn))
+        proc.start()
+        pipes.append(parent_conn)
+        procs.append(proc)
+    stats = [conn.recv() for conn in pipes]
+    for conn, proc in zip(pipes, procs):
+        conn.send(None)
+        proc.join()
+    return stats
+
+
+def measure_prefork(args):
+    """The parent loads once, workers share the pages copy-on-write. 🍴"""
+    model = load_model(args)
+    pool = PreforkWorkerPool(lambda _: touch(model), workers=args.workers)
+    with pool:
+        pool.map(range(args.workers * 2))
+        return [
+            {k: v for k, v in stats.items() if k != "pid"}
+            for stats in pool.memory_report()
+        ]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Per-worker RSS/PSS: each worker loading its model vs. prefork sharing. 🍴📊"
+    )
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument(
+        "--model-mib", type=int, default=512, help="Stand-in model size"
+    )
+    parser.add_argument(
+        "--pyannote", action="store_true", help="Use the real Pyannote pipeline"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'Mode':<12} | {'RSS MiB':>8} | {'PSS MiB':>8} | {'Private MiB':>11} | {'Total PSS':>9}"
+    )
+    print("-" * 62)
+    for label, measure in [
+        ("independent", measure_independent),
+        ("prefork", measure_prefork),
+    ]:
+        start = time.perf_counter()
+        stats = [s for s in measure(args) if s]
+        if not stats:
+            print(f"{label:<12} | (no /proc/<pid>/smaps_rollup on this platform)")
+            continue
+        mean = {k: sum(s[k] for s in stats) / len(stats) / 1024 for k in stats[0]}
+        total_pss = sum(s["pss"] for s in stats) / 1024
+        print(
+            f"{label:<12} | {mean['rss']:>8.0f} | {mean['pss']:>8.0f} | "
+            f"{mean['private']:>11.0f} | {total_pss:>9.0f}   ({time.perf_counter() - start:.1f}s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
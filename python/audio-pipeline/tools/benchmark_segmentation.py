@@ -0,0 +1,56 @@
+import argparse
+import os
+import sys
+import time
+
+# Robust pathing relative to this script! 🗺️💎
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from src.application.enrichers import SentenceSegmentationEnricher  # noqa: E402
+from src.domain.value_objects import (  # noqa: E402
+    LanguageTag,
+    Utterance,
+    TimestampRange,
+)
+from tools.synthetic_transcripts import synthetic_utterances  # noqa: E402
+
+
+def monologue(tokens: int) -> Utterance:
+    """Glues synthetic segments into ONE unbroken monologue of 'tokens' tokens. 🗣️"""
+    segments = synthetic_utterances(hours=tokens * 0.3 / 3600 + 0.01, speakers=1)
+    words = [w for u in segments for w in u.words][:tokens]
+    return Utterance(
+        timestamp=TimestampRange(words[0].timestamp.start, words[-1].timestamp.end),
+        text="".join(w.text for w in words).strip(),
+        speaker_id="SPEAKER_00",
+        confidence=1.0,
+        words=words,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmarks sentence segmentation on very long monologues. ✂️⏱️"
+    )
+    parser.add_argument(
+        "--tokens", type=int, nargs="+", default=[10_000, 50_000, 100_000]
+    )
+    parser.add_argument("--max-duration", type=float, default=15.0)
+    args = parser.parse_args()
+
+    enricher = SentenceSegmentationEnricher(max_duration_seconds=args.max_duration)
+    print(f"{'Tokens':>8} | {'Rows':>6} | {'Seconds':>8} | {'Tokens/s':>10}")
+    print("-" * 42)
+    for tokens in args.tokens:
+        u = monologue(tokens)
+        start = time.perf_counter()
+        rows = enricher.enrich([u], LanguageTag("de"))
+        elapsed = time.perf_counter() - start
+        print(
+            f"{tokens:>8} | {len(rows):>6} | {elapsed:>8.3f} | {tokens / elapsed:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# Robust pathing relative to this script! 🗺️💎
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# What each stack resolves at startup, plus the heavy modules its adapters
+# import once they are constructed (PyannoteDiarizer loads torch lazily). 🏗️
+STACKS = {
+    "azure": {
+        "backends": [
+            "azure-fast",
+            "null-diarizer",
+            "azure-inference-translator",
+            "azure-inference-annotation",
+        ],
+        "modules": [],
+    },
+    "local": {
+        "backends": ["whisper-cli", "pyannote", "llama-cpp"],
+        "modules": ["torch", "pyannote.audio"],
+    },
+}
+
+# Runs in a fresh interpreter so nothing is already cached in sys.modules 🧼
+CHILD = """
+import importlib, json, resource, sys, time
+start = time.perf_counter()
+import main
+from src.infrastructure.backends import load_backend
+for name in {backends!r}:
+    load_backend(name)
+for module in {modules!r}:
+    importlib.import_module(module)
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "torch_loaded": "torch" in sys.modules,
+    "modules": len(sys.modules),
+}}))
+"""
+
+
+def measure(stack: str) -> dict:
+    spec = STACKS[stack]
+    code = CHILD.format(backends=spec["backends"], modules=spec["modules"])
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BASE_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        last_line = (result.stderr.strip().splitlines() or ["?"])[-1]
+        return {"error": last_line}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measures startup import time and RSS per pipeline stack. 🚀⏱️"
+    )
+    parser.add_argument("--stacks", nargs="+", default=list(STACKS), choices=STACKS)
+    parser.add_argument("--runs", type=int, default=3, help="Best-of N runs")
+    args = parser.parse_args()
+
+    print(f"{'Stack':<6} | {'Seconds':>8} | {'RSS MiB':>8} | {'Modules':>7} | torch")
+    print("-" * 48)
+    for stack in args.stacks:
+        runs = [measure(stack) for _ in range(args.runs)]
+        failed = [r for r in runs if "error" in r]
+        if failed:
+            print(f"{stack:<6} | ❌ {failed[0]['error']}")
+            continue
+        best = min(runs, key=lambda r: r["seconds"])
+        print(
+            f"{stack:<6} | {best['seconds']:>8.3f} | {best['max_rss_kib'] / 1024:>8.1f} | "
+            f"{best['modules']:>7} | {'yes' if best['torch_loaded'] else 'no'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+from uuid import uuid4
+
+# Robust pathing relative to this script! 🗺️💎
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from src.application.enrichers import (  # noqa: E402
+    SentenceSegmentationEnricher,
+    TokenMergerEnricher,
+)
+from src.application.services import MaxOverlapAlignmentService  # noqa: E402
+from src.domain.events import PipelineStepTimed  # noqa: E402
+from src.domain.value_objects import AudioTranscript, LanguageTag  # noqa: E402
+from src.infrastructure.bus import InProcessEventBus  # noqa: E402
+from src.infrastructure.serialization import JsonTranscriptSerializer  # noqa: E402
+from tools.synthetic_transcripts import (  # noqa: E402
+    synthetic_turns,
+    synthetic_utterances,
+)
+
+LANGUAGE = LanguageTag("de")
+
+
+@dataclass(frozen=True)
+class SuiteConfig:
+    """The synthetic workload; results are only comparable for equal configs. 🏭"""
+
+    hours: float = 1.0
+    speakers: int = 2
+    tokens_per_segment: int = 30
+    turns: int = 0  # 0: one diarization turn every ~8 s
+    events: int = 10000
+    seed: int = 0
+
+
+def build_cases(config: SuiteConfig) -> Dict[str, Tuple[Callable[[], object], int]]:
+    """
+    name -> (run, items): everything a case needs is built here, untimed, so
+    each measurement covers only the stage itself. Inputs are the ones the
+    stage sees in a real run (segmentation output feeds the token merger...).
+    """
+    raw = synthetic_utterances(
+        hours=config.hours,
+        speakers=config.speakers,
+        tokens_per_segment=config.tokens_per_segment,
+        seed=config.seed,
+    )
+    turns = synthetic_turns(
+        hours=config.hours,
+        speakers=config.speakers,
+        turns=config.turns or None,
+        seed=config.seed,
+    )
+    segmented = SentenceSegmentationEnricher(max_duration_seconds=15.0).enrich(
+        raw, LANGUAGE
+    )
+    merged = TokenMergerEnricher().enrich(segmented, LANGUAGE)
+    serializer = JsonTranscriptSerializer()
+    transcript = AudioTranscript(utterances=merged, target_language=LanguageTag("en"))
+    content = serializer.serialize(transcript)
+    tokens = sum(len(u.words) for u in raw)
+
+    bus = InProcessEventBus()
+    received = []
+    bus.subscribe(PipelineStepTimed, received.append)
+    job_id = uuid4()
+
+    def publish_events():
+        received.clear()
+        for i in range(config.events):
+            bus.publish(
+                PipelineStepTimed(
+                    job_id=job_id, step_name=f"step {i}", duration_seconds=0.0
+                )
+            )
+
+    return {
+        "alignment": (lambda: MaxOverlapAlignmentService().align(raw, turns), len(raw)),
+        "segmentation": (
+            lambda: SentenceSegmentationEnricher(max_duration_seconds=15.0).enrich(
+                raw, LANGUAGE
+            ),
+            tokens,
+        ),
+        "token_merging": (
+            lambda: TokenMergerEnricher().enrich(segmented, LANGUAGE),
+            tokens,
+        ),
+        "serialize": (lambda: serializer.serialize(transcript), tokens),
+        "deserialize": (lambda: serializer.deserialize(content), tokens),
+        "deserialize_trusted": (
+            lambda: serializer.deserialize(content, trusted=True),
+            tokens,
+        ),
+        "events": (publish_events, config.events),
+    }
+
+
+def _loops_for(run: Callable[[], object], min_seconds: float) -> int:
+    """Like timeit's autorange: enough calls per timing to outlast timer noise. 🔁"""
+    start = time.perf_counter()
+    run()
+    once = time.perf_counter() - start
+    return max(1, math.ceil(min_seconds / once)) if once else 1000
+
+
+def run_suite(
+    config: SuiteConfig,
+    repeat: int = 5,
+    only: List[str] = None,
+    min_seconds: float = 0.2,
+) -> Dict[str, Dict[str, float]]:
+    """Best and median seconds per call of every case over 'repeat' timings. ⏱️"""
+    results = {}
+    for name, (run, items) in build_cases(config).items():
+        if only and name not in only:
+            continue
+        loops = _loops_for(run, min_seconds)
+        timings = []
+        # As timeit does: collector passes triggered by earlier cases' garbage
+        # would land in random timings 🧹
+        gc.collect()
+        gc.disable()
+        try:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                for _ in range(loops):
+                    run()
+                timings.append((time.perf_counter() - start) / loops)
+        finally:
+            gc.enable()
+        best = min(timings)
+        results[name] = {
+            "best": best,
+            "median": statistics.median(timings),
+            "loops": loops,
+            "items": items,
+            "items_per_second": items / best if best else 0.0,
+        }
+    return results
+
+
+def compare(
+    baseline: Dict[str, Dict[str, float]],
+    current: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> List[Tuple[str, float]]:
+    """
+    (case, relative change) for every case whose best time got slower than
+    the baseline by more than 'threshold' (0.25 = 25 %). The best of several
+    runs is compared because it is the least disturbed by a busy machine. 🚦
+    """
+    regressions = []
+    for name, result in current.items():
+        reference = baseline.get(name)
+        if not reference or not reference["best"]:
+            continue
+        change = result["best"] / reference["best"] - 1
+        if change > threshold:
+            regressions.append((name, change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="CPU-bound pipeline stages on synthetic transcripts, with JSON baselines. 📊🚦"
+    )
+    parser.add_argument(
+        "--hours", type=float, default=1.0, help="Synthetic audio length"
+    )
+    parser.add_argument("--speakers", type=int, default=2)
+    parser.add_argument(
+        "--tokens-per-segment",
+        type=int,
+        default=30,
+        help="Whisper tokens per raw segment",
+    )
+    parser.add_argument(
+        "--turns", type=int, default=0, help="Diarization turns (default: one per ~8 s)"
+    )
+    parser.add_argument(
+        "--events", type=int, default=10000, help="Events created & published"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Timings per case (best is kept)"
+    )
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=0.2,
+        help="Shortest single timing; fast cases loop",
+    )
+    parser.add_argument("--cases", nargs="+", help="Only run these cases")
+    parser.add_argument(
+        "--save-baseline", help="Write the results to this JSON baseline"
+    )
+    parser.add_argument("--baseline", help="Compare against this JSON baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Relative slow-down that counts as a regression (exit status 1); raise it on shared VMs 🚦",
+    )
+    args = parser.parse_args()
+
+    config = SuiteConfig(
+        hours=args.hours,
+        speakers=args.speakers,
+        tokens_per_segment=args.tokens_per_segment,
+        turns=args.turns,
+        events=args.events,
+        seed=args.seed,
+    )
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("config") != asdict(config):
+            # Timings of different workloads say nothing about regressions 🚫
+            parser.error(
+                f"baseline workload {baseline.get('config')} differs from "
+                f"{asdict(config)}; run with the baseline's workload options "
+                "or save a new baseline"
+            )
+
+    print(f"🏭 {asdict(config)}")
+    results = run_suite(
+        config, repeat=args.repeat, only=args.cases, min_seconds=args.min_seconds
+    )
+
+    print(
+        f"{'Case':<20} | {'Best':>9} | {'Median':>9} | {'Items/s':>12} | {'vs. baseline':>12}"
+    )
+    print("-" * 74)
+    for name, r in results.items():
+        delta = ""
+        reference = (baseline or {}).get("cases", {}).get(name)
+        if reference and reference["best"]:
+            delta = f"{r['best'] / reference['best'] - 1:+.1%}"
+        print(
+            f"{name:<20} | {r['best']:>8.4f}s | {r['median']:>8.4f}s | "
+            f"{r['items_per_second']:>12,.0f} | {delta:>12}"
+        )
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "created": datetime.now().isoformat(timespec="seconds"),
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "config": asdict(config),
+                    "cases": results,
+                },
+                f,
+                indent=2,
+            )
+        print(f"💾 Baseline saved to {args.save_baseline}")
+
+    if baseline:
+        regressions = compare(baseline.get("cases", {}), results, args.threshold)
+        for name, change in regressions:
+            print(
+                f"❌ {name} is {change:.1%} slower than the baseline (threshold {args.threshold:.0%})"
+            )
+        if regressions:
+            sys.exit(1)
+        print(f"✅ No case regressed by more than {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import argparse
+import os
+import sys
+import time
+
+# Robust pathing relative to this script! 🗺️💎
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from src.domain.value_objects import AudioTranscript, LanguageTag  # noqa: E402
+from src.infrastructure.serialization import JsonTranscriptSerializer  # noqa: E402
+from tools.synthetic_transcripts import synthetic_utterances  # noqa: E402
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmarks loading saved transcript.json files. 📥⏱️"
+    )
+    parser.add_argument(
+        "--hours", type=float, nargs="+", default=[1.0, 3.0, 6.0], help="Audio lengths"
+    )
+    args = parser.parse_args()
+
+    serializer = JsonTranscriptSerializer()
+    print(
+        f"{'Hours':>5} | {'Words':>8} | {'MB':>6} | {'Validated':>10} | "
+        f"{'Trusted':>8} | {'Trusted+Words':>13}"
+    )
+    print("-" * 68)
+
+    for hours in args.hours:
+        transcript = AudioTranscript(
+            utterances=synthetic_utterances(hours=hours),
+            target_language=LanguageTag("en"),
+        )
+        content = serializer.serialize(transcript)
+        word_count = sum(len(u.words) for u in transcript.utterances)
+
+        _, validated_s = _timed(lambda content=content: serializer.deserialize(content))
+        loaded, trusted_s = _timed(
+            lambda content=content: serializer.deserialize(content, trusted=True)
+        )
+        _, touch_s = _timed(
+            lambda loaded=loaded: [len(list(u.words)) for u in loaded.utterances]
+        )
+
+        print(
+            f"{hours:>5.1f} | {word_count:>8} | {len(content) / 1e6:>6.1f} | "
+            f"{validated_s:>9.3f}s | {trusted_s:>7.3f}s | {trusted_s + touch_s:>12.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import argparse
+import os
+import sys
+import time
+
+# Robust pathing relative to this script! 🗺️💎
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from src.domain.entities import AudioArtifact  # noqa: E402
+from src.domain.value_objects import LanguageTag  # noqa: E402
+from src.infrastructure.chunking import plan_chunks  # noqa: E402
+from src.infrastructure.pcm import map_pcm16  # noqa: E402
+from src.infrastructure.transcription import (  # noqa: E402
+    WhisperTranscriber,
+    ChunkedWhisperTranscriber,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measures Whisper real-time factor vs. number of parallel chunks. 🧩⏱️"
+    )
+    parser.add_argument("audio", help="A normalized 16kHz mono WAV")
+    parser.add_argument("--whisper", required=True, help="Path to whisper-cli")
+    parser.add_argument("--model", required=True, help="Path to the ggml model")
+    parser.add_argument("--language", default="de")
+    parser.add_argument(
+        "--threads", type=int, default=os.cpu_count(), help="Total thread budget"
+    )
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    audio = AudioArtifact(file_path=args.audio, format="wav")
+    samples = map_pcm16(args.audio)
+    audio_seconds = len(samples) / audio.sample_rate
+
+    print(f"⏱️ {audio_seconds / 60:.1f} min of audio, {args.threads} threads total")
+    print(
+        f"{'Workers':>7} | {'Chunks':>6} | {'Seconds':>8} | {'RTF':>6} | {'Segments':>8}"
+    )
+    print("-" * 48)
+    for workers in args.workers:
+        whisper = WhisperTranscriber(args.whisper, args.model, threads=args.threads)
+        # Aim for one chunk per worker; silence-nudged cuts may add one more 🧩
+        chunk_seconds = audio_seconds / workers + 1
+        chunks = len(plan_chunks(samples, audio.sample_rate, chunk_seconds))
+        transcriber = ChunkedWhisperTranscriber(
+            whisper, workers=workers, chunk_seconds=chunk_seconds
+        )
+        start = time.perf_counter()
+        utterances = transcriber.transcribe(audio, LanguageTag(args.language))
+        elapsed = time.perf_counter() - start
+        print(
+            f"{workers:>7} | {chunks:>6} | {elapsed:>8.1f} | "
+            f"{elapsed / audio_seconds:>6.3f} | {len(utterances):>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
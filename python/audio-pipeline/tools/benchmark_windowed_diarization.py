@@ -0,0 +1,98 @@
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+# Robust pathing relative to this script! 🗺️💎
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from src.domain.entities import AudioArtifact  # noqa: E402
+from src.infrastructure.pcm import map_pcm16, write_pcm16  # noqa: E402
+
+
+def tile_recording(source: str, hours: float, path: str):
+    """Repeats a normalized WAV until it lasts 'hours', one copy at a time. 🔁"""
+    samples = map_pcm16(source)
+    target = int(hours * 3600 * 16000)
+    copies, remainder = divmod(target, len(samples))
+    pieces = [samples] * copies + ([samples[:remainder]] if remainder else [])
+    write_pcm16(path, iter(pieces), 16000)
+
+
+def run_child(path: str, window_seconds: float):
+    """Diarizes in THIS process and prints wall time and peak RSS as JSON. 📈"""
+    from src.infrastructure.diarization import PyannoteDiarizer
+
+    diarizer = PyannoteDiarizer(window_seconds=window_seconds or None)
+    start = time.perf_counter()
+    turns = diarizer.diarize(AudioArtifact(file_path=path, format="wav"))
+    elapsed = time.perf_counter() - start
+    print(
+        json.dumps(
+            {
+                "seconds": elapsed,
+                "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                "speakers": len({t.speaker_id for t in turns}),
+            }
+        )
+    )
+
+
+def measure(path: str, window_seconds: float) -> dict:
+    # A fresh process per run, so every peak RSS is measured from zero 🧼
+    result = subprocess.run(
+        [sys.executable, __file__, "--child", path, "--window", str(window_seconds)],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return {"error": (result.stderr.strip().splitlines() or ["?"])[-1]}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compares whole-file vs. windowed Pyannote diarization on long recordings. 🪟⏱️"
+    )
+    parser.add_argument("audio", nargs="?", help="A normalized 16kHz mono WAV to tile")
+    parser.add_argument("--hours", type=float, nargs="+", default=[1.0, 3.0, 6.0])
+    parser.add_argument(
+        "--window", type=float, default=600.0, help="Window length in seconds"
+    )
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.window)
+        return
+    if not args.audio:
+        parser.error("the audio argument is required")
+
+    print(f"{'Hours':>5} | {'Mode':<14} | {'Seconds':>8} | {'Peak MiB':>9} | Speakers")
+    print("-" * 56)
+    with tempfile.TemporaryDirectory() as tmp:
+        for hours in args.hours:
+            path = os.path.join(tmp, f"tiled_{hours}h.wav")
+            tile_recording(args.audio, hours, path)
+            for label, window in [
+                ("whole file", 0.0),
+                (f"{args.window:.0f}s windows", args.window),
+            ]:
+                result = measure(path, window)
+                if "error" in result:
+                    print(f"{hours:>5} | {label:<14} | ❌ {result['error']}")
+                    continue
+                print(
+                    f"{hours:>5} | {label:<14} | {result['seconds']:>8.1f} | "
+                    f"{result['max_rss_kib'] / 1024:>9.1f} | {result['speakers']:>8}"
+                )
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import argparse
+import dataclasses
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+# Robust pathing relative to this script! 🗺️💎
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from src.application.enrichers import (  # noqa: E402
+    SentenceSegmentationEnricher,
+    TokenMergerEnricher,
+)
+from src.domain.value_objects import AudioTranscript, LanguageTag  # noqa: E402
+from src.domain.word_store import WordStore  # noqa: E402
+from src.infrastructure.serialization import JsonTranscriptSerializer  # noqa: E402
+from tools.synthetic_transcripts import synthetic_utterances  # noqa: E402
+
+
+def to_columnar(utterances):
+    """Re-homes every utterance's words into one shared WordStore. 🗄️"""
+    store = WordStore()
+    return [dataclasses.replace(u, words=store.extend(u.words)) for u in utterances]
+
+
+def measure_memory(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def run(label, build):
+    utterances, memory = measure_memory(build)
+    language = LanguageTag("de")
+    segmented, seg_s = timed(
+        lambda: SentenceSegmentationEnricher(max_duration_seconds=15.0).enrich(
+            utterances, language
+        )
+    )
+    merged, merge_s = timed(lambda: TokenMergerEnricher().enrich(segmented, language))
+    _, ser_s = timed(
+        lambda: JsonTranscriptSerializer().serialize(AudioTranscript(utterances=merged))
+    )
+    print(
+        f"{label:<9} | {memory / 1e6:>8.1f} | {seg_s:>11.3f}s | {merge_s:>9.3f}s | {ser_s:>12.3f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compares Word objects vs. the columnar WordStore. 🗄️⏱️"
+    )
+    parser.add_argument("--hours", type=float, default=1.0, help="Audio length")
+    args = parser.parse_args()
+
+    source = synthetic_utterances(hours=args.hours)
+    tokens = sum(len(u.words) for u in source)
+    print(f"⏱️ {args.hours}h of synthetic speech, {tokens} tokens")
+    print(
+        f"{'Model':<9} | {'Words MB':>8} | {'Segmentation':>12} | {'Merging':>10} | {'Serialization':>13}"
+    )
+    print("-" * 66)
+
+    # Memory is measured for the structure being built, not the source data 📏
+    run("Objects", lambda: synthetic_utterances(hours=args.hours))
+    run("Columnar", lambda: to_columnar(source))
+
+
+if __name__ == "__main__":
+    main()
@@ -26,7 +26,7 @@ utterances = job_data.get("utterances", [])
 
 for i, u in enumerate(utterances):
     text_snippet = u["text"][:37] + "..." if len(u["text"]) > 37 else u["text"]
-    new_speaker = u["speaker_id"]
+    new_speaker = u["speaker"]
     your_label = ver_data[i]["label"] if i < len(ver_data) else "N/A"
     match = "✅" if new_speaker == your_label else "❌"
 
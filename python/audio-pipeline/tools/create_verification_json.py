@@ -16,7 +16,7 @@ utterances = data.get("utterances", [])
 verification_data = []
 for u in utterances:
     verification_data.append(
-        {"text": u["text"], "pyannote_assigned": u["speaker_id"], "label": ""}
+        {"text": u["text"], "pyannote_assigned": u["speaker"], "label": ""}
     )
 
 # Save to the new file in test data
@@ -0,0 +1,185 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+# Robust pathing relative to this script! 🗺️💎
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from tools.metrics import diarization_error_rate, load_rttm, load_segments  # noqa: E402
+
+EXTENSIONS = (".rttm", ".json")
+
+
+def _stem(path: str) -> str:
+    name = os.path.basename(path)
+    for suffix in (".transcript.json", ".rttm", ".json", ".txt"):
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return name
+
+
+def find_pairs(
+    reference: str, hypothesis: str, extensions: Tuple[str, ...] = EXTENSIONS
+) -> List[Tuple[str, str, str]]:
+    """(name, reference, hypothesis) triples: two files, or two dirs matched by stem. 🔗"""
+    if os.path.isfile(reference):
+        return [(_stem(hypothesis), reference, hypothesis)]
+
+    def by_stem(directory):
+        return {
+            _stem(name): os.path.join(directory, name)
+            for name in sorted(os.listdir(directory))
+            if name.endswith(extensions)
+        }
+
+    references, hypotheses = by_stem(reference), by_stem(hypothesis)
+    missing = sorted(set(references) - set(hypotheses))
+    if missing:
+        print(f"⚠️ No hypothesis for: {', '.join(missing)}", file=sys.stderr)
+    return [
+        (name, references[name], hypotheses[name])
+        for name in sorted(references)
+        if name in hypotheses
+    ]
+
+
+def split_recordings(
+    pairs: List[Tuple[str, str, str]],
+) -> List[Tuple[str, str, str, Optional[str]]]:
+    """
+    (name, reference, hypothesis, file_id): a corpus RTTM holding many
+    recordings becomes one entry per file id, each scored on its own, instead
+    of one timeline where every recording overlaps every other. 🗂️
+    """
+    recordings = []
+    for name, reference, hypothesis in pairs:
+        file_ids = (
+            sorted(load_rttm(reference)) if reference.lower().endswith(".rttm") else []
+        )
+        if len(file_ids) <= 1:
+            recordings.append((name, reference, hypothesis, None))
+            continue
+        if not hypothesis.lower().endswith(".rttm"):
+            raise ValueError(
+                f"{reference} holds {len(file_ids)} recordings but {hypothesis} "
+                "is a single transcript; pass an RTTM with the same file ids"
+            )
+        missing = sorted(set(file_ids) - set(load_rttm(hypothesis)))
+        if missing:
+            print(
+                f"⚠️ No hypothesis turns for: {', '.join(missing)} (scored as all missed)",
+                file=sys.stderr,
+            )
+        recordings += [
+            (file_id, reference, hypothesis, file_id) for file_id in file_ids
+        ]
+    return recordings
+
+
+def score_pair(job: Tuple[str, str, str, Optional[str], float, float]) -> Dict:
+    name, reference_path, hypothesis_path, file_id, frame, collar = job
+    return {
+        "name": name,
+        **diarization_error_rate(
+            load_segments(reference_path, file_id),
+            load_segments(hypothesis_path, file_id),
+            frame=frame,
+            collar=collar,
+        ),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Frame-level DER over a corpus of reference/hypothesis pairs. 🎯📊"
+    )
+    parser.add_argument(
+        "reference", help="RTTM/transcript.json file, or a directory of them"
+    )
+    parser.add_argument(
+        "hypothesis", help="File or directory, matched to references by name"
+    )
+    parser.add_argument(
+        "--frame", type=float, default=0.01, help="Frame step in seconds"
+    )
+    parser.add_argument(
+        "--collar",
+        type=float,
+        default=0.0,
+        help="Seconds ignored at each reference boundary",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=os.cpu_count(), help="Worker processes"
+    )
+    parser.add_argument("--json", help="Also write all results to this JSON file")
+    parser.add_argument(
+        "--max-der",
+        type=float,
+        help="Exit with status 1 when the aggregate DER exceeds this (e.g. 0.15) 🚦",
+    )
+    parser.add_argument(
+        "--speakers", action="store_true", help="Print the per-speaker confusion too"
+    )
+    args = parser.parse_args()
+
+    pairs = find_pairs(args.reference, args.hypothesis)
+    if not pairs:
+        parser.error("no reference/hypothesis pairs found")
+    try:
+        recordings = split_recordings(pairs)
+    except ValueError as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    jobs = [
+        (name, ref, hyp, file_id, args.frame, args.collar)
+        for name, ref, hyp, file_id in recordings
+    ]
+    with ProcessPoolExecutor(max_workers=min(args.jobs, len(jobs))) as pool:
+        results = list(pool.map(score_pair, jobs, chunksize=max(1, len(jobs) // 64)))
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{'File':<30} | {'DER':>7} | {'Miss':>7} | {'FA':>7} | {'Conf':>7} | {'Speech':>8}"
+    )
+    print("-" * 80)
+    for r in results:
+        total = r["total"] or 1.0
+        print(
+            f"{r['name'][:30]:<30} | {r['der']:>7.2%} | {r['missed'] / total:>7.2%} | "
+            f"{r['false_alarm'] / total:>7.2%} | {r['confusion'] / total:>7.2%} | "
+            f"{r['total']:>7.0f}s"
+        )
+        if args.speakers:
+            for ref_label, row in r["speakers"].items():
+                cells = ", ".join(f"{hyp}: {sec:.1f}s" for hyp, sec in row.items())
+                print(
+                    f"    {ref_label} -> {r['mapping'].get(ref_label, '-')}  [{cells}]"
+                )
+
+    # Corpus DER weights every file by its amount of reference speech ⚖️
+    speech = sum(r["total"] for r in results)
+    errors = sum(r["missed"] + r["false_alarm"] + r["confusion"] for r in results)
+    aggregate = errors / speech if speech else (float("inf") if errors else 0.0)
+    print("-" * 80)
+    print(
+        f"{'TOTAL (' + str(len(results)) + ' files)':<30} | {aggregate:>7.2%} | "
+        f"{speech / 3600:.1f}h of speech scored in {elapsed:.2f}s"
+    )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"der": aggregate, "files": results}, f, indent=2)
+
+    if args.max_der is not None and aggregate > args.max_der:
+        print(f"❌ DER {aggregate:.2%} exceeds --max-der {args.max_der:.2%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
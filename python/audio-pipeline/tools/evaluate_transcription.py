@@ -0,0 +1,120 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Tuple
+
+# Robust pathing relative to this script! 🗺️💎
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from tools.evaluate_diarization import find_pairs  # noqa: E402
+from tools.metrics import (  # noqa: E402
+    character_error_rate,
+    load_transcript_text,
+    word_error_rate,
+)
+
+EXTENSIONS = (".txt", ".json")
+
+
+def audio_seconds(path: str) -> float:
+    """How much audio a transcript.json covers (0 for plain text). ⏱️"""
+    if not path.lower().endswith(".json"):
+        return 0.0
+    with open(path, "r", encoding="utf-8") as f:
+        utterances = json.load(f).get("utterances", [])
+    return max((u.get("end", 0.0) for u in utterances), default=0.0)
+
+
+def score_pair(job: Tuple[str, str, str, bool]) -> Dict:
+    name, reference_path, hypothesis_path, with_cer = job
+    reference = load_transcript_text(reference_path)
+    hypothesis = load_transcript_text(hypothesis_path)
+    result = {
+        "name": name,
+        "audio_seconds": audio_seconds(hypothesis_path),
+        **word_error_rate(reference, hypothesis),
+    }
+    if with_cer:
+        cer = character_error_rate(reference, hypothesis)
+        result.update(cer=cer["cer"], char_errors=cer["errors"], chars=cer["length"])
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Corpus WER/CER of saved transcripts against reference text. 🔡📊"
+    )
+    parser.add_argument(
+        "reference", help="A .txt/transcript.json file, or a directory of them"
+    )
+    parser.add_argument(
+        "hypothesis", help="File or directory, matched to references by name"
+    )
+    parser.add_argument(
+        "--cer", action="store_true", help="Also compute the character error rate"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=os.cpu_count(), help="Worker processes"
+    )
+    parser.add_argument("--json", help="Also write all results to this JSON file")
+    parser.add_argument(
+        "--max-wer",
+        type=float,
+        help="Exit with status 1 when the aggregate WER exceeds this (e.g. 0.12) 🚦",
+    )
+    args = parser.parse_args()
+
+    pairs = find_pairs(args.reference, args.hypothesis, EXTENSIONS)
+    if not pairs:
+        parser.error("no reference/hypothesis pairs found")
+
+    start = time.perf_counter()
+    jobs = [(name, ref, hyp, args.cer) for name, ref, hyp in pairs]
+    with ProcessPoolExecutor(max_workers=min(args.jobs, len(jobs))) as pool:
+        results = list(pool.map(score_pair, jobs))
+    elapsed = time.perf_counter() - start
+
+    header = f"{'File':<30} | {'WER':>7} | {'Sub':>5} | {'Del':>5} | {'Ins':>5} | {'Words':>6}"
+    print(header + (f" | {'CER':>7}" if args.cer else ""))
+    print("-" * (len(header) + (10 if args.cer else 0)))
+    for r in results:
+        line = (
+            f"{r['name'][:30]:<30} | {r['wer']:>7.2%} | {r['substitutions']:>5} | "
+            f"{r['deletions']:>5} | {r['insertions']:>5} | {r['length']:>6}"
+        )
+        print(line + (f" | {r['cer']:>7.2%}" if args.cer else ""))
+
+    # Corpus WER: total errors over total reference words, not a mean of rates ⚖️
+    words = sum(r["length"] for r in results)
+    aggregate = sum(r["errors"] for r in results) / words if words else 0.0
+    summary = {"wer": aggregate, "words": words, "seconds": elapsed}
+    if args.cer:
+        chars = sum(r["chars"] for r in results)
+        summary["cer"] = (
+            sum(r["char_errors"] for r in results) / chars if chars else 0.0
+        )
+    audio = sum(r["audio_seconds"] for r in results)
+
+    print("-" * (len(header) + (10 if args.cer else 0)))
+    print(
+        f"TOTAL ({len(results)} files): WER {aggregate:.2%}"
+        + (f", CER {summary['cer']:.2%}" if args.cer else "")
+        + f" | {words / elapsed:,.0f} words/s"
+        + (f", {audio / elapsed:,.0f}x real time" if audio else "")
+    )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({**summary, "files": results}, f, indent=2)
+
+    if args.max_wer is not None and aggregate > args.max_wer:
+        print(f"❌ WER {aggregate:.2%} exceeds --max-wer {args.max_wer:.2%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
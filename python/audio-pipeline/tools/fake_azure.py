@@ -0,0 +1,380 @@
+"""
+Local stand-ins for Azure AI Speech Fast Transcription and Azure AI Foundry
+chat completions, for load tests that must not burn quota. 🎭☁️
+Responses follow the shapes AzureFastTranscriber and the inference mappers
+parse; latency, throttling (429 + Retry-After) and malformed replies are
+injected at configurable rates.
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+
+TRANSCRIBE_PATH = "/speechtotext/transcriptions:transcribe"
+CHAT_PATH = "/chat/completions"
+MALFORMED_KINDS = ("not-json", "truncated", "missing-item")
+# 16 kHz mono int16: how long the uploaded audio roughly is
+BYTES_PER_SECOND = 32000
+WORDS = "ja also das ist eine sehr gute frage und wir haben darüber lange gesprochen".split()
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """
+    Latency distribution from 'kind:params' (seconds). 🎲
+    fixed:0.2 | uniform:0.1,0.5 | normal:0.3,0.05 | lognormal:0.3,0.5
+    (median, sigma) | exponential:0.3 (mean)
+    """
+    kind, _, params = spec.partition(":")
+    values = [float(v) for v in params.split(",") if v]
+    samplers = {
+        "fixed": lambda rng: values[0],
+        "uniform": lambda rng: rng.uniform(values[0], values[1]),
+        "normal": lambda rng: rng.gauss(values[0], values[1]),
+        "lognormal": lambda rng: rng.lognormvariate(math.log(values[0]), values[1]),
+        "exponential": lambda rng: rng.expovariate(1 / values[0]),
+    }
+    if kind not in samplers:
+        raise ValueError(
+            f"❌ Unknown latency distribution '{kind}'! Use one of: {', '.join(samplers)}"
+        )
+    sampler = samplers[kind]
+    sampler(random.Random(0))  # Fail now on missing parameters, not mid-test
+    return lambda rng: max(0.0, sampler(rng))
+
+
+@dataclass
+class FaultConfig:
+    latency: str = "fixed:0"
+    throttle_rate: float = 0.0
+    retry_after: float = 1.0
+    malformed_rate: float = 0.0
+    seed: Optional[int] = None
+
+
+@dataclass
+class ServerStats:
+    requests: int = 0
+    throttled: int = 0
+    malformed: int = 0
+    by_path: Dict[str, int] = field(default_factory=dict)
+
+
+class FakeAzureServer:
+    """
+    One threaded HTTP server answering both the Speech and the Foundry API. 🎭
+    Use as a context manager (serves on a background thread) or run this
+    module as a script.
+    """
+
+    def __init__(
+        self,
+        config: Optional[FaultConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.config = config or FaultConfig()
+        self.sample_latency = parse_latency(self.config.latency)
+        self.stats = ServerStats()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), _handler_for(self))
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def speech_endpoint(self) -> str:
+        return f"{self.url}{TRANSCRIBE_PATH}?api-version=2025-10-15"
+
+    @property
+    def inference_endpoint(self) -> str:
+        return f"{self.url}/openai/deployments/fake-gpt{CHAT_PATH}?api-version=2024-05-01-preview"
+
+    def start(self) -> "FakeAzureServer":
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def decide(self, path: str) -> Dict[str, Any]:
+        """Draws this request's latency and fault, all from one seeded RNG. 🎲"""
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.by_path[path] = self.stats.by_path.get(path, 0) + 1
+            plan = {"latency": self.sample_latency(self._rng), "fault": None}
+            if self._rng.random() < self.config.throttle_rate:
+                plan["fault"] = "throttle"
+                self.stats.throttled += 1
+            elif self._rng.random() < self.config.malformed_rate:
+                plan["fault"] = self._rng.choice(MALFORMED_KINDS)
+                self.stats.malformed += 1
+            return plan
+
+
+def _handler_for(server: FakeAzureServer):
+    class FakeAzureHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep-alive, like the real services
+        # Headers and body go out in separate writes: without this, Nagle +
+        # delayed ACK add ~40 ms to every reply and skew the latencies
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            if self.path == "/stats":
+                with server._lock:
+                    self._reply(200, vars(server.stats))
+            else:
+                self._reply(404, {"error": "not found"})
+
+        def do_POST(self):
+            body = self._read_body()
+            path = self.path.split("?", 1)[0]
+            if path.endswith(TRANSCRIBE_PATH):
+                build = transcription_response
+            elif path.endswith(CHAT_PATH):
+                build = chat_response
+            else:
+                self._reply(
+                    404, {"error": {"code": "404", "message": "Resource not found"}}
+                )
+                return
+
+            plan = server.decide(path)
+            time.sleep(plan["latency"])
+            if plan["fault"] == "throttle":
+                retry_after = server.config.retry_after
+                self._reply(
+                    429,
+                    {"error": {"code": "429", "message": "Rate limit is exceeded."}},
+                    {
+                        "Retry-After": str(math.ceil(retry_after)),
+                        "retry-after-ms": str(int(retry_after * 1000)),
+                    },
+                )
+                return
+            if plan["fault"] == "not-json":
+                self._send(200, b"<html>502 Bad Gateway</html>", "text/html")
+                return
+            try:
+                payload = build(body, plan["fault"])
+            except (ValueError, KeyError) as e:
+                self._reply(400, {"error": {"code": "BadRequest", "message": str(e)}})
+                return
+            self._reply(200, payload)
+
+        def _read_body(self) -> bytes:
+            if self.headers.get("Transfer-Encoding", "").lower() != "chunked":
+                return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                chunk = self.rfile.read(size)
+                self.rfile.readline()  # CRLF after every chunk
+                if size == 0:
+                    return b"".join(chunks)
+                chunks.append(chunk)
+
+        def _reply(
+            self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None
+        ):
+            self._send(
+                status, json.dumps(payload).encode("utf-8"), "application/json", headers
+            )
+
+        def _send(self, status, body: bytes, content_type: str, headers=None):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # Keep load-test output clean 🤫
+
+    return FakeAzureHandler
+
+
+def transcription_response(body: bytes, fault: Optional[str]) -> Dict[str, Any]:
+    """Fast Transcription JSON: ~4s phrases, two alternating speakers, word timings. 🎤"""
+    if b'name="definition"' not in body:
+        raise ValueError("multipart field 'definition' is required")
+    duration_ms = max(1000, len(body) * 1000 // BYTES_PER_SECOND)
+    phrases = []
+    for i, offset in enumerate(range(0, duration_ms - 500, 4000)):
+        length = min(3500, duration_ms - offset)
+        words = [WORDS[(i + j) % len(WORDS)] for j in range(8)]
+        step = length // len(words)
+        phrases.append(
+            {
+                "speaker": i % 2 + 1,
+                "offsetMilliseconds": offset,
+                "durationMilliseconds": length,
+                "text": " ".join(words).capitalize() + ".",
+                "confidence": 0.9,
+                "words": [
+                    {
+                        "text": word,
+                        "offsetMilliseconds": offset + j * step,
+                        "durationMilliseconds": step,
+                        "confidence": 0.9,
+                    }
+                    for j, word in enumerate(words)
+                ],
+            }
+        )
+    if fault == "missing-item":
+        phrases = phrases[:-1]
+    if fault == "truncated":
+        # A phrase cut off before its 'words' - breaks naive parsers
+        phrases = [{"text": p["text"]} for p in phrases[:1]]
+    return {
+        "durationMilliseconds": duration_ms,
+        "combinedPhrases": [{"text": " ".join(p["text"] for p in phrases)}],
+        "phrases": phrases,
+    }
+
+
+def chat_response(body: bytes, fault: Optional[str]) -> Dict[str, Any]:
+    """A chat completion whose content follows the requested json_schema. 💬"""
+    request = json.loads(body)
+    schema = request["response_format"]["json_schema"]["name"]
+    user = json.loads(request["messages"][-1]["content"])
+
+    if schema == "translation_response":
+        target = re.search(r"into (\S+?)\.", request["messages"][0]["content"])
+        tag = target.group(1) if target else "xx"
+        items = [
+            {"id": item["id"], "text": f"[{tag}] {item['text']}"}
+            for item in user["items_to_translate"]
+        ]
+        content: Dict[str, Any] = {"translations": items}
+    elif schema == "annotation_response":
+        items = [
+            {"id": item["id"], "note": _note(item["text"])}
+            for item in user["items_to_annotate"]
+        ]
+        content = {"annotations": items}
+    else:
+        raise ValueError(f"unsupported response schema '{schema}'")
+
+    if fault == "missing-item":
+        key = next(iter(content))
+        content[key] = content[key][:-1]
+    text = json.dumps(content, ensure_ascii=False)
+    if fault == "truncated":
+        text = text[: len(text) // 2]
+    return {
+        "id": f"chatcmpl-{random.getrandbits(32):08x}",
+        "object": "chat.completion",
+        "model": request.get("model", "model"),
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "length" if fault == "truncated" else "stop",
+                "message": {"role": "assistant", "content": text},
+            }
+        ],
+        "usage": {
+            "prompt_tokens": len(body) // 4,
+            "completion_tokens": len(text) // 4,
+            "total_tokens": (len(body) + len(text)) // 4,
+        },
+    }
+
+
+def _note(text: str) -> str:
+    words = text.lower().split()
+    repeated = [a for a, b in zip(words, words[1:]) if a == b]
+    return (
+        f"Repetition: '{repeated[0]} {repeated[0]}' is a speech artifact."
+        if repeated
+        else "OK"
+    )
+
+
+def add_fault_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--latency",
+        default="fixed:0",
+        help="Per-request latency distribution, e.g. lognormal:0.8,0.5 (median s, sigma) ⏱️",
+    )
+    parser.add_argument(
+        "--throttle-rate",
+        type=float,
+        default=0.0,
+        help="Share of requests answered 429",
+    )
+    parser.add_argument(
+        "--retry-after",
+        type=float,
+        default=1.0,
+        help="Seconds sent in Retry-After with a 429",
+    )
+    parser.add_argument(
+        "--malformed-rate",
+        type=float,
+        default=0.0,
+        help=f"Share of replies that are broken ({', '.join(MALFORMED_KINDS)})",
+    )
+    parser.add_argument(
+        "--seed", type=int, help="Seed for reproducible faults and latencies"
+    )
+
+
+def fault_config(args) -> FaultConfig:
+    return FaultConfig(
+        latency=args.latency,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        malformed_rate=args.malformed_rate,
+        seed=args.seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Fake Azure Speech + Foundry endpoints for offline load tests. 🎭☁️"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    server = FakeAzureServer(fault_config(args), host=args.host, port=args.port)
+    print("🎭 Fake Azure is up. Point the pipeline at it with:")
+    print("export AZURE_SPEECH_KEY=fake AZURE_AI_INFERENCE_KEY=fake")
+    print(f"export AZURE_SPEECH_ENDPOINT='{server.speech_endpoint}'")
+    print(f"export AZURE_AI_INFERENCE_ENDPOINT='{server.inference_endpoint}'")
+    print(f"Counters: GET {server.url}/stats")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
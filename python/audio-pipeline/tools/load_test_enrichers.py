@@ -0,0 +1,211 @@
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Dict, List
+
+import httpx
+import numpy as np
+
+# Robust pathing relative to this script! 🗺️💎
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from src.application.enrichers.annotation import (  # noqa: E402
+    UNAVAILABLE_NOTE,
+    LinguisticAnnotationEnricher,
+)
+from src.application.enrichers.translation import TranslationEnricher  # noqa: E402
+from src.domain.value_objects import (  # noqa: E402
+    ConfidenceScore,
+    LanguageTag,
+    TimestampRange,
+    Utterance,
+)
+from src.infrastructure.azure_inference_annotation import (  # noqa: E402
+    AzureInferenceAnnotationService,
+)
+from src.infrastructure.azure_inference_translation import (  # noqa: E402
+    AzureInferenceTranslator,
+)
+from tools.fake_azure import (  # noqa: E402
+    FakeAzureServer,
+    add_fault_arguments,
+    fault_config,
+)
+
+SENTENCES = [
+    "Ich vertritt eine andere Haltung",
+    "der der Bundes-CDU",
+    "Wir arbeiten in Thüringen sehr konstruktiv zusammen.",
+    "Das ist eine sehr gute Frage.",
+]
+
+
+class TimedCalls:
+    """Wraps a translator/annotation service and times every call (retries included). ⏱️"""
+
+    def __init__(self, inner, method: str):
+        self.inner = inner
+        self.method = method
+        self.latencies: List[float] = []
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        call = getattr(self.inner, name)
+        if name != self.method:
+            return call
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return call(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.latencies.append(time.perf_counter() - start)
+
+        return timed
+
+
+def synthetic_transcript(n: int) -> List[Utterance]:
+    return [
+        Utterance(
+            timestamp=TimestampRange(
+                start=timedelta(seconds=4 * i), end=timedelta(seconds=4 * i + 3.5)
+            ),
+            text=SENTENCES[i % len(SENTENCES)],
+            speaker_id=str(i % 2 + 1),
+            confidence=ConfidenceScore(0.9),
+        )
+        for i in range(n)
+    ]
+
+
+def build_enricher(kind: str, endpoint: str, args):
+    options = dict(
+        endpoint=endpoint,
+        api_key="fake",
+        max_retries=args.max_retries,
+        retry_base_delay=args.retry_base_delay,
+    )
+    if kind == "translation":
+        service = TimedCalls(AzureInferenceTranslator(**options), "translate")
+        enricher = TranslationEnricher(
+            service, LanguageTag("en"), batch_size=args.batch, context_size=args.context
+        )
+        failed = lambda u: not u.translated_text  # noqa: E731
+    else:
+        service = TimedCalls(AzureInferenceAnnotationService(**options), "annotate")
+        enricher = LinguisticAnnotationEnricher(
+            service, batch_size=args.batch, context_size=args.context
+        )
+        failed = lambda u: u.learner_notes == UNAVAILABLE_NOTE  # noqa: E731
+    return enricher, service, failed
+
+
+def run_load(kind: str, endpoint: str, args) -> Dict[str, Any]:
+    """'jobs' transcripts enriched concurrently, as parallel pipeline runs would. 🏋️"""
+    enricher, service, failed = build_enricher(kind, endpoint, args)
+    transcripts = [synthetic_transcript(args.utterances) for _ in range(args.jobs)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        results = list(
+            pool.map(lambda t: enricher.enrich(t, LanguageTag("de")), transcripts)
+        )
+    elapsed = time.perf_counter() - start
+
+    latencies = np.array(service.latencies)
+    utterances = sum(len(r) for r in results)
+    p50, p95, p99 = (
+        np.percentile(latencies, [50, 95, 99]) if len(latencies) else (0, 0, 0)
+    )
+    return {
+        "enricher": kind,
+        "calls": len(latencies),
+        "utterances": utterances,
+        "failed_utterances": sum(failed(u) for r in results for u in r),
+        "seconds": elapsed,
+        "calls_per_second": len(latencies) / elapsed,
+        "utterances_per_second": utterances / elapsed,
+        "p50": float(p50),
+        "p95": float(p95),
+        "p99": float(p99),
+        "max": float(latencies.max()) if len(latencies) else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Throughput and tail latency of the Azure enrichers against a fake (or given) endpoint. 🏋️📊"
+    )
+    parser.add_argument(
+        "--endpoint",
+        help="Chat-completions URL to hit (default: start tools/fake_azure.py in-process)",
+    )
+    parser.add_argument(
+        "--enricher", choices=["translation", "annotation", "both"], default="both"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=8, help="Transcripts enriched concurrently"
+    )
+    parser.add_argument(
+        "--utterances", type=int, default=100, help="Utterances per transcript"
+    )
+    parser.add_argument("--batch", type=int, default=1, help="Utterances per request")
+    parser.add_argument("--context", type=int, default=10, help="Context window size")
+    parser.add_argument("--max-retries", type=int, default=3)
+    parser.add_argument(
+        "--retry-base-delay",
+        type=float,
+        default=1.0,
+        help="Backoff when no Retry-After is sent (production: 65s)",
+    )
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    server = None
+    endpoint = args.endpoint
+    if not endpoint:
+        server = FakeAzureServer(fault_config(args)).start()
+        endpoint = server.inference_endpoint
+
+    kinds = (
+        ["translation", "annotation"] if args.enricher == "both" else [args.enricher]
+    )
+    try:
+        results = [run_load(kind, endpoint, args) for kind in kinds]
+        stats = httpx.get(f"{server.url}/stats").json() if server else None
+    finally:
+        if server:
+            server.stop()
+
+    print(
+        f"{'Enricher':<12} | {'Calls':>6} | {'Calls/s':>8} | {'Utt/s':>8} | "
+        f"{'p50':>7} | {'p95':>7} | {'p99':>7} | {'Failed':>6}"
+    )
+    print("-" * 84)
+    for r in results:
+        print(
+            f"{r['enricher']:<12} | {r['calls']:>6} | {r['calls_per_second']:>8.1f} | "
+            f"{r['utterances_per_second']:>8.1f} | {r['p50']:>6.3f}s | {r['p95']:>6.3f}s | "
+            f"{r['p99']:>6.3f}s | {r['failed_utterances']:>6}"
+        )
+    if stats:
+        print(
+            f"🎭 Server: {stats['requests']} requests, {stats['throttled']} throttled (429), "
+            f"{stats['malformed']} malformed"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"results": results, "server": stats}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
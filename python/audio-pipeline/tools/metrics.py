@@ -0,0 +1,258 @@
+"""
+Evaluation metrics shared by the benchmark and evaluation tools. 📏🎯
+Segments are plain (start_seconds, end_seconds, label) tuples, so references
+can come from RTTM files, transcript.json or another diarizer run alike.
+"""
+
+import itertools
+import json
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+Segment = Tuple[float, float, str]
+
+# Everything but letters, digits, whitespace and apostrophes (umlauts stay) ✂️
+PUNCTUATION = re.compile(r"[^\w\s']|_")
+
+# Beyond this many speakers, optimal mapping by brute force gets too slow 🐢
+MAX_EXACT_SPEAKERS = 8
+
+
+def load_rttm(path: str) -> Dict[str, List[Segment]]:
+    """Reads an RTTM file into {file_id: [(start, end, speaker), ...]}. 📄"""
+    segments: Dict[str, List[Segment]] = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) < 8 or fields[0] != "SPEAKER":
+                continue
+            start, duration = float(fields[3]), float(fields[4])
+            segments.setdefault(fields[1], []).append(
+                (start, start + duration, fields[7])
+            )
+    return segments
+
+
+def load_transcript_segments(path: str) -> List[Segment]:
+    """Speaker turns from a pipeline transcript.json, without building entities. 📄"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return [
+        (u["start"], u["end"], u.get("speaker", "Unknown"))
+        for u in data.get("utterances", [])
+    ]
+
+
+def load_segments(path: str, file_id: Optional[str] = None) -> List[Segment]:
+    """
+    RTTM or transcript.json, by extension. 📂
+    An RTTM holding several recordings is never merged into one timeline:
+    pick one with 'file_id' (missing means no speech), or get a ValueError.
+    """
+    if not path.lower().endswith(".rttm"):
+        return load_transcript_segments(path)
+
+    recordings = load_rttm(path)
+    if file_id is not None:
+        return recordings.get(file_id, [])
+    if len(recordings) > 1:
+        raise ValueError(
+            f"{path} holds {len(recordings)} recordings ({', '.join(sorted(recordings))}); "
+            "score them one file id at a time"
+        )
+    return next(iter(recordings.values()), [])
+
+
+def _activity(
+    segments: Sequence[Segment], labels: List[str], n_frames: int, frame: float
+) -> np.ndarray:
+    """(n_frames, n_labels) boolean speaker activity, built without a Python frame loop. 🎚️"""
+    counts = np.zeros((n_frames + 1, len(labels)), dtype=np.int32)
+    if segments:
+        column = {label: i for i, label in enumerate(labels)}
+        starts = np.array([s for s, _, _ in segments]) / frame
+        ends = np.array([e for _, e, _ in segments]) / frame
+        cols = np.array([column[label] for _, _, label in segments])
+        # +1 where a turn starts, -1 where it ends; the running sum is activity
+        np.add.at(counts, (np.rint(starts).astype(int), cols), 1)
+        np.add.at(counts, (np.rint(ends).astype(int), cols), -1)
+    return np.cumsum(counts, axis=0)[:n_frames] > 0
+
+
+def _best_mapping(confusion: np.ndarray) -> List[Tuple[int, int]]:
+    """One-to-one (ref, hyp) pairs with the most co-active frames. 🤝"""
+    n_ref, n_hyp = confusion.shape
+    if min(n_ref, n_hyp) == 0:
+        return []
+    if max(n_ref, n_hyp) > MAX_EXACT_SPEAKERS:
+        # Greedy fallback: repeatedly take the largest remaining overlap
+        remaining = confusion.astype(float).copy()
+        pairs = []
+        for _ in range(min(n_ref, n_hyp)):
+            r, h = np.unravel_index(np.argmax(remaining), remaining.shape)
+            pairs.append((int(r), int(h)))
+            remaining[r, :] = -1
+            remaining[:, h] = -1
+        return pairs
+    if n_ref <= n_hyp:
+        candidates = (
+            list(zip(range(n_ref), cols))
+            for cols in itertools.permutations(range(n_hyp), n_ref)
+        )
+    else:
+        candidates = (
+            list(zip(rows, range(n_hyp)))
+            for rows in itertools.permutations(range(n_ref), n_hyp)
+        )
+    return max(candidates, key=lambda pairs: sum(confusion[r, h] for r, h in pairs))
+
+
+def _rate(errors: float, total: float) -> float:
+    if total:
+        return errors / total
+    return float("inf") if errors else 0.0
+
+
+def diarization_error_rate(
+    reference: Sequence[Segment],
+    hypothesis: Sequence[Segment],
+    frame: float = 0.01,
+    collar: float = 0.0,
+) -> Dict[str, Any]:
+    """
+    Frame-level DER with the optimal one-to-one speaker mapping. 🎯
+    Returns the rate plus its components (in seconds): missed speech, false
+    alarm and speaker confusion, over 'total' seconds of reference speech,
+    along with the speaker mapping used and the per-speaker confusion.
+    Overlapping speech counts once per speaker, as in NIST md-eval, and
+    frames within 'collar' seconds of a reference boundary are not scored.
+    Without reference speech any false alarm makes the rate infinite; only
+    silence against silence scores 0.
+    """
+    end = max([e for _, e, _ in reference] + [e for _, e, _ in hypothesis] + [0.0])
+    n_frames = int(round(end / frame)) + 1
+    ref_labels = sorted({label for _, _, label in reference})
+    hyp_labels = sorted({label for _, _, label in hypothesis})
+    ref = _activity(reference, ref_labels, n_frames, frame)
+    hyp = _activity(hypothesis, hyp_labels, n_frames, frame)
+    if collar > 0:
+        # Forgive boundary jitter: drop frames around every reference edge ✂️
+        edges = np.array([t for s, e, _ in reference for t in (s, e)]) / frame
+        unscored = np.zeros(n_frames + 1, dtype=np.int32)
+        width = collar / frame
+        np.add.at(unscored, np.clip(np.rint(edges - width), 0, n_frames).astype(int), 1)
+        np.add.at(
+            unscored, np.clip(np.rint(edges + width), 0, n_frames).astype(int), -1
+        )
+        scored = np.cumsum(unscored)[:n_frames] == 0
+        ref, hyp = ref[scored], hyp[scored]
+
+    n_ref = ref.sum(axis=1)
+    n_hyp = hyp.sum(axis=1)
+    confusion = ref.T.astype(np.int64) @ hyp.astype(np.int64)
+    pairs = _best_mapping(confusion)
+    correct = sum(confusion[r, h] for r, h in pairs)
+
+    total = n_ref.sum() * frame
+    missed = np.maximum(n_ref - n_hyp, 0).sum() * frame
+    false_alarm = np.maximum(n_hyp - n_ref, 0).sum() * frame
+    confused = np.minimum(n_ref, n_hyp).sum() * frame - correct * frame
+    errors = missed + false_alarm + confused
+    return {
+        "der": _rate(errors, total),
+        "missed": missed,
+        "false_alarm": false_alarm,
+        "confusion": confused,
+        "total": total,
+        "mapping": {ref_labels[r]: hyp_labels[h] for r, h in pairs},
+        # Speaker-attributed confusion: seconds each reference speaker spent
+        # under each hypothesis label 🔀
+        "speakers": {
+            ref_label: {
+                hyp_label: float(confusion[r, h] * frame)
+                for h, hyp_label in enumerate(hyp_labels)
+                if confusion[r, h]
+            }
+            for r, ref_label in enumerate(ref_labels)
+        },
+    }
+
+
+def normalize_words(text: str) -> List[str]:
+    """Lowercased words without punctuation - what WER should compare. 🔡"""
+    return PUNCTUATION.sub(" ", text.lower()).split()
+
+
+def load_transcript_text(path: str) -> str:
+    """Plain text from a .txt reference or a pipeline transcript.json. 📄"""
+    with open(path, "r", encoding="utf-8") as f:
+        if not path.lower().endswith(".json"):
+            return f.read()
+        data = json.load(f)
+    return " ".join(u.get("text", "") for u in data.get("utterances", []))
+
+
+def edit_operations(reference: Sequence, hypothesis: Sequence) -> Dict[str, int]:
+    """
+    Levenshtein alignment counts (substitutions, deletions, insertions). 🧮
+    One NumPy pass per reference token: matches/substitutions and deletions
+    are elementwise over the whole row, and the left-to-right insertion chain
+    is solved with a running minimum instead of a Python loop. Memory is
+    O(len(hypothesis)); ties prefer the path with fewer insertions.
+    """
+    vocabulary: Dict[Any, int] = {}
+    ref = np.array([vocabulary.setdefault(t, len(vocabulary)) for t in reference])
+    hyp = np.array([vocabulary.setdefault(t, len(vocabulary)) for t in hypothesis])
+    m = len(hyp)
+    positions = np.arange(m + 1)
+
+    # Row 0: only insertions
+    dist = positions.copy()
+    ins = positions.copy()
+    dels = np.zeros(m + 1, dtype=np.int64)
+    for token in ref:
+        cost = (hyp != token).astype(np.int64)
+        # Candidates without a same-row insertion: deletion vs. diagonal
+        diagonal = dist[:-1] + cost
+        deletion = dist[1:] + 1
+        take_diag = diagonal <= deletion
+        cand = np.empty(m + 1, dtype=np.int64)
+        cand[0] = dist[0] + 1
+        cand[1:] = np.where(take_diag, diagonal, deletion)
+        cand_ins = np.empty_like(cand)
+        cand_ins[0] = ins[0]
+        cand_ins[1:] = np.where(take_diag, ins[:-1], ins[1:])
+        cand_del = np.empty_like(cand)
+        cand_del[0] = dels[0] + 1
+        cand_del[1:] = np.where(take_diag, dels[:-1], dels[1:] + 1)
+
+        # row[j] = min over k <= j of cand[k] + (j - k): a running minimum 🏃
+        shifted = cand - positions
+        best = np.minimum.accumulate(shifted)
+        source = np.maximum.accumulate(np.where(shifted == best, positions, 0))
+        dist = best + positions
+        ins = cand_ins[source] + (positions - source)
+        dels = cand_del[source]
+
+    errors, insertions, deletions = int(dist[-1]), int(ins[-1]), int(dels[-1])
+    return {
+        "substitutions": errors - insertions - deletions,
+        "deletions": deletions,
+        "insertions": insertions,
+        "errors": errors,
+        "length": len(ref),
+    }
+
+
+def word_error_rate(reference: str, hypothesis: str) -> Dict[str, Any]:
+    ops = edit_operations(normalize_words(reference), normalize_words(hypothesis))
+    return {"wer": ops["errors"] / ops["length"] if ops["length"] else 0.0, **ops}
+
+
+def character_error_rate(reference: str, hypothesis: str) -> Dict[str, Any]:
+    ops = edit_operations(
+        " ".join(normalize_words(reference)), " ".join(normalize_words(hypothesis))
+    )
+    return {"cer": ops["errors"] / ops["length"] if ops["length"] else 0.0, **ops}
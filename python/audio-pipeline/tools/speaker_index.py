@@ -0,0 +1,66 @@
+import argparse
+import os
+import sys
+
+import numpy as np
+
+# Robust pathing relative to this script! 🗺️💎
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from src.infrastructure.speaker_index import NumpySpeakerIndex  # noqa: E402
+
+
+def enroll(index: NumpySpeakerIndex, name: str, clips):
+    """Adds the dominant voice of each clip as a voiceprint for 'name'. 🎙️"""
+    from src.infrastructure.audio import FFmpegAudioProcessor
+    from src.infrastructure.diarization import PyannoteDiarizer
+
+    diarizer = PyannoteDiarizer()
+    processor = FFmpegAudioProcessor()
+    for clip in clips:
+        audio = processor.normalize(clip)
+        output = diarizer.pipeline(audio.file_path)
+        diarization = output.speaker_diarization
+        labels = list(diarization.labels())
+        if not labels:
+            print(f"⚠️ {clip}: no speech found, skipped")
+            continue
+        # The clip should be mostly 'name'; take whoever talks the longest 🗣️
+        durations = [diarization.label_duration(label) for label in labels]
+        embedding = output.speaker_embeddings[int(np.argmax(durations))]
+        index.enroll(name, embedding)
+        print(f"✅ {clip}: enrolled {max(durations):.0f}s of speech as '{name}'")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Manages the known-speaker index used by --speaker-index. 🗂️🎙️"
+    )
+    parser.add_argument("index", help="Path to the .npz index (created if missing)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    enroll_parser = commands.add_parser("enroll", help="Add voiceprints for a speaker")
+    enroll_parser.add_argument("name")
+    enroll_parser.add_argument(
+        "clips", nargs="+", help="Audio clips of mostly this speaker"
+    )
+    remove_parser = commands.add_parser("remove", help="Forget a speaker")
+    remove_parser.add_argument("name")
+    commands.add_parser("list", help="Show enrolled speakers")
+    args = parser.parse_args()
+
+    index = NumpySpeakerIndex(args.index)
+    if args.command == "enroll":
+        enroll(index, args.name, args.clips)
+        index.save()
+    elif args.command == "remove":
+        print(f"🗑️ Removed {index.remove(args.name)} voiceprints of '{args.name}'")
+        index.save()
+    else:
+        names, counts = np.unique(index.names, return_counts=True)
+        for name, count in zip(names, counts):
+            print(f"{name}: {count} voiceprint(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+import os
+import random
+import sys
+from datetime import timedelta
+from typing import List, Optional
+
+# Robust pathing relative to this script! 🗺️💎
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from src.domain.value_objects import (  # noqa: E402
+    Utterance,
+    Word,
+    TimestampRange,
+    ConfidenceScore,
+)
+
+# A small German vocabulary so token texts repeat like real speech does. 🇩🇪
+VOCABULARY = [
+    "und",
+    "die",
+    "der",
+    "das",
+    "ich",
+    "nicht",
+    "ist",
+    "ein",
+    "zu",
+    "wir",
+    "Grammatik",
+    "heute",
+    "sprechen",
+    "Beispiel",
+    "vielleicht",
+    "natürlich",
+    "Gastgeber",
+    "Reise",
+    "deutsche",
+    "kleine",
+    "willkommen",
+    "genau",
+]
+SUFFIXES = ["en", "er", "lich", "ung", "chen"]
+
+
+def synthetic_utterances(
+    hours: float = 1.0,
+    speakers: int = 2,
+    tokens_per_segment: int = 30,
+    token_ms: int = 300,
+    sentence_every: int = 12,
+    subword_rate: float = 0.2,
+    seed: int = 0,
+) -> List[Utterance]:
+    """
+    Generates Whisper-style raw token utterances covering 'hours' of audio. 🏭🎤
+    Tokens carry leading spaces, a share of them are sub-word continuations,
+    and every 'sentence_every' tokens ends with terminal punctuation.
+    """
+    rng = random.Random(seed)
+    total_ms = int(hours * 3600 * 1000)
+    utterances = []
+    cursor_ms = 0
+    token_index = 0
+
+    while cursor_ms < total_ms:
+        words = []
+        for _ in range(tokens_per_segment):
+            if words and rng.random() < subword_rate:
+                text = rng.choice(SUFFIXES)
+            else:
+                text = " " + rng.choice(VOCABULARY)
+            token_index += 1
+            if token_index % sentence_every == 0:
+                text += rng.choice([".", ".", "?", "!"])
+
+            start = cursor_ms
+            cursor_ms += token_ms
+            words.append(
+                Word(
+                    text=text,
+                    timestamp=TimestampRange(
+                        timedelta(milliseconds=start), timedelta(milliseconds=cursor_ms)
+                    ),
+                    confidence=ConfidenceScore(round(rng.uniform(0.5, 1.0), 6)),
+                )
+            )
+
+        utterances.append(
+            Utterance(
+                timestamp=TimestampRange(
+                    words[0].timestamp.start, words[-1].timestamp.end
+                ),
+                text="".join(w.text for w in words).strip(),
+                speaker_id=f"SPEAKER_{len(utterances) % speakers:02d}",
+                confidence=ConfidenceScore(1.0),
+                words=words,
+            )
+        )
+        cursor_ms += rng.randint(0, 800)  # A breath between segments 🌬️
+
+    return utterances
+
+
+def synthetic_turns(
+    hours: float = 1.0,
+    speakers: int = 2,
+    turns: Optional[int] = None,
+    seed: int = 0,
+) -> List[Utterance]:
+    """
+    Diarization-style speaker turns covering 'hours' of audio. 🗣️🏭
+    'turns' (default: one every ~8 s) are spread with random lengths; every
+    turn goes to a different speaker than the one before, with short gaps
+    and the occasional overlap between neighbours.
+    """
+    rng = random.Random(seed)
+    total_ms = int(hours * 3600 * 1000)
+    turns = turns or max(1, total_ms // 8000)
+    weights = [rng.expovariate(1.0) for _ in range(turns)]
+    scale = total_ms / sum(weights)
+
+    utterances = []
+    cursor_ms = 0.0
+    speaker = 0
+    for weight in weights:
+        length = weight * scale
+        start = max(0, int(cursor_ms + rng.randint(-300, 300)))
+        end = max(start + 1, int(cursor_ms + length))
+        utterances.append(
+            Utterance(
+                timestamp=TimestampRange(
+                    timedelta(milliseconds=start), timedelta(milliseconds=end)
+                ),
+                text="",
+                speaker_id=f"SPEAKER_{speaker:02d}",
+                confidence=ConfidenceScore(1.0),
+            )
+        )
+        cursor_ms += length
+        if speakers > 1:
+            speaker = (speaker + rng.randint(1, speakers - 1)) % speakers
+    return utterances